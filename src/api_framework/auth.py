@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import Any
 
 import httpx
 
 from .config import Settings
+from .jsoncodec import get_codec
 
 
 @dataclass
@@ -13,18 +15,17 @@ class TokenResult:
     token: str
 
 
-class AuthClient:
+class _AuthStrategy:
     """
-    Token auth helper.
+    Shared token strategy for the sync and async auth helpers.
 
     Strategy (CONSISTENCY-FIRST):
     - If username/password exist -> login and cache token in memory (preferred; avoids expired static tokens)
     - Else if AUTH_HEADER_VALUE exists -> use it (fallback path)
     """
 
-    def __init__(self, settings: Settings, http: httpx.Client):
+    def __init__(self, settings: Settings):
         self.settings = settings
-        self.http = http
         self._token: str | None = None
 
     def _normalize_token_value(self, v: str) -> str | None:
@@ -36,30 +37,73 @@ class AuthClient:
             return v.split(" ", 1)[1].strip()
         return v
 
+    def _has_login_creds(self) -> bool:
+        return bool(self.settings.auth_username and self.settings.auth_password)
+
+    def _login_payload(self) -> dict[str, Any]:
+        return {
+            "username": self.settings.auth_username,
+            "password": self.settings.auth_password,
+            # optionally: "expiresInMins": 60,
+        }
+
+    def _token_from_login(self, resp: httpx.Response) -> str:
+        resp.raise_for_status()
+        data: dict[str, Any] = get_codec(self.settings.json_codec).loads(resp.content)
+        token = data.get("accessToken") or data.get("token")
+        if not token:
+            raise RuntimeError("Login succeeded but token not found in response")
+        self._token = token
+        return token
+
+    def _fallback_token(self) -> str | None:
+        # Fallback: token provided directly in config/env file (fast CI/local path)
+        if self.settings.auth_header_value:
+            return self._normalize_token_value(self.settings.auth_header_value)
+        return None
+
+
+class AuthClient(_AuthStrategy):
+    """
+    Token auth helper for the sync ApiClient.
+    """
+
+    def __init__(self, settings: Settings, http: httpx.Client):
+        super().__init__(settings)
+        self.http = http
+
     def get_token(self) -> str | None:
         # Prefer minting a fresh token when creds exist (prevents "Token Expired!" flakes)
         if self._token:
             return self._token
 
-        if self.settings.auth_username and self.settings.auth_password:
-            resp = self.http.post(
-                "/auth/login",
-                json={
-                    "username": self.settings.auth_username,
-                    "password": self.settings.auth_password,
-                    # optionally: "expiresInMins": 60,
-                },
-            )
-            resp.raise_for_status()
-            data: dict[str, Any] = resp.json()
-            token = data.get("accessToken") or data.get("token")
-            if not token:
-                raise RuntimeError("Login succeeded but token not found in response")
-            self._token = token
-            return token
+        if self._has_login_creds():
+            resp = self.http.post("/auth/login", json=self._login_payload())
+            return self._token_from_login(resp)
 
-        # Fallback: token provided directly in config/env file (fast CI/local path)
-        if self.settings.auth_header_value:
-            return self._normalize_token_value(self.settings.auth_header_value)
+        return self._fallback_token()
 
-        return None
+
+class AsyncAuthClient(_AuthStrategy):
+    """
+    Token auth helper for the AsyncApiClient (same strategy, awaitable login).
+    """
+
+    def __init__(self, settings: Settings, http: httpx.AsyncClient):
+        super().__init__(settings)
+        self.http = http
+        # Concurrent first calls must share one login, not fire one each.
+        self._login_lock = asyncio.Lock()
+
+    async def get_token(self) -> str | None:
+        if self._token:
+            return self._token
+
+        if self._has_login_creds():
+            async with self._login_lock:
+                if self._token:
+                    return self._token
+                resp = await self.http.post("/auth/login", json=self._login_payload())
+                return self._token_from_login(resp)
+
+        return self._fallback_token()
@@ -0,0 +1,162 @@
+"""
+Opt-in TTL + LRU response cache for idempotent GETs (RESPONSE_CACHE=1).
+
+- key: method + full URL (sorted query params) + auth identity (hashed header value)
+- bounded size with LRU eviction
+- TTL per route prefix (longest prefix wins), default TTL otherwise; TTL <= 0 disables caching
+- mutating verbs invalidate cached entries under the same resource prefix (/users, /carts, ...)
+- hit / miss / eviction / invalidation counters for reporting
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlencode
+
+import httpx
+
+MUTATING_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+# Headers describing the wire encoding, not the decoded body a stored / shared copy holds
+ENCODING_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+def decoded_headers(resp: httpx.Response) -> list[tuple[str, str]]:
+    """Headers for a new Response over `resp.content` (the already decoded body)."""
+    return [(k, v) for k, v in resp.headers.multi_items() if k.lower() not in ENCODING_HEADERS]
+
+
+@dataclass
+class _Entry:
+    resource: str
+    expires_at: float
+    status_code: int
+    headers: list[tuple[str, str]]
+    content: bytes
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+def resource_prefix(path: str) -> str:
+    # "/users/1/carts" -> "/users"
+    first = path.lstrip("/").split("/", 1)[0]
+    return f"/{first}"
+
+
+def cache_key(method: str, url: httpx.URL, auth_value: str | None) -> tuple[str, str, str]:
+    # Encoded, so a value holding "&" or "=" can't pass for another parameter set.
+    params = urlencode(sorted(url.params.multi_items()))
+    identity = hashlib.sha1(auth_value.encode("utf-8")).hexdigest() if auth_value else ""
+    return method.upper(), f"{url.path}?{params}", identity
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        *,
+        max_entries: int = 512,
+        ttl_seconds: float = 30.0,
+        route_ttls: dict[str, float] | None = None,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # Longest prefix first so "/products/categories" beats "/products".
+        self.route_ttls = sorted(
+            (route_ttls or {}).items(), key=lambda kv: len(kv[0]), reverse=True
+        )
+        self.stats = CacheStats()
+        self._entries: OrderedDict[tuple[str, str, str], _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> ResponseCache | None:
+        if not getattr(settings, "response_cache_enabled", False):
+            return None
+        return cls(
+            max_entries=settings.response_cache_max_entries,
+            ttl_seconds=settings.response_cache_ttl_seconds,
+            route_ttls=settings.response_cache_route_ttls,
+        )
+
+    def ttl_for(self, path: str) -> float:
+        for prefix, ttl in self.route_ttls:
+            if path.startswith(prefix):
+                return ttl
+        return self.ttl_seconds
+
+    def get(self, key: tuple[str, str, str], req: httpx.Request) -> httpx.Response | None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            if entry.expires_at <= now:
+                del self._entries[key]
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+
+        # Fresh Response per hit: callers may consume / mutate it independently.
+        return httpx.Response(
+            entry.status_code, headers=entry.headers, content=entry.content, request=req
+        )
+
+    def put(self, key: tuple[str, str, str], resp: httpx.Response) -> None:
+        if not resp.is_success:
+            return
+        path = resp.request.url.path
+        ttl = self.ttl_for(path)
+        if ttl <= 0:
+            return
+
+        entry = _Entry(
+            resource=resource_prefix(path),
+            expires_at=time.monotonic() + ttl,
+            status_code=resp.status_code,
+            headers=decoded_headers(resp),
+            content=resp.content,
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def invalidate(self, path: str) -> int:
+        """Drop every entry under the resource prefix of `path`; returns how many."""
+        resource = resource_prefix(path)
+        with self._lock:
+            stale = [k for k, e in self._entries.items() if e.resource == resource]
+            for k in stale:
+                del self._entries[k]
+            self.stats.invalidations += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
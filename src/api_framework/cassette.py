@@ -0,0 +1,400 @@
+"""
+Record/replay cassettes for ApiClient.
+
+Modes (CASSETTE_MODE):
+- passthrough: no cassette (default)
+- record: send requests normally and persist every interaction (the first record of a run
+  starts the cassette afresh; every later client and xdist worker of the run adds to it)
+- replay: serve interactions from disk, never touch the network
+
+On-disk format (compact + indexed):
+- <path>      data file: magic header + run id, then one zlib-compressed record per
+              interaction (JSON meta line + raw response body)
+- <path>.idx  index file: magic header, then fixed-size entries sorted by fingerprint
+              (sha1 digest, data offset, record length)
+
+Replay mmaps the index and binary-searches it, so opening a cassette with tens of
+thousands of interactions does no parsing at session start. While recording, the index is
+a journal: every entry is appended (and flushed with its record) as it is recorded, and
+close() rewrites it sorted. A run that never got to close() leaves the journal, which
+replay sorts in memory.
+
+Several processes (xdist workers) may record into one cassette: every record is written
+under an exclusive flock on the data file (POSIX; like the shared rate-limit store), at
+the end of the file, with its entry appended to the shared journal. The run id in the
+header (xdist's PYTEST_XDIST_TESTRUNUID, else one per process) tells the first record of
+a run, which truncates what an earlier run left.
+
+Response bodies are redacted before they are stored (the default sensitive keys plus
+REDACT_JSON_KEYS). Tokens the server issues and the client sends back (accessToken,
+refreshToken, ...) become a placeholder derived from the value, and request bodies are
+fingerprinted with the same placeholders: a replayed login -> refresh flow sends the
+placeholder back and still matches the recorded refresh.
+
+Repeated identical requests are recorded as a sequence (1st, 2nd, ... occurrence) and
+replayed in the same order, so flows like login -> refresh stay consistent. Occurrences
+with an identical response share one stored record. Past the recorded sequence, replay
+falls back to the first occurrence.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import uuid
+import zlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Literal
+
+import httpx
+
+from .cache import ENCODING_HEADERS
+from .redaction import REDACTED, SENSITIVE_HEADERS, Redactor
+
+try:  # POSIX only; without it, recording is safe within one process only
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+CassetteMode = Literal["passthrough", "record", "replay"]
+
+_DATA_MAGIC = b"DJCASS2\n"
+_RUN_ID_SIZE = 32
+_INDEX_MAGIC = b"DJIDX1\n\0"
+_JOURNAL_MAGIC = b"DJIDXJ\n\0"  # index still being recorded: entries in write order
+_ENTRY = struct.Struct(">20sQI")  # sha1 digest, offset, length
+
+# Wire-encoding headers (the stored body is decoded) and credentials are not stored.
+_DROP_HEADERS = {*ENCODING_HEADERS, *SENSITIVE_HEADERS}
+
+
+# One shared Cassette per (path, mode) per process: several clients (sync + async)
+# appending to the same data file must go through a single handle and index.
+_registry: dict[tuple[Path, str], Cassette] = {}
+_registry_lock = threading.Lock()
+# Recording run: shared by the xdist workers of one session
+_RUN_ID = os.environ.get("PYTEST_XDIST_TESTRUNUID") or uuid.uuid4().hex
+
+# Credentials the server issues and the client echoes back in a later request body.
+_ISSUED_KEYS = ("accessToken", "refreshToken", "token", "idToken", "session")
+_ISSUED = frozenset(key.lower() for key in _ISSUED_KEYS)
+_PLACEHOLDER_PREFIX = "***REDACTED:"
+
+
+class CassetteMiss(RuntimeError):
+    """Replay mode found no recorded interaction for a request."""
+
+
+def _mask(key: str, value: Any) -> Any:
+    if key.lower() not in _ISSUED or not isinstance(value, str):
+        return REDACTED
+    if value.startswith(_PLACEHOLDER_PREFIX):
+        return value
+    return f"{_PLACEHOLDER_PREFIX}{hashlib.sha256(value.encode()).hexdigest()[:16]}***"
+
+
+# Issued tokens in request bodies -> their placeholders (replayed ones already are)
+_issued_tokens = Redactor(_ISSUED_KEYS, mask=_mask)
+
+
+def _normalized_body(content: bytes) -> Any:
+    if not content:
+        return None
+    try:
+        # Key order / whitespace must not change the fingerprint.
+        return _issued_tokens.redact(json.loads(content))
+    except ValueError:
+        return hashlib.sha1(content).hexdigest()
+
+
+def request_fingerprint(req: httpx.Request) -> bytes:
+    """
+    Stable identity of a request: method, path, sorted query params, normalized JSON body.
+    Headers (correlation id, auth token) and the base URL are deliberately excluded.
+    """
+    key = [
+        req.method.upper(),
+        req.url.path,
+        sorted(req.url.params.multi_items()),
+        _normalized_body(req.content),
+    ]
+    raw = json.dumps(key, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha1(raw.encode("utf-8")).digest()
+
+
+def _occurrence_key(digest: bytes, occurrence: int) -> bytes:
+    if occurrence == 0:
+        return digest
+    return hashlib.sha1(digest + occurrence.to_bytes(4, "big")).digest()
+
+
+class Cassette:
+    def __init__(self, path: str | Path, mode: CassetteMode, *, redactor: Redactor | None = None):
+        self.path = Path(path)
+        self.index_path = self.path.with_name(self.path.name + ".idx")
+        self.mode = mode
+        self.redactor = redactor or Redactor(mask=_mask)
+        self._lock = threading.Lock()
+
+        # Replay state (opened lazily on first lookup)
+        self._index_map: mmap.mmap | bytes | None = None
+        self._data_map: mmap.mmap | None = None
+        self._entries = 0
+        self._opened = False
+
+        # Record state (unbuffered: other processes write to the same files)
+        self._blobs: dict[bytes, tuple[int, int]] = {}  # blob sha1 -> (offset, length)
+        self._data_file: Any = None
+        self._index_file: Any = None
+
+        # Occurrences seen so far per request fingerprint (record + replay)
+        self._seen: dict[bytes, int] = {}
+
+        # Number of clients holding this cassette (see from_settings / close)
+        self._holders = 0
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> Cassette | None:
+        mode: CassetteMode = getattr(settings, "cassette_mode", "passthrough")
+        if mode == "passthrough":
+            return None
+
+        key = (Path(settings.cassette_path).resolve(), mode)
+        with _registry_lock:
+            cassette = _registry.get(key)
+            if cassette is None:
+                redactor = Redactor.from_settings(settings, mask=_mask)
+                cassette = _registry[key] = cls(key[0], mode, redactor=redactor)
+            cassette._holders += 1
+        return cassette
+
+    # -----------------------
+    # Replay
+    # -----------------------
+
+    def _open_for_replay(self) -> None:
+        if self._opened:
+            return
+        self._opened = True
+        if not self.index_path.exists() or not self.path.exists():
+            return
+
+        with self.index_path.open("rb") as f:
+            magic = f.read(len(_INDEX_MAGIC))
+            if magic == _INDEX_MAGIC:
+                self._index_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if magic == _JOURNAL_MAGIC:
+            # The recording never reached close(): sort its journal here.
+            entries = self._read_index()
+            self._index_map = _INDEX_MAGIC + b"".join(
+                _ENTRY.pack(key, *entries[key]) for key in sorted(entries)
+            )
+        elif magic != _INDEX_MAGIC:
+            raise ValueError(f"Not a cassette index: {self.index_path}")
+        self._entries = (len(self._index_map) - len(_INDEX_MAGIC)) // _ENTRY.size
+
+        with self.path.open("rb") as f:
+            self._data_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._data_map[: len(_DATA_MAGIC)] != _DATA_MAGIC:
+            raise ValueError(f"Not a cassette: {self.path}")
+
+    def _find(self, digest: bytes) -> tuple[int, int] | None:
+        assert self._index_map is not None
+        lo, hi = 0, self._entries
+        while lo < hi:
+            mid = (lo + hi) // 2
+            key, offset, length = _ENTRY.unpack_from(
+                self._index_map, len(_INDEX_MAGIC) + mid * _ENTRY.size
+            )
+            if key == digest:
+                return offset, length
+            if key < digest:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
+
+    def _next_occurrence(self, digest: bytes) -> int:
+        occurrence = self._seen.get(digest, 0)
+        self._seen[digest] = occurrence + 1
+        return occurrence
+
+    def play(self, req: httpx.Request) -> httpx.Response:
+        digest = request_fingerprint(req)
+        with self._lock:
+            self._open_for_replay()
+            occurrence = self._next_occurrence(digest)
+            hit = None
+            if self._index_map is not None:
+                hit = self._find(_occurrence_key(digest, occurrence))
+                if hit is None and occurrence:
+                    hit = self._find(digest)
+            if hit is None or self._data_map is None:
+                raise CassetteMiss(
+                    f"No recorded interaction for {req.method} {req.url} in {self.path}"
+                )
+            offset, length = hit
+            record = zlib.decompress(self._data_map[offset : offset + length])
+
+        meta_line, _, content = record.partition(b"\n")
+        meta = json.loads(meta_line)
+        return httpx.Response(
+            meta["status"],
+            headers=[tuple(h) for h in meta["headers"]],
+            content=content,
+            request=req,
+        )
+
+    # -----------------------
+    # Record
+    # -----------------------
+
+    def _read_index(self) -> dict[bytes, tuple[int, int]]:
+        """Entries of a sorted index or a journal (a later entry for a key wins)."""
+        entries: dict[bytes, tuple[int, int]] = {}
+        if not self.index_path.exists():
+            return entries
+        raw = self.index_path.read_bytes()
+        if not raw:
+            return entries
+        if raw[: len(_INDEX_MAGIC)] not in (_INDEX_MAGIC, _JOURNAL_MAGIC):
+            raise ValueError(f"Not a cassette index: {self.index_path}")
+        # Entries past the end of the data file are from a write cut short by a crash.
+        size = self.path.stat().st_size if self.path.exists() else 0
+        for pos in range(len(_INDEX_MAGIC), len(raw) - _ENTRY.size + 1, _ENTRY.size):
+            key, offset, length = _ENTRY.unpack_from(raw, pos)
+            if offset + length <= size:
+                entries[key] = (offset, length)
+        return entries
+
+    @staticmethod
+    def _open_shared(path: Path) -> Any:
+        return os.fdopen(os.open(path, os.O_RDWR | os.O_CREAT, 0o644), "r+b", buffering=0)
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        """The data + index files to this thread of this process (caller holds _lock)."""
+        if self._data_file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._data_file = self._open_shared(self.path)
+            self._index_file = self._open_shared(self.index_path)
+        if fcntl is None:  # pragma: no cover - Windows
+            yield
+            return
+        fcntl.flock(self._data_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._data_file, fcntl.LOCK_UN)
+
+    def _join_run(self) -> None:
+        """Under the lock: start the cassette afresh unless this run already has."""
+        header = _DATA_MAGIC + _RUN_ID.encode("ascii")[:_RUN_ID_SIZE].ljust(_RUN_ID_SIZE)
+        data, index = self._data_file, self._index_file
+        data.seek(0)
+        if data.read(len(header)) == header:
+            index.seek(0)
+            if index.read(len(_INDEX_MAGIC)) == _INDEX_MAGIC:
+                # Sorted by a close() earlier in the run; still a valid journal to append to.
+                index.seek(0)
+                index.write(_JOURNAL_MAGIC)
+            return
+        # A recording run rewrites the cassette, so stale responses never survive it.
+        self._blobs.clear()
+        for f, magic in ((data, header), (index, _JOURNAL_MAGIC)):
+            f.seek(0)
+            f.truncate()
+            f.write(magic)
+
+    def _redacted(self, content: bytes) -> bytes:
+        try:
+            body = json.loads(content)
+        except ValueError:
+            return content
+        redacted = self.redactor.redact(body)
+        if redacted is body:
+            return content
+        return json.dumps(redacted, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def record(self, req: httpx.Request, resp: httpx.Response) -> None:
+        digest = request_fingerprint(req)
+        meta = {
+            "method": req.method,
+            "path": req.url.path,
+            "status": resp.status_code,
+            "headers": [[k, v] for k, v in resp.headers.items() if k.lower() not in _DROP_HEADERS],
+        }
+        content = self._redacted(resp.content)
+        payload = json.dumps(meta, separators=(",", ":")).encode("utf-8") + b"\n" + content
+        blob = zlib.compress(payload, 6)
+
+        with self._lock, self._exclusive():
+            self._join_run()
+
+            # The latest recording of an occurrence wins.
+            key = _occurrence_key(digest, self._next_occurrence(digest))
+
+            # Identical responses (e.g. repeated GETs) share one stored record.
+            blob_id = hashlib.sha1(blob).digest()
+            location = self._blobs.get(blob_id)
+            if location is None:
+                location = (self._data_file.seek(0, os.SEEK_END), len(blob))
+                self._data_file.write(blob)
+                self._blobs[blob_id] = location
+            # Record first, then its index entry: a crash never indexes a missing record.
+            self._index_file.seek(0, os.SEEK_END)
+            self._index_file.write(_ENTRY.pack(key, *location))
+
+    def _sort_index(self) -> None:
+        """Under the lock: rewrite the journal sorted, in place (other writers keep it open)."""
+        entries = self._read_index()
+        index = self._index_file
+        index.seek(len(_INDEX_MAGIC))
+        index.write(b"".join(_ENTRY.pack(key, *entries[key]) for key in sorted(entries)))
+        index.truncate()
+        index.seek(0)
+        index.write(_INDEX_MAGIC)  # last: until here it is still a (shorter) journal
+
+    # -----------------------
+    # Lifecycle
+    # -----------------------
+
+    def __len__(self) -> int:
+        with self._lock:
+            if self.mode == "record":
+                return len(self._read_index())
+            self._open_for_replay()
+            return self._entries
+
+    def close(self) -> None:
+        """
+        Release one holder; the last one writes the sorted index and unmaps the files.
+        """
+        with _registry_lock:
+            self._holders = max(self._holders - 1, 0)
+            if self._holders:
+                return
+            key = (self.path, self.mode)
+            if _registry.get(key) is self:
+                del _registry[key]
+
+        with self._lock:
+            if self._data_file is not None:
+                with self._exclusive():
+                    self._sort_index()
+                self._data_file.close()
+                self._index_file.close()
+                self._data_file = self._index_file = None
+                self._blobs.clear()
+            for m in (self._index_map, self._data_map):
+                if isinstance(m, mmap.mmap):
+                    m.close()
+            self._index_map = self._data_map = None
+            self._opened = False
+            self._seen.clear()
@@ -0,0 +1,192 @@
+"""
+Circuit breaker for ApiClient / AsyncApiClient (CIRCUIT_BREAKER=1).
+
+One breaker per base URL (host), or per host + resource prefix with CIRCUIT_PER_ROUTE=1.
+
+- closed: requests flow; CIRCUIT_FAILURE_THRESHOLD consecutive failures
+  (transport errors or 5xx) open the circuit
+- open: requests fail fast with CircuitOpenError, no network, no retry sleeps
+- half-open: after CIRCUIT_RESET_SECONDS, CIRCUIT_HALF_OPEN_MAX_CALLS trial requests are
+  let through; a success closes the circuit, a failure opens it again. A trial that ends
+  with neither (cancelled, or an error that is not the backend's) hands its slot back
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, Literal
+
+import httpx
+
+from .cache import resource_prefix
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+# Worst first: used when merging snapshots from several clients / workers.
+STATE_SEVERITY: dict[str, int] = {"open": 2, "half_open": 1, "closed": 0}
+
+
+class CircuitOpenError(RuntimeError):
+    """The circuit for a host / route is open: the request was not sent."""
+
+    def __init__(self, key: str, retry_in: float):
+        super().__init__(f"Circuit open for {key}; next trial in {retry_in:.1f}s")
+        self.key = key
+        self.retry_in = retry_in
+
+
+def is_failure_status(status_code: int) -> bool:
+    return status_code >= 500
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        key: str,
+        *,
+        failure_threshold: int = 5,
+        reset_seconds: float = 30.0,
+        half_open_max_calls: int = 1,
+        on_transition: Callable[[str, str, str], None] | None = None,
+    ):
+        self.key = key
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self.on_transition = on_transition
+
+        self.state: CircuitState = "closed"
+        self.consecutive_failures = 0
+        self.opened_count = 0
+        self.short_circuited = 0
+        self._opened_at = 0.0
+        self._trials = 0
+        self._half_open_period = 0  # tells a stale trial's release_trial() apart
+        self._lock = threading.Lock()
+
+    def _move(self, state: CircuitState) -> None:
+        # Caller holds the lock.
+        previous, self.state = self.state, state
+        if state == "open":
+            self._opened_at = time.monotonic()
+            self.opened_count += 1
+        self._trials = 0
+        self._half_open_period += state == "half_open"
+        if self.on_transition is not None and previous != state:
+            self.on_transition(self.key, previous, state)
+
+    def before_request(self) -> int | None:
+        """
+        Raise CircuitOpenError unless the request may go out. A half-open trial gets a
+        token for release_trial(), which the caller must call once the attempt is over.
+        """
+        with self._lock:
+            if self.state == "open":
+                remaining = self._opened_at + self.reset_seconds - time.monotonic()
+                if remaining > 0:
+                    self.short_circuited += 1
+                    raise CircuitOpenError(self.key, remaining)
+                self._move("half_open")
+
+            if self.state == "half_open":
+                if self._trials >= self.half_open_max_calls:
+                    self.short_circuited += 1
+                    raise CircuitOpenError(self.key, 0.0)
+                self._trials += 1
+                return self._half_open_period
+        return None
+
+    def release_trial(self, token: int | None) -> None:
+        """End a trial: frees its slot unless its outcome already moved the circuit on."""
+        if token is None:
+            return
+        with self._lock:
+            if self.state == "half_open" and token == self._half_open_period and self._trials:
+                self._trials -= 1
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.consecutive_failures = 0
+            if self.state != "closed":
+                self._move("closed")
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == "half_open" or (
+                self.state == "closed" and self.consecutive_failures >= self.failure_threshold
+            ):
+                self._move("open")
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == "open"
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "opened": self.opened_count,
+            "short_circuited": self.short_circuited,
+        }
+
+
+class CircuitBreakers:
+    """Breakers keyed by host (and resource prefix when per_route=True)."""
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        reset_seconds: float = 30.0,
+        half_open_max_calls: int = 1,
+        per_route: bool = False,
+        on_transition: Callable[[str, str, str], None] | None = None,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self.per_route = per_route
+        self.on_transition = on_transition
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(
+        cls, settings: Any, *, on_transition: Callable[[str, str, str], None] | None = None
+    ) -> CircuitBreakers | None:
+        if not getattr(settings, "circuit_breaker_enabled", False):
+            return None
+        return cls(
+            failure_threshold=settings.circuit_failure_threshold,
+            reset_seconds=settings.circuit_reset_seconds,
+            half_open_max_calls=settings.circuit_half_open_max_calls,
+            per_route=settings.circuit_per_route,
+            on_transition=on_transition,
+        )
+
+    def key_for(self, url: httpx.URL) -> str:
+        key = f"{url.scheme}://{url.netloc.decode('ascii')}"
+        if self.per_route:
+            key += resource_prefix(url.path)
+        return key
+
+    def for_url(self, url: httpx.URL) -> CircuitBreaker:
+        key = self.key_for(url)
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = self._breakers[key] = CircuitBreaker(
+                    key,
+                    failure_threshold=self.failure_threshold,
+                    reset_seconds=self.reset_seconds,
+                    half_open_max_calls=self.half_open_max_calls,
+                    on_transition=self.on_transition,
+                )
+            return breaker
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            return {key: b.snapshot() for key, b in sorted(self._breakers.items())}
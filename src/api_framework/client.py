@@ -1,41 +1,128 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import os
 import time
 import uuid
+from collections.abc import AsyncIterator, Iterator
 from typing import Any
 
 import httpx
 
-from .auth import AuthClient
+from .auth import AsyncAuthClient, AuthClient
+from .cache import MUTATING_METHODS, ResponseCache, cache_key, decoded_headers
+from .cassette import Cassette
+from .circuit import CircuitBreaker, CircuitBreakers, is_failure_status
 from .config import Settings
-from .redaction import redact_headers, redact_json
+from .debuglog import DebugLog
+from .inproc.app import INPROC_HTTP_BASE_URL, inproc_transport, is_inproc_url
+from .jsoncodec import get_codec
+from .jsonstream import JsonItemStream
+from .latency import shared_recorder
+from .ratelimit import RateLimiter
+from .requestlog import RequestLog
+from .retry import RetryPolicy, RetryState
+from .revalidation import RevalidationCache, has_conditional_headers
+from .singleflight import IDEMPOTENT_METHODS, AsyncSingleFlight, SingleFlight
+from .timings import PhaseTimer, PhaseTimings, route_key
 
+# Transport errors worth another attempt (same set for sync + async clients).
+RETRYABLE_EXCEPTIONS: tuple[type[Exception], ...] = (httpx.ConnectError, httpx.ReadTimeout)
+
+
+class _BaseApiClient:
+    """
+    Behavior shared by ApiClient and AsyncApiClient:
+    debug kit logging, correlation ids, retry/backoff policy and auth header shape.
+    """
 
-class ApiClient:
     def __init__(self, settings: Settings):
         self.settings = settings
 
+        # JSON codec for `json=` request bodies and decode() (JSON_CODEC)
+        self.codec = get_codec(settings.json_codec)
+
         # Debug kit toggle:
-        # - API_DEBUG_LOG=1 enables pretty request/response + retries/timing logs
+        # - API_DEBUG_LOG=1 enables JSON-lines request/response + retries/timing logs,
+        #   formatted off the request path by a background writer (api_framework.debuglog)
         self.debug_log_enabled = os.getenv("API_DEBUG_LOG", "").strip() == "1"
+        self.debug_log = DebugLog.from_settings(settings) if self.debug_log_enabled else None
+
+        # JSONL record per attempt (REQUEST_LOG_PATH); None when disabled
+        self.request_log = RequestLog.from_settings(settings)
 
         # Debug kit: correlation id header name
         self.correlation_header_name = "x-correlation-id"
 
-        self.http = httpx.Client(
-            base_url=str(settings.base_url),
-            headers={"Content-Type": "application/json"},
-            timeout=settings.timeout_seconds,
+        # Record/replay (CASSETTE_MODE); None in passthrough mode
+        self.cassette = Cassette.from_settings(settings)
+
+        # GET response cache (RESPONSE_CACHE=1); None when disabled
+        self.cache = ResponseCache.from_settings(settings)
+
+        # ETag / Last-Modified revalidation (CONDITIONAL_REQUESTS=1); None when disabled
+        self.revalidation = RevalidationCache.from_settings(settings)
+
+        # Token-bucket rate limiting (RATE_LIMIT_RPS > 0); None when disabled
+        self.rate_limiter = RateLimiter.from_settings(settings)
+
+        # Backoff strategy, retry budget and per-request deadline (RETRY_*)
+        self.retry_policy = RetryPolicy.from_settings(settings)
+
+        # End-to-end latency per endpoint, shared by every client in the process
+        self.latency = shared_recorder()
+
+        # Per-route phase timing histograms (connect / tls / send / wait / download)
+        self.phase_timings = PhaseTimings()
+
+        # Circuit breakers per host / route (CIRCUIT_BREAKER=1); None when disabled
+        self.circuit_breakers = CircuitBreakers.from_settings(
+            settings, on_transition=self._log_circuit_transition
         )
-        self.auth = AuthClient(settings, self.http)
 
-    def close(self) -> None:
-        self.http.close()
+        # Single-flight coalescing (SINGLE_FLIGHT=1); set up by the concrete client
+        self.single_flight: (
+            SingleFlight[httpx.Response] | AsyncSingleFlight[httpx.Response] | None
+        ) = None
 
-    def _auth_headers(self) -> dict[str, str]:
-        token = self.auth.get_token()
+    def _dedupe_enabled(self) -> bool:
+        return (
+            self.cache is not None
+            or self.single_flight is not None
+            or self.revalidation is not None
+        )
+
+    def _http_options(self) -> dict[str, Any]:
+        """
+        Shared httpx.Client / httpx.AsyncClient options.
+        BASE_URL=inproc:// swaps the network for the in-process DummyJSON stand-in.
+        """
+        options: dict[str, Any] = {
+            "base_url": str(self.settings.base_url),
+            "headers": {"Content-Type": "application/json"},
+            "timeout": self.settings.timeout_seconds,
+        }
+        if is_inproc_url(options["base_url"]):
+            options["base_url"] = INPROC_HTTP_BASE_URL
+            options["transport"] = inproc_transport()
+        return options
+
+    def _encode_json(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        # httpx always encodes `json=` with the stdlib; send codec bytes instead
+        # (Content-Type: application/json is a client default header).
+        if "json" not in kwargs:
+            return kwargs
+        out = dict(kwargs)
+        payload = out.pop("json")
+        if payload is not None:
+            out["content"] = self.codec.dumps(payload)
+        return out
+
+    def decode(self, resp: httpx.Response) -> Any:
+        """The response body parsed with the configured codec (like `resp.json()`)."""
+        return self.codec.loads(resp.content)
+
+    def _bearer_headers(self, token: str | None) -> dict[str, str]:
         if not token:
             return {}
 
@@ -44,53 +131,280 @@ class ApiClient:
         return {header_name: f"Bearer {token}"}
 
     # -----------------------
-    # Pretty / JSON-style logs
+    # Cassettes
     # -----------------------
 
-    @staticmethod
-    def _pretty(obj: Any) -> str:
-        return json.dumps(obj, indent=2, ensure_ascii=False, sort_keys=True)
+    def _replaying(self) -> bool:
+        return self.cassette is not None and self.cassette.mode == "replay"
 
-    @staticmethod
-    def _new_correlation_id() -> str:
-        return uuid.uuid4().hex
+    def _replay(
+        self,
+        method: str,
+        path: str,
+        *,
+        headers: dict[str, str],
+        correlation_id: str,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        # Replay never authenticates: auth headers are not part of the fingerprint.
+        assert self.cassette is not None
+        headers = {**headers, self.correlation_header_name: correlation_id}
+        req = self.http.build_request(method, path, headers=headers, **kwargs)
 
-    def _safe_request_body(self, req: httpx.Request) -> Any | None:
-        if not req.content:
-            return None
-        try:
-            body = json.loads(req.content.decode("utf-8"))
-            return redact_json(body)
-        except Exception:
-            return f"<non-json payload, {len(req.content)} bytes>"
+        start = time.perf_counter()
+        resp = self.cassette.play(req)
+        self._safe_log(
+            req,
+            resp,
+            correlation_id=correlation_id,
+            duration_ms=int((time.perf_counter() - start) * 1000),
+            retry_attempt=1,
+        )
+        return resp
+
+    def _record(self, req: httpx.Request, resp: httpx.Response) -> None:
+        if self.cassette is not None and self.cassette.mode == "record":
+            self.cassette.record(req, resp)
+
+    def _close_cassette(self) -> None:
+        if self.cassette is not None:
+            self.cassette.close()
+
+    # -----------------------
+    # Response cache / single-flight
+    # -----------------------
 
-    def _safe_response_body(self, resp: httpx.Response) -> Any | None:
+    @staticmethod
+    def _copy_response(resp: httpx.Response) -> httpx.Response:
+        # Coalesced waiters get their own Response over the leader's (already read and
+        # decoded) body, so without the leader's Content-Encoding / Content-Length.
+        return httpx.Response(
+            resp.status_code,
+            headers=decoded_headers(resp),
+            content=resp.content,
+            request=resp.request,
+            extensions=resp.extensions,
+        )
+
+    def _cache_lookup(
+        self,
+        method: str,
+        path: str,
+        *,
+        headers: dict[str, str],
+        correlation_id: str,
+        **kwargs: Any,
+    ) -> tuple[tuple[str, str, str] | None, httpx.Response | None]:
         """
-        Returns a sanitized response body that is safe to print.
-        Also trims very large common payloads for readability.
+        Returns (request key, cached response). Mutating verbs invalidate their resource
+        prefix and get no key; idempotent verbs are keyed for the cache and single-flight.
         """
-        try:
-            ct = resp.headers.get("content-type", "")
-            if ct.startswith("application/json"):
-                data = redact_json(resp.json())
-
-                # Readability: trim huge DummyJSON list payloads (e.g., /users)
-                if isinstance(data, dict):
-                    for key in ("users", "products", "posts", "comments", "todos"):
-                        if key in data and isinstance(data[key], list) and len(data[key]) > 2:
-                            data[key] = data[key][:2]
-                            data["_note"] = (
-                                f"{key} trimmed to first 2 items for console readability"
-                            )
-                            break
-
-                return data
-
-            # Don't dump massive HTML/text
-            txt = resp.text
-            return (txt[:500] + "…") if len(txt) > 500 else txt
-        except Exception:
-            return "<unavailable>"
+        verb = method.upper()
+        if verb not in MUTATING_METHODS and verb not in IDEMPOTENT_METHODS:
+            return None, None
+
+        headers = {**headers, self.correlation_header_name: correlation_id}
+        req = self.http.build_request(method, path, headers=headers, **kwargs)
+        if verb in MUTATING_METHODS:
+            if self.cache is not None:
+                self.cache.invalidate(req.url.path)
+            return None, None
+
+        auth_header = (self.settings.auth_header_name or "Authorization").strip()
+        key = cache_key(verb, req.url, req.headers.get(auth_header))
+        if self.cache is None or verb != "GET":
+            return key, None
+
+        cached = self.cache.get(key, req)
+        if cached is not None:
+            self._safe_log(req, cached, correlation_id=correlation_id, duration_ms=0)
+        return key, cached
+
+    def _revalidates(self, method: str, key: Any, headers: dict[str, str]) -> bool:
+        # Caller-supplied validators mean the caller wants the raw 304.
+        # Cassettes fingerprint without headers, so a recorded 304 could not be replayed.
+        return (
+            self.revalidation is not None
+            and key is not None
+            and method.upper() == "GET"
+            and self.cassette is None
+            and not has_conditional_headers(headers)
+        )
+
+    # -----------------------
+    # Rate limiting
+    # -----------------------
+
+    def _rate_limit_wait(self, req: httpx.Request, *, correlation_id: str) -> float:
+        if self.rate_limiter is None:
+            return 0.0
+        return self._rate_limit_logged(self.rate_limiter.acquire(req.url.path), correlation_id)
+
+    def _rate_limit_logged(self, wait: float, correlation_id: str) -> float:
+        if wait > 0 and self.debug_log is not None:
+            self.debug_log.event(
+                "rate_limit", correlation_id=correlation_id, wait_seconds=round(wait, 3)
+            )
+        return wait
+
+    def _rate_limit_observe(self, req: httpx.Request, resp: httpx.Response) -> None:
+        if self.rate_limiter is not None:
+            self.rate_limiter.observe(req.url.path, resp)
+
+    def _record_latency(self, method: str, path: str, start: float) -> None:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.latency.record(route_key(method, httpx.URL(path).path), elapsed_ms)
+
+    # -----------------------
+    # Circuit breaker
+    # -----------------------
+
+    def _breaker(self, req: httpx.Request) -> CircuitBreaker | None:
+        if self.circuit_breakers is None:
+            return None
+        return self.circuit_breakers.for_url(req.url)
+
+    @staticmethod
+    def _breaker_observe(breaker: CircuitBreaker | None, resp: httpx.Response) -> None:
+        if breaker is None:
+            return
+        if is_failure_status(resp.status_code):
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+
+    @staticmethod
+    def _breaker_failed(breaker: CircuitBreaker | None, exc: Exception) -> None:
+        # CircuitOpenError is not a backend failure; only transport errors count.
+        if breaker is not None and isinstance(exc, httpx.TransportError):
+            breaker.record_failure()
+
+    def _log_circuit_transition(self, key: str, previous: str, state: str) -> None:
+        if self.debug_log is not None:
+            self.debug_log.event("circuit", circuit=key, **{"from": previous, "to": state})
+
+    # -----------------------
+    # Streaming (stream_items)
+    # -----------------------
+
+    def _stream_headers(self, headers: dict[str, str] | None) -> tuple[dict[str, str], str]:
+        out = dict(headers or {})
+        correlation_id = out.get(self.correlation_header_name) or self._new_correlation_id()
+        out[self.correlation_header_name] = correlation_id
+        return out, correlation_id
+
+    def _buffered_items(self, resp: httpx.Response, key: str | None) -> list[Any]:
+        # Cassette modes need the whole body, so stream_items falls back to request().
+        resp.raise_for_status()
+        data = self.decode(resp)
+        return data[key] if key is not None else data
+
+    def _stream_finished(
+        self,
+        req: httpx.Request,
+        resp: httpx.Response | None,
+        *,
+        correlation_id: str,
+        breaker: CircuitBreaker | None,
+        timer: PhaseTimer,
+        start: float,
+        exc: Exception | None,
+    ) -> None:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._record_latency(req.method, req.url.path, start)
+        if resp is not None:
+            self._record_timings(req, resp, timer, elapsed_ms)
+            self._breaker_observe(breaker, resp)
+            self._rate_limit_observe(req, resp)
+        elif exc is not None:
+            self._breaker_failed(breaker, exc)
+        self._log_request(req, resp, correlation_id=correlation_id, attempt=1, start=start, exc=exc)
+        self._safe_log(
+            req, resp, correlation_id=correlation_id, duration_ms=int(elapsed_ms), retry_attempt=1
+        )
+
+    # -----------------------
+    # Stats
+    # -----------------------
+
+    def stats(self) -> dict[str, Any]:
+        """Counters of the enabled client features (for reporting artifacts)."""
+        out: dict[str, Any] = {
+            "retries": self.retry_policy.stats.as_dict(),
+            "phases": self.phase_timings.snapshot(),
+        }
+        if self.cache is not None:
+            out["response_cache"] = self.cache.stats.as_dict()
+        if self.single_flight is not None:
+            out["single_flight"] = self.single_flight.stats.as_dict()
+        if self.revalidation is not None:
+            out["revalidation"] = self.revalidation.stats.as_dict()
+        if self.rate_limiter is not None:
+            out["rate_limit"] = self.rate_limiter.stats.as_dict()
+        if self.circuit_breakers is not None:
+            out["circuit_breakers"] = self.circuit_breakers.snapshot()
+        return out
+
+    # -----------------------
+    # Retry policy
+    # -----------------------
+
+    def _attempt_kwargs(
+        self, state: RetryState, kwargs: dict[str, Any], *, trace: Any
+    ) -> dict[str, Any]:
+        out = dict(kwargs)
+        # httpcore trace events feed the per-phase timings of this attempt.
+        out["extensions"] = {**(kwargs.get("extensions") or {}), "trace": trace}
+
+        # REQUEST_DEADLINE_SECONDS: an attempt may not outlive the logical request.
+        remaining = state.remaining()
+        if remaining is not None and "timeout" not in kwargs:
+            out["timeout"] = max(min(self.settings.timeout_seconds, remaining), 0.001)
+        return out
+
+    # -----------------------
+    # Timings
+    # -----------------------
+
+    def _record_timings(
+        self, req: httpx.Request, resp: httpx.Response, timer: PhaseTimer, elapsed_ms: float
+    ) -> None:
+        timings = timer.timings(elapsed_ms)
+        resp.extensions["timings"] = timings
+        self.phase_timings.record(route_key(req.method, req.url.path), timings)
+
+    # -----------------------
+    # Request log (JSONL per attempt, see api_framework.requestlog)
+    # -----------------------
+
+    def _log_request(
+        self,
+        req: httpx.Request,
+        resp: httpx.Response | None,
+        *,
+        correlation_id: str,
+        attempt: int,
+        start: float,
+        exc: BaseException | None = None,
+    ) -> None:
+        if self.request_log is None:
+            return
+        self.request_log.record(
+            req,
+            resp,
+            correlation_id=correlation_id,
+            attempt=attempt,
+            elapsed_ms=(time.perf_counter() - start) * 1000,
+            exc=exc,
+        )
+
+    # -----------------------
+    # Debug kit logs (JSON lines, see api_framework.debuglog)
+    # -----------------------
+
+    @staticmethod
+    def _new_correlation_id() -> str:
+        return uuid.uuid4().hex
 
     def _safe_log(
         self,
@@ -101,31 +415,19 @@ class ApiClient:
         duration_ms: int | None = None,
         retry_attempt: int | None = None,
     ) -> None:
-        if not self.debug_log_enabled:
+        # Only references are queued; redaction, trimming and JSON encoding run on the
+        # writer thread.
+        if self.debug_log is None:
             return
 
-        # Request (JSON-ish blocks)
-        print("\n=== REQUEST ===")
-        meta: dict[str, Any] = {"method": req.method, "url": str(req.url)}
+        fields: dict[str, Any] = {}
         if correlation_id:
-            meta["correlation_id"] = correlation_id
+            fields["correlation_id"] = correlation_id
         if retry_attempt is not None:
-            meta["retry_attempt"] = retry_attempt
+            fields["retry_attempt"] = retry_attempt
         if duration_ms is not None:
-            meta["duration_ms"] = duration_ms
-        print(self._pretty(meta))
-        print(self._pretty({"headers": redact_headers(dict(req.headers))}))
-
-        req_body = self._safe_request_body(req)
-        if req_body is not None:
-            print(self._pretty({"body": req_body}))
-
-        # Response (JSON-ish blocks)
-        if resp is not None:
-            print("\n=== RESPONSE ===")
-            print(self._pretty({"status_code": resp.status_code}))
-            print(self._pretty({"headers": redact_headers(dict(resp.headers))}))
-            print(self._pretty({"body": self._safe_response_body(resp)}))
+            fields["duration_ms"] = duration_ms
+        self.debug_log.exchange(req, resp, **fields)
 
     def _log_attempt_failed(
         self,
@@ -135,55 +437,68 @@ class ApiClient:
         duration_ms: int,
         exc: Exception,
     ) -> None:
-        if not self.debug_log_enabled:
+        if self.debug_log is None:
             return
 
-        print("\n=== ATTEMPT FAILED ===")
-        print(
-            self._pretty(
-                {
-                    "correlation_id": correlation_id,
-                    "retry_attempt": retry_attempt,
-                    "duration_ms": duration_ms,
-                    "exception_type": type(exc).__name__,
-                    "exception": str(exc),
-                }
-            )
+        self.debug_log.event(
+            "attempt_failed",
+            correlation_id=correlation_id,
+            retry_attempt=retry_attempt,
+            duration_ms=duration_ms,
+            exception_type=type(exc).__name__,
+            exception=str(exc),
         )
 
     def _log_retry_sleep(
         self, *, correlation_id: str, retry_attempt: int, sleep_seconds: float
     ) -> None:
-        if not self.debug_log_enabled:
+        if self.debug_log is None:
             return
 
-        print("\n=== RETRY ===")
-        print(
-            self._pretty(
-                {
-                    "correlation_id": correlation_id,
-                    "retry_attempt": retry_attempt,
-                    "sleep_seconds": sleep_seconds,
-                }
-            )
+        self.debug_log.event(
+            "retry",
+            correlation_id=correlation_id,
+            retry_attempt=retry_attempt,
+            sleep_seconds=sleep_seconds,
         )
 
-    def _log_give_up(self, *, correlation_id: str, attempts: int, exc: Exception) -> None:
-        if not self.debug_log_enabled:
+    def _log_give_up(
+        self,
+        *,
+        correlation_id: str,
+        attempts: int,
+        exc: Exception,
+        reason: str | None = None,
+    ) -> None:
+        if self.debug_log is None:
             return
 
-        print("\n=== GIVE UP ===")
-        print(
-            self._pretty(
-                {
-                    "correlation_id": correlation_id,
-                    "attempts": attempts,
-                    "exception_type": type(exc).__name__,
-                    "exception": str(exc),
-                }
-            )
+        self.debug_log.event(
+            "give_up",
+            correlation_id=correlation_id,
+            attempts=attempts,
+            reason=reason,
+            exception_type=type(exc).__name__,
+            exception=str(exc),
         )
 
+
+class ApiClient(_BaseApiClient):
+    def __init__(self, settings: Settings):
+        super().__init__(settings)
+
+        self.http = httpx.Client(**self._http_options())
+        self.auth = AuthClient(settings, self.http)
+        if settings.single_flight_enabled:
+            self.single_flight = SingleFlight(share=self._copy_response)
+
+    def close(self) -> None:
+        self.http.close()
+        self._close_cassette()
+
+    def _auth_headers(self) -> dict[str, str]:
+        return self._bearer_headers(self.auth.get_token())
+
     # -----------------------
     # HTTP
     # -----------------------
@@ -196,6 +511,7 @@ class ApiClient:
         - Retry backoff info
         - Final GIVE UP block after last attempt
         """
+        kwargs = self._encode_json(kwargs)
         initial_headers = dict(kwargs.pop("headers", {}) or {})
 
         # Debug kit: correlation id on every request (stable across retries)
@@ -203,16 +519,62 @@ class ApiClient:
             initial_headers.get(self.correlation_header_name) or self._new_correlation_id()
         )
 
-        # Use configured attempts if present; default to 3 otherwise.
-        attempts = int(getattr(self.settings, "retry_attempts", 3) or 3)
+        if self._replaying():
+            return self._replay(
+                method, path, headers=initial_headers, correlation_id=correlation_id, **kwargs
+            )
+
+        key = None
+        if self._dedupe_enabled():
+            probe_headers = {**initial_headers, **(self._auth_headers() if auth else {})}
+            key, cached = self._cache_lookup(
+                method, path, headers=probe_headers, correlation_id=correlation_id, **kwargs
+            )
+            if cached is not None:
+                return cached
+
+        revalidation = (
+            self.revalidation if self._revalidates(method, key, initial_headers) else None
+        )
+        if revalidation is not None:
+            initial_headers = {**revalidation.conditional_headers(key), **initial_headers}
+
+        def send() -> httpx.Response:
+            resp = self._send_with_retries(
+                method,
+                path,
+                auth=auth,
+                initial_headers=initial_headers,
+                correlation_id=correlation_id,
+                **kwargs,
+            )
+            return revalidation.resolve(key, resp) if revalidation is not None else resp
 
-        # Backoff policy similar to what we had with tenacity:
-        # 0.5, 1.0, 2.0 ... capped at 4.0 seconds
-        multiplier = 0.5
-        min_sleep = 0.5
-        max_sleep = 4.0
+        start = time.perf_counter()
+        try:
+            if key is not None and isinstance(self.single_flight, SingleFlight):
+                resp = self.single_flight.do(key, send)
+            else:
+                resp = send()
+        finally:
+            self._record_latency(method, path, start)
+        if key is not None and self.cache is not None and method.upper() == "GET":
+            self.cache.put(key, resp)
+        return resp
 
-        for attempt_num in range(1, attempts + 1):
+    def _send_with_retries(
+        self,
+        method: str,
+        path: str,
+        *,
+        auth: bool,
+        initial_headers: dict[str, str],
+        correlation_id: str,
+        **kwargs,
+    ) -> httpx.Response:
+        retry = self.retry_policy.start()
+
+        for attempt_num in range(1, self.retry_policy.max_attempts + 1):
             # Rebuild headers each attempt (safe + avoids mutation surprises)
             headers = dict(initial_headers)
             headers[self.correlation_header_name] = correlation_id
@@ -221,12 +583,32 @@ class ApiClient:
                 headers.update(self._auth_headers())
 
             # Build request so we can log sanitized request/response every time.
-            req = self.http.build_request(method, path, headers=headers, **kwargs)
+            timer = PhaseTimer()
+            req = self.http.build_request(
+                method, path, headers=headers, **self._attempt_kwargs(retry, kwargs, trace=timer)
+            )
+
+            wait = self._rate_limit_wait(req, correlation_id=correlation_id)
+            if wait > 0:
+                time.sleep(wait)
 
+            breaker = self._breaker(req)
+            self.retry_policy.record_attempt()
             start = time.perf_counter()
+            trial = None
             try:
+                if breaker is not None:
+                    trial = breaker.before_request()
                 resp = self.http.send(req)
-                duration_ms = int((time.perf_counter() - start) * 1000)
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                duration_ms = int(elapsed_ms)
+                self._record_timings(req, resp, timer, elapsed_ms)
+                self._breaker_observe(breaker, resp)
+                self._rate_limit_observe(req, resp)
+                self._record(req, resp)
+                self._log_request(
+                    req, resp, correlation_id=correlation_id, attempt=attempt_num, start=start
+                )
 
                 # Always log (sanitized) – pass or fail
                 self._safe_log(
@@ -238,8 +620,17 @@ class ApiClient:
                 )
                 return resp
 
-            except (httpx.ConnectError, httpx.ReadTimeout) as exc:
+            except RETRYABLE_EXCEPTIONS as exc:
                 duration_ms = int((time.perf_counter() - start) * 1000)
+                self._breaker_failed(breaker, exc)
+                self._log_request(
+                    req,
+                    None,
+                    correlation_id=correlation_id,
+                    attempt=attempt_num,
+                    start=start,
+                    exc=exc,
+                )
 
                 # Log request block (sanitized) even when we don't have a response
                 self._safe_log(
@@ -256,15 +647,20 @@ class ApiClient:
                     exc=exc,
                 )
 
-                if attempt_num >= attempts:
-                    # Final: GIVE UP
-                    self._log_give_up(correlation_id=correlation_id, attempts=attempts, exc=exc)
+                # Next sleep from the backoff strategy, or GIVE UP (attempts exhausted,
+                # retry budget spent, deadline reached, or this failure opened the circuit)
+                sleep_seconds = self.retry_policy.decide(
+                    retry, attempt_num, circuit_open=breaker is not None and breaker.is_open
+                )
+                if sleep_seconds is None:
+                    self._log_give_up(
+                        correlation_id=correlation_id,
+                        attempts=attempt_num,
+                        exc=exc,
+                        reason=retry.give_up_reason,
+                    )
                     raise
 
-                # Compute next sleep (exponential) and retry
-                sleep_seconds = min(
-                    max(multiplier * (2 ** (attempt_num - 1)), min_sleep), max_sleep
-                )
                 self._log_retry_sleep(
                     correlation_id=correlation_id,
                     retry_attempt=attempt_num,
@@ -275,6 +671,15 @@ class ApiClient:
             except Exception as exc:
                 # Non-retryable error: log request and give up immediately
                 duration_ms = int((time.perf_counter() - start) * 1000)
+                self._breaker_failed(breaker, exc)
+                self._log_request(
+                    req,
+                    None,
+                    correlation_id=correlation_id,
+                    attempt=attempt_num,
+                    start=start,
+                    exc=exc,
+                )
 
                 self._safe_log(
                     req,
@@ -286,6 +691,11 @@ class ApiClient:
                 self._log_give_up(correlation_id=correlation_id, attempts=attempt_num, exc=exc)
                 raise
 
+            finally:
+                # A half-open trial ended without an outcome (e.g. cancelled) frees its slot
+                if breaker is not None:
+                    breaker.release_trial(trial)
+
         # Should be unreachable, but keep a safe fallback.
         raise RuntimeError("Request failed without an exception (unexpected)")
 
@@ -294,3 +704,394 @@ class ApiClient:
 
     def post(self, path: str, *, auth: bool = False, **kwargs) -> httpx.Response:
         return self.request("POST", path, auth=auth, **kwargs)
+
+    def stream_items(
+        self,
+        path: str,
+        *,
+        key: str | None = None,
+        auth: bool = False,
+        chunk_size: int = 65_536,
+        **kwargs,
+    ) -> Iterator[Any]:
+        """
+        GET `path` and yield the items of its top-level list (`key`, or the body itself
+        when it is an array) as they arrive, without holding the whole body in memory.
+
+        One attempt, no response cache: a half-consumed stream cannot be retried or
+        shared. Rate limit, circuit breaker, timings, latency and logs apply as usual.
+        Cassette modes fall back to request() (the cassette needs the full body).
+        """
+        if self.cassette is not None:
+            yield from self._buffered_items(self.request("GET", path, auth=auth, **kwargs), key)
+            return
+
+        headers, correlation_id = self._stream_headers(kwargs.pop("headers", None))
+        if auth:
+            headers.update(self._auth_headers())
+        timer = PhaseTimer()
+        req = self.http.build_request(
+            "GET",
+            path,
+            headers=headers,
+            **self._attempt_kwargs(self.retry_policy.start(), kwargs, trace=timer),
+        )
+        wait = self._rate_limit_wait(req, correlation_id=correlation_id)
+        if wait > 0:
+            time.sleep(wait)
+
+        breaker = self._breaker(req)
+        self.retry_policy.record_attempt()
+        start = time.perf_counter()
+        resp: httpx.Response | None = None
+        error: Exception | None = None
+        trial = None
+        try:
+            if breaker is not None:
+                trial = breaker.before_request()
+            resp = self.http.send(req, stream=True)
+            if resp.is_error:
+                resp.read()
+                resp.raise_for_status()
+            parser = JsonItemStream(key)
+            for chunk in resp.iter_bytes(chunk_size):
+                yield from parser.feed(chunk)
+            yield from parser.close()
+        except Exception as exc:  # not GeneratorExit: stopping early is not a failure
+            error = exc
+            raise
+        finally:
+            if resp is not None:
+                resp.close()
+            self._stream_finished(
+                req,
+                resp,
+                correlation_id=correlation_id,
+                breaker=breaker,
+                timer=timer,
+                start=start,
+                exc=error,
+            )
+            if breaker is not None:
+                breaker.release_trial(trial)
+
+
+class AsyncApiClient(_BaseApiClient):
+    """
+    Async twin of ApiClient (httpx.AsyncClient).
+
+    Same behavior per logical request (correlation id, backoff, redacted debug logs,
+    auth=True header injection). On top of that:
+    - one shared connection pool sized by MAX_CONCURRENCY
+    - a semaphore bounding in-flight requests, so tests can asyncio.gather() hundreds
+      of calls without opening unbounded sockets (retry sleeps don't hold a slot)
+    """
+
+    def __init__(self, settings: Settings, *, max_concurrency: int | None = None):
+        super().__init__(settings)
+
+        self.max_concurrency = int(max_concurrency or settings.max_concurrency)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        self.http = httpx.AsyncClient(
+            **self._http_options(),
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            ),
+        )
+        self.auth = AsyncAuthClient(settings, self.http)
+        if settings.single_flight_enabled:
+            self.single_flight = AsyncSingleFlight(share=self._copy_response)
+
+    async def aclose(self) -> None:
+        await self.http.aclose()
+        self._close_cassette()
+
+    async def __aenter__(self) -> AsyncApiClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def _auth_headers(self) -> dict[str, str]:
+        return self._bearer_headers(await self.auth.get_token())
+
+    async def _rate_limit_wait_async(self, req: httpx.Request, *, correlation_id: str) -> float:
+        limiter = self.rate_limiter
+        if limiter is None or not limiter.shared:
+            return self._rate_limit_wait(req, correlation_id=correlation_id)
+        # The shared store flocks a file: keep that off the event loop
+        wait = await asyncio.to_thread(limiter.acquire, req.url.path)
+        return self._rate_limit_logged(wait, correlation_id)
+
+    # -----------------------
+    # HTTP
+    # -----------------------
+
+    async def request(
+        self, method: str, path: str, *, auth: bool = False, **kwargs
+    ) -> httpx.Response:
+        """
+        Async version of ApiClient.request (same retry + debug kit semantics).
+        """
+        kwargs = self._encode_json(kwargs)
+        initial_headers = dict(kwargs.pop("headers", {}) or {})
+
+        correlation_id = (
+            initial_headers.get(self.correlation_header_name) or self._new_correlation_id()
+        )
+
+        if self._replaying():
+            return self._replay(
+                method, path, headers=initial_headers, correlation_id=correlation_id, **kwargs
+            )
+
+        key = None
+        if self._dedupe_enabled():
+            probe_headers = {**initial_headers, **(await self._auth_headers() if auth else {})}
+            key, cached = self._cache_lookup(
+                method, path, headers=probe_headers, correlation_id=correlation_id, **kwargs
+            )
+            if cached is not None:
+                return cached
+
+        revalidation = (
+            self.revalidation if self._revalidates(method, key, initial_headers) else None
+        )
+        if revalidation is not None:
+            initial_headers = {**revalidation.conditional_headers(key), **initial_headers}
+
+        async def send() -> httpx.Response:
+            resp = await self._send_with_retries(
+                method,
+                path,
+                auth=auth,
+                initial_headers=initial_headers,
+                correlation_id=correlation_id,
+                **kwargs,
+            )
+            return revalidation.resolve(key, resp) if revalidation is not None else resp
+
+        start = time.perf_counter()
+        try:
+            if key is not None and isinstance(self.single_flight, AsyncSingleFlight):
+                resp = await self.single_flight.do(key, send)
+            else:
+                resp = await send()
+        finally:
+            self._record_latency(method, path, start)
+        if key is not None and self.cache is not None and method.upper() == "GET":
+            self.cache.put(key, resp)
+        return resp
+
+    async def _send_with_retries(
+        self,
+        method: str,
+        path: str,
+        *,
+        auth: bool,
+        initial_headers: dict[str, str],
+        correlation_id: str,
+        **kwargs,
+    ) -> httpx.Response:
+        retry = self.retry_policy.start()
+
+        for attempt_num in range(1, self.retry_policy.max_attempts + 1):
+            headers = dict(initial_headers)
+            headers[self.correlation_header_name] = correlation_id
+
+            if auth:
+                headers.update(await self._auth_headers())
+
+            timer = PhaseTimer()
+            req = self.http.build_request(
+                method,
+                path,
+                headers=headers,
+                **self._attempt_kwargs(retry, kwargs, trace=timer.atrace),
+            )
+
+            # Wait for a token before taking a concurrency slot.
+            wait = await self._rate_limit_wait_async(req, correlation_id=correlation_id)
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            breaker = self._breaker(req)
+            self.retry_policy.record_attempt()
+            start = time.perf_counter()
+            trial = None
+            try:
+                if breaker is not None:
+                    trial = breaker.before_request()
+                async with self._semaphore:
+                    # Duration covers the network call only, not time queued on the semaphore.
+                    start = time.perf_counter()
+                    resp = await self.http.send(req)
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                duration_ms = int(elapsed_ms)
+                self._record_timings(req, resp, timer, elapsed_ms)
+                self._breaker_observe(breaker, resp)
+                self._rate_limit_observe(req, resp)
+                self._record(req, resp)
+                self._log_request(
+                    req, resp, correlation_id=correlation_id, attempt=attempt_num, start=start
+                )
+
+                self._safe_log(
+                    req,
+                    resp,
+                    correlation_id=correlation_id,
+                    duration_ms=duration_ms,
+                    retry_attempt=attempt_num,
+                )
+                return resp
+
+            except RETRYABLE_EXCEPTIONS as exc:
+                duration_ms = int((time.perf_counter() - start) * 1000)
+                self._breaker_failed(breaker, exc)
+                self._log_request(
+                    req,
+                    None,
+                    correlation_id=correlation_id,
+                    attempt=attempt_num,
+                    start=start,
+                    exc=exc,
+                )
+
+                self._safe_log(
+                    req,
+                    None,
+                    correlation_id=correlation_id,
+                    duration_ms=duration_ms,
+                    retry_attempt=attempt_num,
+                )
+                self._log_attempt_failed(
+                    correlation_id=correlation_id,
+                    retry_attempt=attempt_num,
+                    duration_ms=duration_ms,
+                    exc=exc,
+                )
+
+                sleep_seconds = self.retry_policy.decide(
+                    retry, attempt_num, circuit_open=breaker is not None and breaker.is_open
+                )
+                if sleep_seconds is None:
+                    self._log_give_up(
+                        correlation_id=correlation_id,
+                        attempts=attempt_num,
+                        exc=exc,
+                        reason=retry.give_up_reason,
+                    )
+                    raise
+
+                self._log_retry_sleep(
+                    correlation_id=correlation_id,
+                    retry_attempt=attempt_num,
+                    sleep_seconds=sleep_seconds,
+                )
+                await asyncio.sleep(sleep_seconds)
+
+            except Exception as exc:
+                duration_ms = int((time.perf_counter() - start) * 1000)
+                self._breaker_failed(breaker, exc)
+                self._log_request(
+                    req,
+                    None,
+                    correlation_id=correlation_id,
+                    attempt=attempt_num,
+                    start=start,
+                    exc=exc,
+                )
+
+                self._safe_log(
+                    req,
+                    None,
+                    correlation_id=correlation_id,
+                    duration_ms=duration_ms,
+                    retry_attempt=attempt_num,
+                )
+                self._log_give_up(correlation_id=correlation_id, attempts=attempt_num, exc=exc)
+                raise
+
+            finally:
+                # A half-open trial ended without an outcome (e.g. cancelled) frees its slot
+                if breaker is not None:
+                    breaker.release_trial(trial)
+
+        raise RuntimeError("Request failed without an exception (unexpected)")
+
+    async def get(self, path: str, *, auth: bool = False, **kwargs) -> httpx.Response:
+        return await self.request("GET", path, auth=auth, **kwargs)
+
+    async def post(self, path: str, *, auth: bool = False, **kwargs) -> httpx.Response:
+        return await self.request("POST", path, auth=auth, **kwargs)
+
+    async def stream_items(
+        self,
+        path: str,
+        *,
+        key: str | None = None,
+        auth: bool = False,
+        chunk_size: int = 65_536,
+        **kwargs,
+    ) -> AsyncIterator[Any]:
+        """Async version of ApiClient.stream_items (the semaphore is held until headers)."""
+        if self.cassette is not None:
+            resp = await self.request("GET", path, auth=auth, **kwargs)
+            for item in self._buffered_items(resp, key):
+                yield item
+            return
+
+        headers, correlation_id = self._stream_headers(kwargs.pop("headers", None))
+        if auth:
+            headers.update(await self._auth_headers())
+        timer = PhaseTimer()
+        req = self.http.build_request(
+            "GET",
+            path,
+            headers=headers,
+            **self._attempt_kwargs(self.retry_policy.start(), kwargs, trace=timer.atrace),
+        )
+        wait = await self._rate_limit_wait_async(req, correlation_id=correlation_id)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        breaker = self._breaker(req)
+        self.retry_policy.record_attempt()
+        start = time.perf_counter()
+        resp: httpx.Response | None = None
+        error: Exception | None = None
+        trial = None
+        try:
+            if breaker is not None:
+                trial = breaker.before_request()
+            async with self._semaphore:
+                start = time.perf_counter()
+                resp = await self.http.send(req, stream=True)
+            if resp.is_error:
+                await resp.aread()
+                resp.raise_for_status()
+            parser = JsonItemStream(key)
+            async for chunk in resp.aiter_bytes(chunk_size):
+                for item in parser.feed(chunk):
+                    yield item
+            for item in parser.close():
+                yield item
+        except Exception as exc:  # not GeneratorExit: stopping early is not a failure
+            error = exc
+            raise
+        finally:
+            if resp is not None:
+                await resp.aclose()
+            self._stream_finished(
+                req,
+                resp,
+                correlation_id=correlation_id,
+                breaker=breaker,
+                timer=timer,
+                start=start,
+                exc=error,
+            )
+            if breaker is not None:
+                breaker.release_trial(trial)
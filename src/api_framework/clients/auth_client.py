@@ -4,10 +4,10 @@ from typing import Any
 
 import httpx
 
-from api_framework.client import ApiClient
+from api_framework.clients.base import AsyncDomainClient, DomainClient, endpoint
 
 
-class AuthApiClient:
+class AuthApiClient(DomainClient):
     """
     Domain client for DummyJSON Auth endpoints:
       - POST /auth/login
@@ -19,13 +19,11 @@ class AuthApiClient:
       - raw methods -> return Response -> use in negative tests
     """
 
-    def __init__(self, api: ApiClient):
-        self.api = api
-
     # -----------------------
     # STRICT methods (positive)
     # -----------------------
 
+    @endpoint
     def login(
         self, *, username: str, password: str, expires_in_mins: int | None = None
     ) -> dict[str, Any]:
@@ -33,28 +31,25 @@ class AuthApiClient:
         if expires_in_mins is not None:
             payload["expiresInMins"] = expires_in_mins
 
-        r = self.api.post("/auth/login", json=payload)
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.post("/auth/login", json=payload))
 
+    @endpoint
     def me(self) -> dict[str, Any]:
-        r = self.api.get("/auth/me", auth=True)
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.get("/auth/me", auth=True))
 
+    @endpoint
     def refresh(self, *, refresh_token: str, expires_in_mins: int | None = None) -> dict[str, Any]:
         payload: dict[str, Any] = {"refreshToken": refresh_token}
         if expires_in_mins is not None:
             payload["expiresInMins"] = expires_in_mins
 
-        r = self.api.post("/auth/refresh", json=payload)
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.post("/auth/refresh", json=payload))
 
     # -----------------------
     # RAW methods (negative)
     # -----------------------
 
+    @endpoint
     def login_raw(
         self, *, username: str, password: str, expires_in_mins: int | None = None
     ) -> httpx.Response:
@@ -63,13 +58,16 @@ class AuthApiClient:
             payload["expiresInMins"] = expires_in_mins
         return self.api.post("/auth/login", json=payload)
 
+    @endpoint
     def me_raw(self) -> httpx.Response:
         return self.api.get("/auth/me", auth=True)
 
+    @endpoint
     def me_with_token_raw(self, token_value: str) -> httpx.Response:
         # Send the token explicitly, bypassing framework auth helper.
         return self.api.get("/auth/me", headers={"Authorization": token_value})
 
+    @endpoint
     def refresh_raw(
         self, *, refresh_token: str, expires_in_mins: int | None = None
     ) -> httpx.Response:
@@ -77,3 +75,7 @@ class AuthApiClient:
         if expires_in_mins is not None:
             payload["expiresInMins"] = expires_in_mins
         return self.api.post("/auth/refresh", json=payload)
+
+
+class AsyncAuthApiClient(AsyncDomainClient, AuthApiClient):
+    pass
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Concatenate, Generic, ParamSpec, TypeVar, overload
+
+import httpx
+
+from api_framework.client import ApiClient, AsyncApiClient
+
+
+@dataclass
+class BulkResult:
+    """
+    Outcome of a get_many() fan-out.
+    - items: one entry per requested id, in request order (None where the lookup failed)
+    - errors: id -> exception for every failed lookup (nothing is raised)
+    """
+
+    ids: list[Any]
+    items: list[Any]
+    errors: dict[Any, Exception] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+P = ParamSpec("P")
+R = TypeVar("R")
+T = TypeVar("T")
+
+
+class endpoint(Generic[P, R]):
+    """
+    Declares a domain endpoint once, on the sync client:
+        @endpoint
+        def get_user(self, user_id: int) -> dict[str, Any]: ...
+
+    At runtime it behaves like the plain function. For type checkers the bound method is
+    `Callable[P, R]` on a DomainClient and `Callable[P, Awaitable[R]]` on an
+    AsyncDomainClient, so the Async* classes need no restated signatures.
+    """
+
+    def __init__(self, fn: Callable[Concatenate[Any, P], R]):
+        self.fn = fn
+
+    @overload
+    def __get__(self, obj: None, owner: type | None = None) -> Callable[Concatenate[Any, P], R]: ...
+    @overload
+    def __get__(
+        self, obj: AsyncDomainClient, owner: type | None = None
+    ) -> Callable[P, Awaitable[R]]: ...
+    @overload
+    def __get__(self, obj: DomainClient, owner: type | None = None) -> Callable[P, R]: ...
+    def __get__(self, obj: Any, owner: type | None = None) -> Any:
+        return self.fn.__get__(obj, owner)
+
+
+class items_endpoint(Generic[P, T]):
+    """
+    `endpoint` for iter_* / stream_* methods: an `Iterator[T]` on a DomainClient,
+    an `AsyncIterator[T]` on an AsyncDomainClient.
+    """
+
+    def __init__(self, fn: Callable[Concatenate[Any, P], Iterator[T]]):
+        self.fn = fn
+
+    @overload
+    def __get__(
+        self, obj: None, owner: type | None = None
+    ) -> Callable[Concatenate[Any, P], Iterator[T]]: ...
+    @overload
+    def __get__(
+        self, obj: AsyncDomainClient, owner: type | None = None
+    ) -> Callable[P, AsyncIterator[T]]: ...
+    @overload
+    def __get__(self, obj: DomainClient, owner: type | None = None) -> Callable[P, Iterator[T]]: ...
+    def __get__(self, obj: Any, owner: type | None = None) -> Any:
+        return self.fn.__get__(obj, owner)
+
+
+class DomainClient:
+    """
+    Base for domain clients.
+
+    Each domain client defines its endpoints once, decorated with @endpoint:
+      - raw methods -> return whatever `self.api.<verb>()` returns
+      - strict methods -> wrap the raw call in `self._strict(...)`
+
+    With an ApiClient that is a Response / parsed JSON. The Async* variants mix in
+    AsyncDomainClient, which makes `_strict` awaitable, so the same endpoint
+    definitions work unchanged on top of AsyncApiClient (and @endpoint gives them
+    the awaitable return types).
+
+    List resources also get, per resource (iter_* / stream_* use @items_endpoint):
+      - iter_<resource>(page_size=, prefetch=) -> every item across all pages (_paginate)
+      - stream_<resource>(chunk_size=) -> every item of one `limit=0` response, decoded as
+        it arrives (ApiClient.stream_items)
+      - list_<resource>_typed() / get_<entity>_typed() -> models.Page / model instances
+        (validate=True: type-checked while decoding)
+      - get_many(ids, concurrency=) -> BulkResult: ordered items + per-id errors (_get_many)
+    """
+
+    def __init__(self, api: ApiClient):
+        self.api = api
+
+    def _strict(self, resp: httpx.Response, transform: Callable[[Any], Any] | None = None) -> Any:
+        resp.raise_for_status()
+        data = self.api.decode(resp)
+        return transform(data) if transform else data
+
+    def _paginate(
+        self,
+        path: str,
+        key: str,
+        *,
+        page_size: int = 100,
+        prefetch: bool = False,
+        params: dict[str, Any] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Walk a DummyJSON `limit/skip` list endpoint lazily, one item at a time.
+        - `total` is read from the first page; the walk stops there (or on an empty page)
+        - prefetch=True fetches page N+1 on a background thread while page N is consumed
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+
+        def fetch_page(skip: int) -> dict[str, Any]:
+            page_params = {**(params or {}), "limit": page_size, "skip": skip}
+            return self._strict(self.api.get(path, params=page_params))
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            page = fetch_page(0)
+            total = int(page.get("total", 0))
+            skip = 0
+            while True:
+                items = page.get(key) or []
+                # Step by what the server actually returned (it may cap `limit`).
+                next_skip = skip + len(items)
+                has_next = bool(items) and next_skip < total
+
+                pending: Future[dict[str, Any]] | None = None
+                if executor is not None and has_next:
+                    pending = executor.submit(fetch_page, next_skip)
+
+                yield from items
+
+                if not has_next:
+                    return
+                page = pending.result() if pending is not None else fetch_page(next_skip)
+                skip = next_skip
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def _get_many(
+        self, fetch: Callable[[Any], Any], ids: Iterable[Any], *, concurrency: int = 8
+    ) -> BulkResult:
+        """
+        Fan `fetch(id)` out over a thread pool (at most `concurrency` in flight).
+        Order is preserved and failures are collected per id instead of stopping the batch.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+
+        id_list = list(ids)
+        result = BulkResult(ids=id_list, items=[None] * len(id_list))
+        if not id_list:
+            return result
+
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(id_list))) as executor:
+            futures = [executor.submit(fetch, item_id) for item_id in id_list]
+            for idx, fut in enumerate(futures):
+                try:
+                    result.items[idx] = fut.result()
+                except Exception as exc:
+                    result.errors[id_list[idx]] = exc
+
+        return result
+
+
+class AsyncDomainClient:
+    """
+    Mixin turning a DomainClient subclass into its async variant:
+        class AsyncUsersClient(AsyncDomainClient, UsersClient): ...
+
+    Raw methods return awaitables (AsyncApiClient.request is a coroutine);
+    strict methods return awaitables resolving to the parsed JSON; iter_* / stream_*
+    return async iterators. The endpoint / items_endpoint descriptors carry those types
+    over from the sync declarations.
+    """
+
+    def __init__(self, api: AsyncApiClient):
+        self.api = api
+
+    def _strict(
+        self,
+        resp: Awaitable[httpx.Response],
+        transform: Callable[[Any], Any] | None = None,
+    ) -> Awaitable[Any]:
+        async def _resolve() -> Any:
+            r = await resp
+            r.raise_for_status()
+            data = self.api.decode(r)
+            return transform(data) if transform else data
+
+        return _resolve()
+
+    async def _paginate(
+        self,
+        path: str,
+        key: str,
+        *,
+        page_size: int = 100,
+        prefetch: bool = False,
+        params: dict[str, Any] | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Async-generator version of DomainClient._paginate
+        (prefetch=True schedules page N+1 as a task while page N is consumed).
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+
+        async def fetch_page(skip: int) -> dict[str, Any]:
+            page_params = {**(params or {}), "limit": page_size, "skip": skip}
+            return await self._strict(self.api.get(path, params=page_params))
+
+        pending: asyncio.Task[dict[str, Any]] | None = None
+        try:
+            page = await fetch_page(0)
+            total = int(page.get("total", 0))
+            skip = 0
+            while True:
+                items = page.get(key) or []
+                next_skip = skip + len(items)
+                has_next = bool(items) and next_skip < total
+
+                if prefetch and has_next:
+                    pending = asyncio.create_task(fetch_page(next_skip))
+
+                for item in items:
+                    yield item
+
+                if not has_next:
+                    return
+                if pending is not None:
+                    page = await pending
+                    pending = None
+                else:
+                    page = await fetch_page(next_skip)
+                skip = next_skip
+        finally:
+            if pending is not None:
+                # Stopped early or failed: drop the prefetch, but don't leave it running or
+                # with an exception nobody retrieves ("Task exception was never retrieved").
+                pending.cancel()
+                await asyncio.wait([pending])
+                if not pending.cancelled():
+                    pending.exception()
+
+    async def _get_many(
+        self,
+        fetch: Callable[[Any], Awaitable[Any]],
+        ids: Iterable[Any],
+        *,
+        concurrency: int = 8,
+    ) -> BulkResult:
+        """
+        Event-loop version of DomainClient._get_many (semaphore-bounded gather).
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+
+        id_list = list(ids)
+        result = BulkResult(ids=id_list, items=[None] * len(id_list))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded(item_id: Any) -> Any:
+            async with semaphore:
+                return await fetch(item_id)
+
+        outcomes = await asyncio.gather(
+            *(bounded(item_id) for item_id in id_list), return_exceptions=True
+        )
+        for idx, outcome in enumerate(outcomes):
+            if isinstance(outcome, Exception):
+                result.errors[id_list[idx]] = outcome
+            else:
+                result.items[idx] = outcome
+
+        return result
@@ -1,68 +1,107 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
+from functools import partial
 from typing import Any
 
 import httpx
 
-from api_framework.client import ApiClient
+from api_framework.clients.base import (
+    AsyncDomainClient,
+    BulkResult,
+    DomainClient,
+    endpoint,
+    items_endpoint,
+)
+from api_framework.models import Cart, Page, decode, decode_page
 
 
-class CartsClient:
-    def __init__(self, api: ApiClient):
-        self.api = api
-
+class CartsClient(DomainClient):
     # -----------------------
     # Happy path (returns JSON)
     # -----------------------
 
+    @endpoint
     def list_carts(self, *, limit: int = 30, skip: int = 0) -> dict[str, Any]:
-        r = self.list_carts_raw(limit=limit, skip=skip)
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.list_carts_raw(limit=limit, skip=skip))
 
-    def get_cart(self, cart_id: int) -> dict[str, Any]:
-        r = self.get_cart_raw(cart_id)
-        r.raise_for_status()
-        return r.json()
+    @items_endpoint
+    def iter_carts(
+        self, *, page_size: int = 100, prefetch: bool = False
+    ) -> Iterator[dict[str, Any]]:
+        return self._paginate("/carts", "carts", page_size=page_size, prefetch=prefetch)
+
+    @items_endpoint
+    def stream_carts(self, *, chunk_size: int = 65_536) -> Iterator[dict[str, Any]]:
+        return self.api.stream_items(
+            "/carts", key="carts", params={"limit": 0}, chunk_size=chunk_size
+        )
 
+    @endpoint
+    def get_cart(self, cart_id: int) -> dict[str, Any]:
+        return self._strict(self.get_cart_raw(cart_id))
+
+    @endpoint
+    def list_carts_typed(
+        self, *, limit: int = 30, skip: int = 0, validate: bool = False
+    ) -> Page[Cart]:
+        return self._strict(
+            self.list_carts_raw(limit=limit, skip=skip),
+            partial(decode_page, Cart, key="carts", validate=validate),
+        )
+
+    @endpoint
+    def get_cart_typed(self, cart_id: int, *, validate: bool = False) -> Cart:
+        return self._strict(self.get_cart_raw(cart_id), partial(decode, Cart, validate=validate))
+
+    @endpoint
+    def get_many(self, cart_ids: Iterable[int], *, concurrency: int = 8) -> BulkResult:
+        return self._get_many(self.get_cart, cart_ids, concurrency=concurrency)
+
+    @endpoint
     def carts_by_user(self, user_id: int) -> dict[str, Any]:
-        r = self.carts_by_user_raw(user_id)
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.carts_by_user_raw(user_id))
 
+    @endpoint
     def add_cart(self, payload: dict[str, Any]) -> dict[str, Any]:
-        r = self.add_cart_raw(payload)
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.add_cart_raw(payload))
 
+    @endpoint
     def update_cart(self, cart_id: int, payload: dict[str, Any]) -> dict[str, Any]:
-        r = self.update_cart_raw(cart_id, payload)
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.update_cart_raw(cart_id, payload))
 
+    @endpoint
     def delete_cart(self, cart_id: int) -> dict[str, Any]:
-        r = self.delete_cart_raw(cart_id)
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.delete_cart_raw(cart_id))
 
     # -----------------------
     # Raw helpers
     # -----------------------
 
+    @endpoint
     def list_carts_raw(self, *, limit: int = 30, skip: int = 0) -> httpx.Response:
         return self.api.get("/carts", params={"limit": limit, "skip": skip})
 
+    @endpoint
     def get_cart_raw(self, cart_id: int) -> httpx.Response:
         return self.api.get(f"/carts/{cart_id}")
 
+    @endpoint
     def carts_by_user_raw(self, user_id: int) -> httpx.Response:
         return self.api.get(f"/carts/user/{user_id}")
 
+    @endpoint
     def add_cart_raw(self, payload: dict[str, Any]) -> httpx.Response:
         return self.api.post("/carts/add", json=payload)
 
+    @endpoint
     def update_cart_raw(self, cart_id: int, payload: dict[str, Any]) -> httpx.Response:
         return self.api.request("PUT", f"/carts/{cart_id}", json=payload)
 
+    @endpoint
     def delete_cart_raw(self, cart_id: int) -> httpx.Response:
         return self.api.request("DELETE", f"/carts/{cart_id}")
+
+
+class AsyncCartsClient(AsyncDomainClient, CartsClient):
+    pass
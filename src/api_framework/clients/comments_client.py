@@ -1,57 +1,94 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
+from functools import partial
 from typing import Any
 
 import httpx
 
-from api_framework.client import ApiClient
+from api_framework.clients.base import (
+    AsyncDomainClient,
+    BulkResult,
+    DomainClient,
+    endpoint,
+    items_endpoint,
+)
+from api_framework.models import Comment, Page, decode, decode_page
 
 
-class CommentsClient:
-    def __init__(self, api: ApiClient):
-        self.api = api
-
+class CommentsClient(DomainClient):
     # -----------------------
     # READ
     # -----------------------
+    @endpoint
     def list_comments(self, *, limit: int = 30, skip: int = 0) -> dict[str, Any]:
-        r = self.api.get("/comments", params={"limit": limit, "skip": skip})
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.get("/comments", params={"limit": limit, "skip": skip}))
+
+    @items_endpoint
+    def iter_comments(
+        self, *, page_size: int = 100, prefetch: bool = False
+    ) -> Iterator[dict[str, Any]]:
+        return self._paginate("/comments", "comments", page_size=page_size, prefetch=prefetch)
 
+    @items_endpoint
+    def stream_comments(self, *, chunk_size: int = 65_536) -> Iterator[dict[str, Any]]:
+        return self.api.stream_items(
+            "/comments", key="comments", params={"limit": 0}, chunk_size=chunk_size
+        )
+
+    @endpoint
     def get_comment(self, comment_id: int) -> dict[str, Any]:
-        r = self.api.get(f"/comments/{comment_id}")
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.get(f"/comments/{comment_id}"))
+
+    @endpoint
+    def list_comments_typed(
+        self, *, limit: int = 30, skip: int = 0, validate: bool = False
+    ) -> Page[Comment]:
+        return self._strict(
+            self.api.get("/comments", params={"limit": limit, "skip": skip}),
+            partial(decode_page, Comment, key="comments", validate=validate),
+        )
 
+    @endpoint
+    def get_comment_typed(self, comment_id: int, *, validate: bool = False) -> Comment:
+        return self._strict(
+            self.api.get(f"/comments/{comment_id}"), partial(decode, Comment, validate=validate)
+        )
+
+    @endpoint
+    def get_many(self, comment_ids: Iterable[int], *, concurrency: int = 8) -> BulkResult:
+        return self._get_many(self.get_comment, comment_ids, concurrency=concurrency)
+
+    @endpoint
     def comments_by_post(self, post_id: int) -> dict[str, Any]:
-        r = self.api.get(f"/comments/post/{post_id}")
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.get(f"/comments/post/{post_id}"))
 
     # -----------------------
     # WRITE (DummyJSON is "mocked" but returns shapes)
     # -----------------------
+    @endpoint
     def add_comment(self, payload: dict[str, Any]) -> dict[str, Any]:
-        r = self.api.post("/comments/add", json=payload)
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.post("/comments/add", json=payload))
 
+    @endpoint
     def update_comment(self, comment_id: int, payload: dict[str, Any]) -> dict[str, Any]:
-        r = self.api.request("PUT", f"/comments/{comment_id}", json=payload)
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.request("PUT", f"/comments/{comment_id}", json=payload))
 
+    @endpoint
     def delete_comment(self, comment_id: int) -> dict[str, Any]:
-        r = self.api.request("DELETE", f"/comments/{comment_id}")
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.request("DELETE", f"/comments/{comment_id}"))
 
     # -----------------------
     # RAW helpers for negative tests (no raise_for_status)
     # -----------------------
+    @endpoint
     def get_comment_raw(self, comment_id: int) -> httpx.Response:
         return self.api.get(f"/comments/{comment_id}")
 
+    @endpoint
     def comments_by_post_raw(self, post_id: int) -> httpx.Response:
         return self.api.get(f"/comments/post/{post_id}")
+
+
+class AsyncCommentsClient(AsyncDomainClient, CommentsClient):
+    pass
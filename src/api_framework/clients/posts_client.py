@@ -1,51 +1,88 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
+from functools import partial
 from typing import Any
 
 import httpx
 
-from api_framework.client import ApiClient
+from api_framework.clients.base import (
+    AsyncDomainClient,
+    BulkResult,
+    DomainClient,
+    endpoint,
+    items_endpoint,
+)
+from api_framework.models import Page, Post, decode, decode_page
 
 
-class PostsClient:
-    def __init__(self, api: ApiClient):
-        self.api = api
-
+class PostsClient(DomainClient):
+    @endpoint
     def list_posts(self, *, limit: int = 30, skip: int = 0) -> dict[str, Any]:
-        r = self.api.get("/posts", params={"limit": limit, "skip": skip})
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.get("/posts", params={"limit": limit, "skip": skip}))
+
+    @items_endpoint
+    def iter_posts(
+        self, *, page_size: int = 100, prefetch: bool = False
+    ) -> Iterator[dict[str, Any]]:
+        return self._paginate("/posts", "posts", page_size=page_size, prefetch=prefetch)
 
+    @items_endpoint
+    def stream_posts(self, *, chunk_size: int = 65_536) -> Iterator[dict[str, Any]]:
+        return self.api.stream_items(
+            "/posts", key="posts", params={"limit": 0}, chunk_size=chunk_size
+        )
+
+    @endpoint
     def get_post(self, post_id: int) -> dict[str, Any]:
-        r = self.api.get(f"/posts/{post_id}")
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.get(f"/posts/{post_id}"))
+
+    @endpoint
+    def list_posts_typed(
+        self, *, limit: int = 30, skip: int = 0, validate: bool = False
+    ) -> Page[Post]:
+        return self._strict(
+            self.api.get("/posts", params={"limit": limit, "skip": skip}),
+            partial(decode_page, Post, key="posts", validate=validate),
+        )
 
+    @endpoint
+    def get_post_typed(self, post_id: int, *, validate: bool = False) -> Post:
+        return self._strict(
+            self.api.get(f"/posts/{post_id}"), partial(decode, Post, validate=validate)
+        )
+
+    @endpoint
+    def get_many(self, post_ids: Iterable[int], *, concurrency: int = 8) -> BulkResult:
+        return self._get_many(self.get_post, post_ids, concurrency=concurrency)
+
+    @endpoint
     def search_posts(self, *, q: str) -> dict[str, Any]:
-        r = self.api.get("/posts/search", params={"q": q})
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.get("/posts/search", params={"q": q}))
 
+    @endpoint
     def add_post(self, payload: dict[str, Any]) -> dict[str, Any]:
-        r = self.api.post("/posts/add", json=payload)
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.post("/posts/add", json=payload))
 
+    @endpoint
     def update_post(self, post_id: int, payload: dict[str, Any]) -> dict[str, Any]:
-        r = self.api.request("PUT", f"/posts/{post_id}", json=payload)
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.request("PUT", f"/posts/{post_id}", json=payload))
 
+    @endpoint
     def delete_post(self, post_id: int) -> dict[str, Any]:
-        r = self.api.request("DELETE", f"/posts/{post_id}")
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.request("DELETE", f"/posts/{post_id}"))
 
     # -----------------------
     # RAW helpers
     # -----------------------
+    @endpoint
     def get_post_raw(self, post_id: int) -> httpx.Response:
         return self.api.get(f"/posts/{post_id}")
 
+    @endpoint
     def search_posts_raw(self, *, q: str) -> httpx.Response:
         return self.api.get("/posts/search", params={"q": q})
+
+
+class AsyncPostsClient(AsyncDomainClient, PostsClient):
+    pass
@@ -1,46 +1,98 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
+from functools import partial
 from typing import Any
 
 import httpx
 
-from api_framework.client import ApiClient
+from api_framework.clients.base import (
+    AsyncDomainClient,
+    BulkResult,
+    DomainClient,
+    endpoint,
+    items_endpoint,
+)
+from api_framework.models import Page, Product, decode, decode_page
 
 
-class ProductsClient:
-    def __init__(self, api: ApiClient):
-        self.api = api
+def _category_slugs(data: Any) -> list[str]:
+    if not isinstance(data, list):
+        raise AssertionError(f"Expected list for categories, got: {type(data)}")
 
+    slugs: list[str] = []
+    for item in data:
+        if isinstance(item, str):
+            slugs.append(item)
+        elif isinstance(item, dict):
+            slug = item.get("slug") or item.get("name")
+            if isinstance(slug, str) and slug.strip():
+                slugs.append(slug.strip())
+        # else ignore unknown shapes
+
+    if not slugs:
+        raise AssertionError("No category slugs found in /products/categories response")
+
+    return slugs
+
+
+class ProductsClient(DomainClient):
+    @endpoint
     def list_products(self, *, limit: int = 30, skip: int = 0) -> dict[str, Any]:
-        r = self.api.get("/products", params={"limit": limit, "skip": skip})
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.get("/products", params={"limit": limit, "skip": skip}))
 
-    def get_product(self, product_id: int) -> dict[str, Any]:
-        r = self.api.get(f"/products/{product_id}")
-        r.raise_for_status()
-        return r.json()
+    @items_endpoint
+    def iter_products(
+        self, *, page_size: int = 100, prefetch: bool = False
+    ) -> Iterator[dict[str, Any]]:
+        return self._paginate("/products", "products", page_size=page_size, prefetch=prefetch)
+
+    @items_endpoint
+    def stream_products(self, *, chunk_size: int = 65_536) -> Iterator[dict[str, Any]]:
+        return self.api.stream_items(
+            "/products", key="products", params={"limit": 0}, chunk_size=chunk_size
+        )
 
+    @endpoint
+    def get_product(self, product_id: int) -> dict[str, Any]:
+        return self._strict(self.api.get(f"/products/{product_id}"))
+
+    @endpoint
+    def list_products_typed(
+        self, *, limit: int = 30, skip: int = 0, validate: bool = False
+    ) -> Page[Product]:
+        return self._strict(
+            self.api.get("/products", params={"limit": limit, "skip": skip}),
+            partial(decode_page, Product, key="products", validate=validate),
+        )
+
+    @endpoint
+    def get_product_typed(self, product_id: int, *, validate: bool = False) -> Product:
+        return self._strict(
+            self.api.get(f"/products/{product_id}"), partial(decode, Product, validate=validate)
+        )
+
+    @endpoint
+    def get_many(self, product_ids: Iterable[int], *, concurrency: int = 8) -> BulkResult:
+        return self._get_many(self.get_product, product_ids, concurrency=concurrency)
+
+    @endpoint
     def search_products(self, *, q: str) -> dict[str, Any]:
-        r = self.api.get("/products/search", params={"q": q})
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.get("/products/search", params={"q": q}))
 
+    @endpoint
     def add_product(self, payload: dict[str, Any]) -> dict[str, Any]:
-        r = self.api.post("/products/add", json=payload)
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.post("/products/add", json=payload))
 
+    @endpoint
     def update_product(self, product_id: int, payload: dict[str, Any]) -> dict[str, Any]:
-        r = self.api.request("PUT", f"/products/{product_id}", json=payload)
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.request("PUT", f"/products/{product_id}", json=payload))
 
+    @endpoint
     def delete_product(self, product_id: int) -> dict[str, Any]:
-        r = self.api.request("DELETE", f"/products/{product_id}")
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.request("DELETE", f"/products/{product_id}"))
 
+    @endpoint
     def list_categories(self) -> list[str]:
         """
         DummyJSON categories shape can vary:
@@ -48,41 +100,27 @@ class ProductsClient:
         - list[{"slug": "...", "name": "...", "url": "..."}]
         Normalize to list[str] of slugs.
         """
-        r = self.api.get("/products/categories")
-        r.raise_for_status()
-        data = r.json()
-
-        if not isinstance(data, list):
-            raise AssertionError(f"Expected list for categories, got: {type(data)}")
-
-        slugs: list[str] = []
-        for item in data:
-            if isinstance(item, str):
-                slugs.append(item)
-            elif isinstance(item, dict):
-                slug = item.get("slug") or item.get("name")
-                if isinstance(slug, str) and slug.strip():
-                    slugs.append(slug.strip())
-            # else ignore unknown shapes
-
-        if not slugs:
-            raise AssertionError("No category slugs found in /products/categories response")
-
-        return slugs
+        return self._strict(self.api.get("/products/categories"), _category_slugs)
 
+    @endpoint
     def products_by_category(self, category_slug: str) -> dict[str, Any]:
-        r = self.api.get(f"/products/category/{category_slug}")
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.get(f"/products/category/{category_slug}"))
 
     # -----------------------
     # RAW helpers
     # -----------------------
+    @endpoint
     def get_product_raw(self, product_id: int) -> httpx.Response:
         return self.api.get(f"/products/{product_id}")
 
+    @endpoint
     def products_by_category_raw(self, category_slug: str) -> httpx.Response:
         return self.api.get(f"/products/category/{category_slug}")
 
+    @endpoint
     def search_products_raw(self, *, q: str) -> httpx.Response:
         return self.api.get("/products/search", params={"q": q})
+
+
+class AsyncProductsClient(AsyncDomainClient, ProductsClient):
+    pass
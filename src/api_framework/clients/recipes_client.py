@@ -1,75 +1,109 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
+from functools import partial
 from typing import Any
 
 import httpx
 
-from api_framework.client import ApiClient
+from api_framework.clients.base import (
+    AsyncDomainClient,
+    BulkResult,
+    DomainClient,
+    endpoint,
+    items_endpoint,
+)
+from api_framework.models import Page, Recipe, decode, decode_page
 
 
-class RecipesClient:
-    def __init__(self, api: ApiClient):
-        self.api = api
-
+class RecipesClient(DomainClient):
+    @endpoint
     def list_recipes(self, *, limit: int = 30, skip: int = 0) -> dict[str, Any]:
-        r = self.api.get("/recipes", params={"limit": limit, "skip": skip})
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.get("/recipes", params={"limit": limit, "skip": skip}))
 
-    def get_recipe(self, recipe_id: int) -> dict[str, Any]:
-        r = self.api.get(f"/recipes/{recipe_id}")
-        r.raise_for_status()
-        return r.json()
+    @items_endpoint
+    def iter_recipes(
+        self, *, page_size: int = 100, prefetch: bool = False
+    ) -> Iterator[dict[str, Any]]:
+        return self._paginate("/recipes", "recipes", page_size=page_size, prefetch=prefetch)
+
+    @items_endpoint
+    def stream_recipes(self, *, chunk_size: int = 65_536) -> Iterator[dict[str, Any]]:
+        return self.api.stream_items(
+            "/recipes", key="recipes", params={"limit": 0}, chunk_size=chunk_size
+        )
 
+    @endpoint
+    def get_recipe(self, recipe_id: int) -> dict[str, Any]:
+        return self._strict(self.api.get(f"/recipes/{recipe_id}"))
+
+    @endpoint
+    def list_recipes_typed(
+        self, *, limit: int = 30, skip: int = 0, validate: bool = False
+    ) -> Page[Recipe]:
+        return self._strict(
+            self.api.get("/recipes", params={"limit": limit, "skip": skip}),
+            partial(decode_page, Recipe, key="recipes", validate=validate),
+        )
+
+    @endpoint
+    def get_recipe_typed(self, recipe_id: int, *, validate: bool = False) -> Recipe:
+        return self._strict(
+            self.api.get(f"/recipes/{recipe_id}"), partial(decode, Recipe, validate=validate)
+        )
+
+    @endpoint
+    def get_many(self, recipe_ids: Iterable[int], *, concurrency: int = 8) -> BulkResult:
+        return self._get_many(self.get_recipe, recipe_ids, concurrency=concurrency)
+
+    @endpoint
     def search_recipes(self, *, q: str) -> dict[str, Any]:
-        r = self.api.get("/recipes/search", params={"q": q})
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.get("/recipes/search", params={"q": q}))
 
+    @endpoint
     def sort_recipes(self, *, sort_by: str = "name", order: str = "asc") -> dict[str, Any]:
         # DummyJSON supports sortBy/order query params on list endpoints
-        r = self.api.get("/recipes", params={"sortBy": sort_by, "order": order})
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.get("/recipes", params={"sortBy": sort_by, "order": order}))
 
+    @endpoint
     def list_tags(self) -> list[Any]:
-        r = self.api.get("/recipes/tags")
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.get("/recipes/tags"))
 
+    @endpoint
     def recipes_by_tag(self, tag: str) -> dict[str, Any]:
-        r = self.api.get(f"/recipes/tag/{tag}")
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.get(f"/recipes/tag/{tag}"))
 
+    @endpoint
     def recipes_by_meal_type(self, meal_type: str) -> dict[str, Any]:
-        r = self.api.get(f"/recipes/meal-type/{meal_type}")
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.get(f"/recipes/meal-type/{meal_type}"))
 
+    @endpoint
     def add_recipe(self, payload: dict[str, Any]) -> dict[str, Any]:
-        r = self.api.post("/recipes/add", json=payload)
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.post("/recipes/add", json=payload))
 
+    @endpoint
     def update_recipe(self, recipe_id: int, payload: dict[str, Any]) -> dict[str, Any]:
-        r = self.api.request("PUT", f"/recipes/{recipe_id}", json=payload)
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.request("PUT", f"/recipes/{recipe_id}", json=payload))
 
+    @endpoint
     def delete_recipe(self, recipe_id: int) -> dict[str, Any]:
-        r = self.api.request("DELETE", f"/recipes/{recipe_id}")
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.request("DELETE", f"/recipes/{recipe_id}"))
 
     # -----------------------
     # RAW helpers
     # -----------------------
+    @endpoint
     def get_recipe_raw(self, recipe_id: int) -> httpx.Response:
         return self.api.get(f"/recipes/{recipe_id}")
 
+    @endpoint
     def recipes_by_tag_raw(self, tag: str) -> httpx.Response:
         return self.api.get(f"/recipes/tag/{tag}")
 
+    @endpoint
     def search_recipes_raw(self, *, q: str) -> httpx.Response:
         return self.api.get("/recipes/search", params={"q": q})
+
+
+class AsyncRecipesClient(AsyncDomainClient, RecipesClient):
+    pass
@@ -1,81 +1,114 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
+from functools import partial
 from typing import Any
 
 import httpx
 
-from api_framework.client import ApiClient
+from api_framework.clients.base import (
+    AsyncDomainClient,
+    BulkResult,
+    DomainClient,
+    endpoint,
+    items_endpoint,
+)
+from api_framework.models import Page, User, decode, decode_page
 
 
-class UsersClient:
-    def __init__(self, api: ApiClient):
-        self.api = api
-
+class UsersClient(DomainClient):
+    @endpoint
     def list_users(self, *, limit: int = 30, skip: int = 0) -> dict[str, Any]:
-        r = self.api.get("/users", params={"limit": limit, "skip": skip})
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.get("/users", params={"limit": limit, "skip": skip}))
 
-    def get_user(self, user_id: int) -> dict[str, Any]:
-        r = self.api.get(f"/users/{user_id}")
-        r.raise_for_status()
-        return r.json()
+    @items_endpoint
+    def iter_users(
+        self, *, page_size: int = 100, prefetch: bool = False
+    ) -> Iterator[dict[str, Any]]:
+        return self._paginate("/users", "users", page_size=page_size, prefetch=prefetch)
+
+    @items_endpoint
+    def stream_users(self, *, chunk_size: int = 65_536) -> Iterator[dict[str, Any]]:
+        return self.api.stream_items(
+            "/users", key="users", params={"limit": 0}, chunk_size=chunk_size
+        )
 
+    @endpoint
+    def get_user(self, user_id: int) -> dict[str, Any]:
+        return self._strict(self.api.get(f"/users/{user_id}"))
+
+    @endpoint
+    def list_users_typed(
+        self, *, limit: int = 30, skip: int = 0, validate: bool = False
+    ) -> Page[User]:
+        return self._strict(
+            self.api.get("/users", params={"limit": limit, "skip": skip}),
+            partial(decode_page, User, key="users", validate=validate),
+        )
+
+    @endpoint
+    def get_user_typed(self, user_id: int, *, validate: bool = False) -> User:
+        return self._strict(
+            self.api.get(f"/users/{user_id}"), partial(decode, User, validate=validate)
+        )
+
+    @endpoint
+    def get_many(self, user_ids: Iterable[int], *, concurrency: int = 8) -> BulkResult:
+        return self._get_many(self.get_user, user_ids, concurrency=concurrency)
+
+    @endpoint
     def search_users(self, *, q: str) -> dict[str, Any]:
-        r = self.api.get("/users/search", params={"q": q})
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.get("/users/search", params={"q": q}))
 
+    @endpoint
     def filter_users(self, *, key: str, value: str) -> dict[str, Any]:
         # DummyJSON supports: /users/filter?key=...&value=...
-        r = self.api.get("/users/filter", params={"key": key, "value": value})
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.get("/users/filter", params={"key": key, "value": value}))
 
+    @endpoint
     def sort_users(self, *, sort_by: str = "firstName", order: str = "asc") -> dict[str, Any]:
         # DummyJSON supports sortBy/order on list endpoints
-        r = self.api.get("/users", params={"sortBy": sort_by, "order": order})
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.get("/users", params={"sortBy": sort_by, "order": order}))
 
+    @endpoint
     def user_carts(self, user_id: int) -> dict[str, Any]:
-        r = self.api.get(f"/users/{user_id}/carts")
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.get(f"/users/{user_id}/carts"))
 
+    @endpoint
     def user_posts(self, user_id: int) -> dict[str, Any]:
-        r = self.api.get(f"/users/{user_id}/posts")
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.get(f"/users/{user_id}/posts"))
 
+    @endpoint
     def user_todos(self, user_id: int) -> dict[str, Any]:
-        r = self.api.get(f"/users/{user_id}/todos")
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.get(f"/users/{user_id}/todos"))
 
+    @endpoint
     def add_user(self, payload: dict[str, Any]) -> dict[str, Any]:
-        r = self.api.post("/users/add", json=payload)
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.post("/users/add", json=payload))
 
+    @endpoint
     def update_user(self, user_id: int, payload: dict[str, Any]) -> dict[str, Any]:
-        r = self.api.request("PUT", f"/users/{user_id}", json=payload)
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.request("PUT", f"/users/{user_id}", json=payload))
 
+    @endpoint
     def delete_user(self, user_id: int) -> dict[str, Any]:
-        r = self.api.request("DELETE", f"/users/{user_id}")
-        r.raise_for_status()
-        return r.json()
+        return self._strict(self.api.request("DELETE", f"/users/{user_id}"))
 
     # -----------------------
     # RAW helpers
     # -----------------------
+    @endpoint
     def get_user_raw(self, user_id: int) -> httpx.Response:
         return self.api.get(f"/users/{user_id}")
 
+    @endpoint
     def search_users_raw(self, *, q: str) -> httpx.Response:
         return self.api.get("/users/search", params={"q": q})
 
+    @endpoint
     def filter_users_raw(self, *, key: str, value: str) -> httpx.Response:
         return self.api.get("/users/filter", params={"key": key, "value": value})
+
+
+class AsyncUsersClient(AsyncDomainClient, UsersClient):
+    pass
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Literal
 
-from pydantic import Field, HttpUrl
+from pydantic import AnyUrl, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -12,10 +13,105 @@ class Settings(BaseSettings):
         extra="ignore",
     )
 
-    base_url: HttpUrl = Field(default="https://dummyjson.com", validation_alias="BASE_URL")
+    # http(s)://... or inproc:// (in-process DummyJSON stand-in, no network)
+    base_url: AnyUrl = Field(default="https://dummyjson.com", validation_alias="BASE_URL")
     timeout_seconds: float = Field(default=10.0, validation_alias="TIMEOUT_SECONDS")
 
     retry_attempts: int = Field(default=3, validation_alias="RETRY_ATTEMPTS")
+    # Retry policy (api_framework.retry): exponential | full_jitter | decorrelated_jitter
+    retry_backoff: str = Field(default="exponential", validation_alias="RETRY_BACKOFF")
+    retry_backoff_base: float = Field(default=0.5, validation_alias="RETRY_BACKOFF_BASE")
+    retry_backoff_cap: float = Field(default=4.0, validation_alias="RETRY_BACKOFF_CAP")
+    # Retries per session <= RETRY_BUDGET_MIN_RETRIES + ratio * requests (unset = unlimited)
+    retry_budget_ratio: float | None = Field(default=None, validation_alias="RETRY_BUDGET_RATIO")
+    retry_budget_min_retries: int = Field(default=10, validation_alias="RETRY_BUDGET_MIN_RETRIES")
+    # Cap on total time across all attempts of one request (unset = no cap)
+    request_deadline_seconds: float | None = Field(
+        default=None, validation_alias="REQUEST_DEADLINE_SECONDS"
+    )
+
+    # Debug kit log backend (API_DEBUG_LOG=1, see api_framework.debuglog): JSON lines to
+    # DEBUG_LOG_PATH (unset = stdout), bounded queue, bodies cut at DEBUG_LOG_MAX_BODY_CHARS
+    debug_log_path: str | None = Field(default=None, validation_alias="DEBUG_LOG_PATH")
+    debug_log_queue_size: int = Field(default=10_000, validation_alias="DEBUG_LOG_QUEUE_SIZE")
+    debug_log_max_body_chars: int = Field(default=4000, validation_alias="DEBUG_LOG_MAX_BODY_CHARS")
+    # Extra JSON keys to redact in debug logs (api_framework.redaction), as a JSON list of
+    # names (case-insensitive), globs or "re:<regex>", e.g. REDACT_JSON_KEYS=["*secret*"];
+    # containers nested deeper than REDACT_MAX_DEPTH / past REDACT_MAX_NODES values are cut
+    redact_json_keys: list[str] = Field(default_factory=list, validation_alias="REDACT_JSON_KEYS")
+    redact_max_depth: int = Field(default=64, validation_alias="REDACT_MAX_DEPTH")
+    redact_max_nodes: int = Field(default=200_000, validation_alias="REDACT_MAX_NODES")
+
+    # One JSON line per attempt (api_framework.requestlog), e.g. artifacts/requests.jsonl;
+    # unset = off. Rotates at REQUEST_LOG_MAX_BYTES keeping REQUEST_LOG_BACKUPS files.
+    request_log_path: str | None = Field(default=None, validation_alias="REQUEST_LOG_PATH")
+    request_log_max_bytes: int = Field(default=50_000_000, validation_alias="REQUEST_LOG_MAX_BYTES")
+    request_log_backups: int = Field(default=5, validation_alias="REQUEST_LOG_BACKUPS")
+
+    # Contract validation backend (api_framework.validation.schema): jsonschema | codegen
+    schema_backend: Literal["jsonschema", "codegen"] = Field(
+        default="jsonschema", validation_alias="SCHEMA_BACKEND"
+    )
+
+    # JSON codec for bodies, schemas and reports (api_framework.jsoncodec):
+    # stdlib | orjson | msgspec | auto (fastest installed)
+    json_codec: Literal["stdlib", "orjson", "msgspec", "auto"] = Field(
+        default="stdlib", validation_alias="JSON_CODEC"
+    )
+
+    # AsyncApiClient: max in-flight requests (semaphore + connection pool size)
+    max_concurrency: int = Field(default=10, validation_alias="MAX_CONCURRENCY")
+
+    # Record/replay: passthrough | record | replay (see api_framework.cassette)
+    cassette_mode: Literal["passthrough", "record", "replay"] = Field(
+        default="passthrough", validation_alias="CASSETTE_MODE"
+    )
+    cassette_path: str = Field(
+        default="artifacts/cassettes/api.cassette", validation_alias="CASSETTE_PATH"
+    )
+
+    # GET response cache (see api_framework.cache); route TTLs as JSON, e.g.
+    # RESPONSE_CACHE_ROUTE_TTLS={"/products/categories": 300, "/users": 10}
+    response_cache_enabled: bool = Field(default=False, validation_alias="RESPONSE_CACHE")
+    response_cache_max_entries: int = Field(
+        default=512, validation_alias="RESPONSE_CACHE_MAX_ENTRIES"
+    )
+    response_cache_ttl_seconds: float = Field(
+        default=30.0, validation_alias="RESPONSE_CACHE_TTL_SECONDS"
+    )
+    response_cache_route_ttls: dict[str, float] = Field(
+        default_factory=dict, validation_alias="RESPONSE_CACHE_ROUTE_TTLS"
+    )
+
+    # Coalesce concurrent identical GETs into one in-flight call (api_framework.singleflight)
+    single_flight_enabled: bool = Field(default=False, validation_alias="SINGLE_FLIGHT")
+
+    # Revalidate GETs with If-None-Match / If-Modified-Since (api_framework.revalidation)
+    conditional_requests_enabled: bool = Field(
+        default=False, validation_alias="CONDITIONAL_REQUESTS"
+    )
+
+    # Client-side token bucket (api_framework.ratelimit); RATE_LIMIT_RPS=0 leaves paths
+    # without a route budget unlimited. Per-prefix budgets (used instead of the global one)
+    # as JSON, e.g. RATE_LIMIT_ROUTE_RPS={"/auth": 2, "/carts": 5};
+    # RATE_LIMIT_SHARED_PATH shares the buckets across processes (xdist workers).
+    rate_limit_rps: float = Field(default=0.0, validation_alias="RATE_LIMIT_RPS")
+    rate_limit_burst: int | None = Field(default=None, validation_alias="RATE_LIMIT_BURST")
+    rate_limit_route_rps: dict[str, float] = Field(
+        default_factory=dict, validation_alias="RATE_LIMIT_ROUTE_RPS"
+    )
+    rate_limit_shared_path: str | None = Field(
+        default=None, validation_alias="RATE_LIMIT_SHARED_PATH"
+    )
+
+    # Circuit breaker per host (or host + resource prefix) (api_framework.circuit)
+    circuit_breaker_enabled: bool = Field(default=False, validation_alias="CIRCUIT_BREAKER")
+    circuit_failure_threshold: int = Field(default=5, validation_alias="CIRCUIT_FAILURE_THRESHOLD")
+    circuit_reset_seconds: float = Field(default=30.0, validation_alias="CIRCUIT_RESET_SECONDS")
+    circuit_half_open_max_calls: int = Field(
+        default=1, validation_alias="CIRCUIT_HALF_OPEN_MAX_CALLS"
+    )
+    circuit_per_route: bool = Field(default=False, validation_alias="CIRCUIT_PER_ROUTE")
 
     auth_header_name: str = Field(default="Authorization", validation_alias="AUTH_HEADER_NAME")
     auth_header_value: str | None = Field(default=None, validation_alias="AUTH_HEADER_VALUE")
@@ -23,8 +119,14 @@ class Settings(BaseSettings):
     auth_password: str | None = Field(default=None, validation_alias="AUTH_PASSWORD")
 
 
+INPROC_ENV_NAME = "inproc"
+
+
 def settings_for(env_name: str | None) -> Settings:
     env_name = (env_name or "local").strip().lower()
     candidate = Path("env") / f".env.{env_name}"
     env_file = candidate if candidate.exists() else Path("env") / ".env.local"
+    if env_name == INPROC_ENV_NAME:
+        # Hermetic runs: the stand-in must win over a BASE_URL exported in the OS env (CI).
+        return Settings(_env_file=str(env_file), BASE_URL="inproc://dummyjson")
     return Settings(_env_file=str(env_file))
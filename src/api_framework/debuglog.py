@@ -0,0 +1,287 @@
+"""
+Debug kit log backend (API_DEBUG_LOG=1): JSON lines written by a background thread.
+
+The client only enqueues references (the httpx.Request / httpx.Response of an attempt plus
+a few scalars); parsing, trimming, redaction and serialization happen on the writer thread,
+so a debug-enabled run pays one `queue.put_nowait` per event on the request path.
+
+- bodies: JSON is parsed, big list payloads are trimmed *before* the redaction walk, and
+  the result is serialized incrementally up to DEBUG_LOG_MAX_BODY_CHARS (the rest of a
+  huge payload is never encoded); non-JSON bodies are cut the same way
+- the queue is bounded (DEBUG_LOG_QUEUE_SIZE): when the writer falls behind, events are
+  dropped and counted instead of stalling requests ("debug_log_dropped" line)
+- output goes to DEBUG_LOG_PATH (appended) or, when unset, to the current sys.stdout;
+  `flush()` waits for the queue to drain (pytest calls it at the end of each test so the
+  lines land in that test's captured output)
+
+One line per event, e.g.
+    {"event": "exchange", "correlation_id": "...", "method": "GET", "url": "...",
+     "status_code": 200, "duration_ms": 12, "retry_attempt": 1, "response_body": {...}}
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import queue
+import sys
+import threading
+import time
+from typing import IO, Any
+
+import httpx
+
+from .config import Settings
+from .jsoncodec import JsonCodec, get_codec
+from .redaction import Redactor, redact_headers
+
+# Top-level list payloads of DummyJSON collections trimmed for readability.
+TRIMMED_LIST_KEYS = ("users", "products", "posts", "comments", "todos", "carts", "recipes")
+TRIMMED_LIST_ITEMS = 2
+
+_STOP = object()
+
+
+def trim_payload(data: Any) -> Any:
+    """Keep the first items of a big collection payload (shallow copy, input untouched)."""
+    if not isinstance(data, dict):
+        return data
+    for key in TRIMMED_LIST_KEYS:
+        items = data.get(key)
+        if isinstance(items, list) and len(items) > TRIMMED_LIST_ITEMS:
+            return {
+                **data,
+                key: items[:TRIMMED_LIST_ITEMS],
+                "_note": f"{key} trimmed to first {TRIMMED_LIST_ITEMS} items for readability",
+            }
+    return data
+
+
+def dumps_capped(obj: Any, max_chars: int) -> tuple[str, bool]:
+    """JSON-encode up to ~max_chars; returns (text, truncated). Stops encoding at the cap."""
+    out: list[str] = []
+    size = 0
+    encoder = json.JSONEncoder(ensure_ascii=False, default=str, separators=(",", ":"))
+    for chunk in encoder.iterencode(obj):
+        out.append(chunk)
+        size += len(chunk)
+        if size > max_chars:
+            return "".join(out)[:max_chars], True
+    return "".join(out), False
+
+
+class DebugLog:
+    """Bounded queue + writer thread. Thread-safe; shared by the clients of a process."""
+
+    _shared: dict[tuple[Any, ...], DebugLog] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        *,
+        path: str | None = None,
+        queue_size: int = 10_000,
+        max_body_chars: int = 4000,
+        codec: JsonCodec | None = None,
+        redactor: Redactor | None = None,
+    ):
+        self.path = path
+        self.codec = codec or get_codec()  # body parsing; lines are written by the stdlib
+        self.redactor = redactor or Redactor()
+        self.max_body_chars = max_body_chars
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=queue_size)
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self._file: IO[str] | None = None
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self._reported_dropped = 0
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> DebugLog:
+        """
+        Process-wide instance per (path, queue size, body cap, codec, redaction rules and
+        limits): clients that redact or parse differently never share a writer.
+        """
+        codec = get_codec(settings.json_codec)
+        redactor = Redactor.from_settings(settings)
+        key = (
+            settings.debug_log_path or "",
+            settings.debug_log_queue_size,
+            settings.debug_log_max_body_chars,
+            codec.name,
+            redactor.rules,
+            redactor.max_depth,
+            redactor.max_nodes,
+        )
+        with cls._shared_lock:
+            log = cls._shared.get(key)
+            if log is None:
+                log = cls._shared[key] = cls(
+                    path=settings.debug_log_path or None,
+                    queue_size=settings.debug_log_queue_size,
+                    max_body_chars=settings.debug_log_max_body_chars,
+                    codec=codec,
+                    redactor=redactor,
+                )
+                atexit.register(log.close)
+        return log
+
+    @classmethod
+    def flush_all(cls, timeout: float | None = 5.0) -> None:
+        with cls._shared_lock:
+            logs = list(cls._shared.values())
+        for log in logs:
+            log.flush(timeout)
+
+    # -----------------------
+    # Producer side (request path)
+    # -----------------------
+
+    def event(self, event: str, **fields: Any) -> None:
+        self._put((event, fields, None, None))
+
+    def exchange(
+        self, req: httpx.Request, resp: httpx.Response | None = None, **fields: Any
+    ) -> None:
+        self._put(("exchange", fields, req, resp))
+
+    def _put(self, item: tuple[str, dict[str, Any], Any, Any]) -> None:
+        if self._thread is None:
+            self._start()
+        try:
+            self._queue.put_nowait((time.time(), *item))
+        except queue.Full:
+            self.dropped += 1
+        else:
+            self.enqueued += 1
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is None:
+                thread = threading.Thread(target=self._run, name="api-debug-log", daemon=True)
+                thread.start()
+                self._thread = thread
+
+    def flush(self, timeout: float | None = 5.0) -> None:
+        """Wait until every queued event is written (or the timeout passes)."""
+        if self._thread is None:
+            return
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return
+                self._queue.all_tasks_done.wait(remaining)
+
+    def close(self) -> None:
+        thread = self._thread
+        if thread is None:
+            return
+        self.flush()
+        self._queue.put(_STOP)
+        thread.join(timeout=5)
+        self._thread = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # -----------------------
+    # Writer thread
+    # -----------------------
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                lines = []
+                if self.dropped != self._reported_dropped:
+                    dropped, self._reported_dropped = self.dropped, self.dropped
+                    lines.append(json.dumps({"event": "debug_log_dropped", "total": dropped}))
+                try:
+                    lines.append(self._format(*item))
+                except Exception as exc:  # never let one bad payload kill the writer
+                    lines.append(json.dumps({"event": "debug_log_error", "error": repr(exc)}))
+                self._write("".join(line + "\n" for line in lines))
+                self.written += 1
+            finally:
+                self._queue.task_done()
+
+    def _write(self, text: str) -> None:
+        if self.path is None:
+            out = sys.stdout
+        else:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")  # noqa: SIM115
+            out = self._file
+        out.write(text)
+        out.flush()
+
+    def _format(
+        self,
+        ts: float,
+        event: str,
+        fields: dict[str, Any],
+        req: httpx.Request | None,
+        resp: httpx.Response | None,
+    ) -> str:
+        record: dict[str, Any] = {"ts": round(ts, 6), "event": event, **fields}
+        bodies: dict[str, Any] = {}
+        if req is not None:
+            record["method"] = req.method
+            record["url"] = str(req.url)
+            record["request_headers"] = redact_headers(dict(req.headers))
+            bodies["request_body"] = self._request_body(req)
+        if resp is not None:
+            record["status_code"] = resp.status_code
+            if "timings" in resp.extensions:
+                record["timings_ms"] = resp.extensions["timings"]
+            record["response_headers"] = redact_headers(dict(resp.headers))
+            bodies["response_body"] = self._response_body(resp)
+
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        parts = [line[:-1]]
+        for name, body in bodies.items():
+            if body is None:
+                continue
+            if isinstance(body, str):  # placeholders and text bodies are already cut
+                parts.append(f', "{name}": {json.dumps(body, ensure_ascii=False)}')
+                continue
+            text, truncated = dumps_capped(body, self.max_body_chars)
+            if truncated:
+                parts.append(f', "{name}_truncated": true, "{name}": {json.dumps(text)}')
+            else:
+                parts.append(f', "{name}": {text}')
+        return "".join(parts) + "}"
+
+    def _request_body(self, req: httpx.Request) -> Any | None:
+        try:
+            content = req.content
+        except httpx.RequestNotRead:
+            return "<streaming body>"
+        if not content:
+            return None
+        try:
+            return self.redactor.redact(trim_payload(self.codec.loads(content)))
+        except ValueError:
+            return f"<non-json payload, {len(content)} bytes>"
+
+    def _response_body(self, resp: httpx.Response) -> Any | None:
+        try:
+            content = resp.content
+        except httpx.ResponseNotRead:
+            return "<streaming body>"
+        if not content:
+            return None
+        if resp.headers.get("content-type", "").startswith("application/json"):
+            try:
+                return self.redactor.redact(trim_payload(self.codec.loads(content)))
+            except ValueError:
+                pass
+        # Don't decode a massive HTML/text body just to cut it.
+        head = content[: self.max_body_chars * 4].decode(resp.encoding or "utf-8", "replace")
+        return head[: self.max_body_chars]
@@ -0,0 +1,103 @@
+"""
+Compact, mergeable latency histogram (HDR-style log buckets).
+
+Values (milliseconds) fall into geometrically growing buckets between LOWEST_MS and
+HIGHEST_MS, so memory is fixed (~370 counters) whatever the sample count, and any
+percentile is within GROWTH (5%) of the true value. Histograms from several clients
+or xdist workers merge by adding counters; the serialized form is sparse.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+LOWEST_MS = 0.01
+HIGHEST_MS = 600_000.0  # 10 minutes; larger values land in the last bucket
+GROWTH = 1.05
+
+_LOG_GROWTH = math.log(GROWTH)
+BUCKETS = int(math.ceil(math.log(HIGHEST_MS / LOWEST_MS) / _LOG_GROWTH)) + 1
+
+
+def _bucket(value_ms: float) -> int:
+    if value_ms <= LOWEST_MS:
+        return 0
+    return min(int(math.log(value_ms / LOWEST_MS) / _LOG_GROWTH) + 1, BUCKETS - 1)
+
+
+def _bucket_upper(index: int) -> float:
+    return LOWEST_MS * GROWTH**index
+
+
+class LogHistogram:
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.counts = [0] * BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, value_ms: float) -> None:
+        value_ms = max(value_ms, 0.0)
+        self.counts[_bucket(value_ms)] += 1
+        self.count += 1
+        self.total += value_ms
+        if value_ms < self.min:
+            self.min = value_ms
+        if value_ms > self.max:
+            self.max = value_ms
+
+    def merge(self, other: LogHistogram) -> LogHistogram:
+        for i, n in enumerate(other.counts):
+            if n:
+                self.counts[i] += n
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def percentile(self, pct: float) -> float:
+        """Upper edge of the bucket holding the pct-th value (clamped to the exact min / max)."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * pct / 100.0))
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(max(_bucket_upper(i), self.min), self.max)
+        return self.max
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count, 3) if self.count else 0.0,
+            "p50_ms": round(self.percentile(50), 3),
+            "p90_ms": round(self.percentile(90), 3),
+            "p99_ms": round(self.percentile(99), 3),
+            "max_ms": round(self.max, 3),
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum_ms": round(self.total, 3),
+            "min_ms": round(self.min, 3) if self.count else 0.0,
+            "max_ms": round(self.max, 3),
+            "buckets": {str(i): n for i, n in enumerate(self.counts) if n},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> LogHistogram:
+        h = cls()
+        for i, n in (data.get("buckets") or {}).items():
+            h.counts[min(int(i), BUCKETS - 1)] += int(n)
+        h.count = int(data.get("count", 0))
+        h.total = float(data.get("sum_ms", 0.0))
+        h.min = float(data.get("min_ms", 0.0)) if h.count else math.inf
+        h.max = float(data.get("max_ms", 0.0))
+        return h
@@ -0,0 +1,438 @@
+"""
+In-process DummyJSON stand-in.
+
+Serves the subset of https://dummyjson.com used by the domain clients
+(paging, search, filter, sort, simulated CRUD, auth login/me/refresh)
+straight from memory as an httpx transport: no sockets, no network.
+
+Select it with BASE_URL=inproc:// (or `pytest --env inproc`).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import secrets
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+
+from .data import Dataset, cart_line, cart_totals, load_dataset
+
+INPROC_SCHEME = "inproc://"
+
+# httpx needs an http(s) base URL; requests never leave the process anyway.
+INPROC_HTTP_BASE_URL = "http://dummyjson.inproc"
+
+Handler = Callable[..., tuple[int, Any]]
+
+
+def is_inproc_url(base_url: str) -> bool:
+    return str(base_url).lower().startswith(INPROC_SCHEME)
+
+
+def _get_path(obj: Any, dotted: str) -> Any:
+    for part in dotted.split("."):
+        if not isinstance(obj, dict) or part not in obj:
+            return None
+        obj = obj[part]
+    return obj
+
+
+def _not_found(resource: str, item_id: Any) -> tuple[int, Any]:
+    return 404, {"message": f"{resource} with id '{item_id}' not found"}
+
+
+def _now_iso() -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime())
+
+
+class DummyJsonApp:
+    """
+    Request handler mimicking DummyJSON.
+
+    Writes are simulated exactly like the public API: add/update/delete return the
+    resulting shape but never change the dataset. Issued auth tokens are kept per app.
+    """
+
+    def __init__(self, dataset: Dataset | None = None):
+        self.data = dataset or load_dataset()
+        self._by_id: dict[str, dict[int, dict[str, Any]]] = {
+            "users": {u["id"]: u for u in self.data.users},
+            "products": {p["id"]: p for p in self.data.products},
+            "posts": {p["id"]: p for p in self.data.posts},
+            "comments": {c["id"]: c for c in self.data.comments},
+            "carts": {c["id"]: c for c in self.data.carts},
+            "recipes": {r["id"]: r for r in self.data.recipes},
+        }
+        self._tokens_lock = threading.Lock()
+        self._access_tokens: dict[str, int] = {}
+        self._refresh_tokens: dict[str, int] = {}
+        self._routes: list[tuple[str, re.Pattern[str], Handler]] = []
+        self._register_routes()
+
+    # -----------------------
+    # Transport entry point
+    # -----------------------
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path.rstrip("/") or "/"
+        for method, pattern, handler in self._routes:
+            if method != request.method:
+                continue
+            m = pattern.fullmatch(path)
+            if m is None:
+                continue
+            status, body = handler(request, **m.groupdict())
+            if method == "GET" and status == 200:
+                return _conditional_response(request, body)
+            return httpx.Response(status, json=body)
+
+        return httpx.Response(
+            404, json={"message": f"Route {request.method} {request.url.path} not found"}
+        )
+
+    def _route(self, method: str, template: str, handler: Handler) -> None:
+        regex = re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", template)
+        self._routes.append((method, re.compile(regex), handler))
+
+    def _register_routes(self) -> None:
+        r = self._route
+
+        # Auth
+        r("POST", "/auth/login", self._login)
+        r("GET", "/auth/me", self._me)
+        r("POST", "/auth/refresh", self._refresh)
+
+        # Users
+        r("GET", "/users", lambda req: self._page(req, "users", self.data.users))
+        r("GET", "/users/search", lambda req: self._search(req, "users", self.data.users))
+        r("GET", "/users/filter", self._filter_users)
+        r(
+            "GET",
+            "/users/{id}/carts",
+            lambda req, id: self._children(req, "carts", self.data.carts, "userId", id),
+        )
+        r(
+            "GET",
+            "/users/{id}/posts",
+            lambda req, id: self._children(req, "posts", self.data.posts, "userId", id),
+        )
+        r(
+            "GET",
+            "/users/{id}/todos",
+            lambda req, id: self._children(req, "todos", self.data.todos, "userId", id),
+        )
+
+        # Products
+        r("GET", "/products", lambda req: self._page(req, "products", self.data.products))
+        r(
+            "GET",
+            "/products/search",
+            lambda req: self._search(req, "products", self.data.products),
+        )
+        r("GET", "/products/categories", self._categories)
+        r(
+            "GET",
+            "/products/category/{slug}",
+            lambda req, slug: self._children(req, "products", self.data.products, "category", slug),
+        )
+
+        # Posts / comments
+        r("GET", "/posts", lambda req: self._page(req, "posts", self.data.posts))
+        r("GET", "/posts/search", lambda req: self._search(req, "posts", self.data.posts))
+        r("GET", "/comments", lambda req: self._page(req, "comments", self.data.comments))
+        r(
+            "GET",
+            "/comments/post/{id}",
+            lambda req, id: self._children(req, "comments", self.data.comments, "postId", id),
+        )
+        r("POST", "/comments/add", self._add_comment)
+
+        # Carts
+        r("GET", "/carts", lambda req: self._page(req, "carts", self.data.carts))
+        r(
+            "GET",
+            "/carts/user/{id}",
+            lambda req, id: self._children(req, "carts", self.data.carts, "userId", id),
+        )
+        r("POST", "/carts/add", self._add_cart)
+        r("PUT", "/carts/{id}", self._update_cart)
+        r("PATCH", "/carts/{id}", self._update_cart)
+
+        # Recipes
+        r("GET", "/recipes", lambda req: self._page(req, "recipes", self.data.recipes))
+        r("GET", "/recipes/search", lambda req: self._search(req, "recipes", self.data.recipes))
+        r("GET", "/recipes/tags", self._recipe_tags)
+        r("GET", "/recipes/tag/{tag}", self._recipes_by_tag)
+        r("GET", "/recipes/meal-type/{meal}", self._recipes_by_meal_type)
+
+        # Generic CRUD (registered last so the specific routes above win)
+        for resource in ("users", "products", "posts", "comments", "carts", "recipes"):
+            r("GET", f"/{resource}/{{id}}", self._get_one(resource))
+            if resource not in ("comments", "carts"):
+                r("POST", f"/{resource}/add", self._add(resource))
+            if resource != "carts":
+                r("PUT", f"/{resource}/{{id}}", self._update(resource))
+                r("PATCH", f"/{resource}/{{id}}", self._update(resource))
+            r("DELETE", f"/{resource}/{{id}}", self._delete(resource))
+
+    # -----------------------
+    # Listing helpers (limit/skip/sortBy/order/select)
+    # -----------------------
+
+    @staticmethod
+    def _page(req: httpx.Request, key: str, items: list[dict[str, Any]]) -> tuple[int, Any]:
+        params = req.url.params
+        try:
+            limit = int(params.get("limit", 30))
+            skip = int(params.get("skip", 0))
+        except ValueError:
+            return 400, {"message": "Invalid limit/skip"}
+
+        sort_by = params.get("sortBy")
+        if sort_by:
+            reverse = params.get("order", "asc").lower() == "desc"
+            present = [i for i in items if i.get(sort_by) is not None]
+            missing = [i for i in items if i.get(sort_by) is None]
+            items = sorted(present, key=lambda i: i[sort_by], reverse=reverse) + missing
+
+        total = len(items)
+        window = items[skip:] if limit == 0 else items[skip : skip + limit]
+
+        select = params.get("select")
+        if select:
+            fields = {"id", *(f.strip() for f in select.split(",") if f.strip())}
+            window = [{k: v for k, v in i.items() if k in fields} for i in window]
+
+        return 200, {key: window, "total": total, "skip": skip, "limit": len(window)}
+
+    _SEARCH_FIELDS = {
+        "users": ("firstName", "lastName", "username", "email"),
+        "products": ("title", "description", "category", "brand"),
+        "posts": ("title", "body"),
+        "recipes": ("name", "cuisine"),
+    }
+
+    def _search(self, req: httpx.Request, key: str, items: list[dict[str, Any]]) -> tuple[int, Any]:
+        q = (req.url.params.get("q") or "").strip().lower()
+        fields = self._SEARCH_FIELDS[key]
+        if q:
+            items = [i for i in items if any(q in str(i.get(f, "")).lower() for f in fields)]
+        return self._page(req, key, items)
+
+    def _filter_users(self, req: httpx.Request) -> tuple[int, Any]:
+        key = req.url.params.get("key", "")
+        value = (req.url.params.get("value") or "").lower()
+        items = [u for u in self.data.users if str(_get_path(u, key)).lower() == value]
+        return self._page(req, "users", items)
+
+    def _children(
+        self,
+        req: httpx.Request,
+        key: str,
+        items: list[dict[str, Any]],
+        field: str,
+        value: str,
+    ) -> tuple[int, Any]:
+        if field in ("userId", "postId"):
+            try:
+                match: Any = int(value)
+            except ValueError:
+                return 400, {"message": f"Invalid {field} '{value}'"}
+            parent = "users" if field == "userId" else "posts"
+            if match not in self._by_id[parent]:
+                return _not_found(parent[:-1], value)
+        else:
+            match = value
+        return self._page(req, key, [i for i in items if i.get(field) == match])
+
+    def _categories(self, req: httpx.Request) -> tuple[int, Any]:
+        return 200, [
+            {
+                "slug": slug,
+                "name": slug.replace("-", " ").title(),
+                "url": f"https://dummyjson.com/products/category/{slug}",
+            }
+            for slug in self.data.categories
+        ]
+
+    def _recipe_tags(self, req: httpx.Request) -> tuple[int, Any]:
+        return 200, sorted({t for r in self.data.recipes for t in r["tags"]})
+
+    def _recipes_by_tag(self, req: httpx.Request, tag: str) -> tuple[int, Any]:
+        items = [r for r in self.data.recipes if tag.lower() in (t.lower() for t in r["tags"])]
+        return self._page(req, "recipes", items)
+
+    def _recipes_by_meal_type(self, req: httpx.Request, meal: str) -> tuple[int, Any]:
+        items = [r for r in self.data.recipes if meal.lower() in (m.lower() for m in r["mealType"])]
+        return self._page(req, "recipes", items)
+
+    # -----------------------
+    # Simulated CRUD
+    # -----------------------
+
+    def _lookup(self, resource: str, raw_id: str) -> dict[str, Any] | None:
+        try:
+            return self._by_id[resource].get(int(raw_id))
+        except ValueError:
+            return None
+
+    def _get_one(self, resource: str) -> Handler:
+        def handler(req: httpx.Request, id: str) -> tuple[int, Any]:
+            item = self._lookup(resource, id)
+            return (200, item) if item is not None else _not_found(resource[:-1].title(), id)
+
+        return handler
+
+    def _add(self, resource: str) -> Handler:
+        def handler(req: httpx.Request) -> tuple[int, Any]:
+            # Like DummyJSON, a client-sent id is ignored: the new id always wins.
+            return 201, {**_json_body(req), "id": len(self._by_id[resource]) + 1}
+
+        return handler
+
+    def _update(self, resource: str) -> Handler:
+        def handler(req: httpx.Request, id: str) -> tuple[int, Any]:
+            item = self._lookup(resource, id)
+            if item is None:
+                return _not_found(resource[:-1].title(), id)
+            return 200, {**item, **_json_body(req), "id": item["id"]}
+
+        return handler
+
+    def _delete(self, resource: str) -> Handler:
+        def handler(req: httpx.Request, id: str) -> tuple[int, Any]:
+            item = self._lookup(resource, id)
+            if item is None:
+                return _not_found(resource[:-1].title(), id)
+            return 200, {**item, "isDeleted": True, "deletedOn": _now_iso()}
+
+        return handler
+
+    def _cart_lines(self, products: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        lines: list[dict[str, Any]] = []
+        for p in products:
+            product = self._by_id["products"].get(int(p.get("id", 0)))
+            if product is not None:
+                lines.append(cart_line(product, int(p.get("quantity", 1))))
+        return lines
+
+    def _add_cart(self, req: httpx.Request) -> tuple[int, Any]:
+        body = _json_body(req)
+        user_id = body.get("userId")
+        if user_id not in self._by_id["users"]:
+            return 400, {"message": "User id is required"}
+        lines = self._cart_lines(body.get("products") or [])
+        cart_id = len(self._by_id["carts"]) + 1
+        return 201, {"id": cart_id, "products": lines, **cart_totals(lines), "userId": user_id}
+
+    def _update_cart(self, req: httpx.Request, id: str) -> tuple[int, Any]:
+        cart = self._lookup("carts", id)
+        if cart is None:
+            return _not_found("Cart", id)
+        body = _json_body(req)
+        lines = self._cart_lines(body.get("products") or [])
+        if body.get("merge"):
+            updated = {p["id"] for p in lines}
+            lines = [p for p in cart["products"] if p["id"] not in updated] + lines
+        return 200, {
+            "id": cart["id"],
+            "products": lines,
+            **cart_totals(lines),
+            "userId": cart["userId"],
+        }
+
+    def _add_comment(self, req: httpx.Request) -> tuple[int, Any]:
+        body = _json_body(req)
+        user = self._by_id["users"].get(body.get("userId"))
+        if user is None or not body.get("body") or body.get("postId") is None:
+            return 400, {"message": "Body, postId and userId are required"}
+        return 201, {
+            "id": len(self._by_id["comments"]) + 1,
+            "body": body["body"],
+            "postId": body["postId"],
+            "user": {
+                "id": user["id"],
+                "username": user["username"],
+                "fullName": f"{user['firstName']} {user['lastName']}",
+            },
+        }
+
+    # -----------------------
+    # Auth
+    # -----------------------
+
+    def _issue_tokens(self, user_id: int) -> dict[str, str]:
+        access, refresh = secrets.token_urlsafe(24), secrets.token_urlsafe(24)
+        with self._tokens_lock:
+            self._access_tokens[access] = user_id
+            self._refresh_tokens[refresh] = user_id
+        return {"accessToken": access, "refreshToken": refresh}
+
+    @staticmethod
+    def _public_user(user: dict[str, Any]) -> dict[str, Any]:
+        keys = ("id", "username", "email", "firstName", "lastName", "gender", "image")
+        return {k: user[k] for k in keys}
+
+    def _login(self, req: httpx.Request) -> tuple[int, Any]:
+        body = _json_body(req)
+        username, password = body.get("username"), body.get("password")
+        if not username or not password:
+            return 400, {"message": "Username and password required"}
+        for user in self.data.users:
+            if user["username"] == username and user["password"] == password:
+                return 200, {**self._public_user(user), **self._issue_tokens(user["id"])}
+        return 400, {"message": "Invalid credentials"}
+
+    def _me(self, req: httpx.Request) -> tuple[int, Any]:
+        auth = req.headers.get("authorization", "")
+        token = auth.split(" ", 1)[1].strip() if auth.lower().startswith("bearer ") else ""
+        with self._tokens_lock:
+            user_id = self._access_tokens.get(token)
+        if user_id is None:
+            return 401, {"message": "Invalid/expired Token!"}
+        return 200, self._by_id["users"][user_id]
+
+    def _refresh(self, req: httpx.Request) -> tuple[int, Any]:
+        token = _json_body(req).get("refreshToken") or ""
+        with self._tokens_lock:
+            user_id = self._refresh_tokens.pop(token, None)
+        if user_id is None:
+            return 403, {"message": "Invalid refresh token"}
+        return 200, self._issue_tokens(user_id)
+
+
+def _conditional_response(req: httpx.Request, body: Any) -> httpx.Response:
+    """
+    GET 200 with a weak ETag (like the Express server behind DummyJSON);
+    a matching If-None-Match gets an empty 304 instead.
+    """
+    content = json.dumps(body, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    etag = f'W/"{len(content):x}-{hashlib.sha1(content).hexdigest()[:27]}"'
+    if etag in req.headers.get("if-none-match", "").split(", "):
+        return httpx.Response(304, headers={"ETag": etag})
+    return httpx.Response(
+        200, headers={"Content-Type": "application/json", "ETag": etag}, content=content
+    )
+
+
+def _json_body(req: httpx.Request) -> dict[str, Any]:
+    if not req.content:
+        return {}
+    try:
+        body = json.loads(req.content)
+    except ValueError:
+        return {}
+    return body if isinstance(body, dict) else {}
+
+
+def inproc_transport(app: DummyJsonApp | None = None) -> httpx.MockTransport:
+    """
+    httpx transport (sync + async) serving requests from a DummyJsonApp in memory.
+    """
+    return httpx.MockTransport(app or DummyJsonApp())
@@ -0,0 +1,292 @@
+# Seed data for the in-process DummyJSON stand-in
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+# Same collection sizes as the public DummyJSON dataset.
+USERS_TOTAL = 208
+PRODUCTS_TOTAL = 194
+POSTS_TOTAL = 251
+COMMENTS_TOTAL = 340
+CARTS_TOTAL = 50
+RECIPES_TOTAL = 50
+TODOS_TOTAL = 254
+
+# DummyJSON's documented demo login (user 1).
+DEMO_USERNAME = "emilys"
+DEMO_PASSWORD = "emilyspass"  # pragma: allowlist secret
+
+_FIRST_NAMES = [
+    "Emily", "Michael", "Sophia", "James", "Emma", "Olivia", "Alexander", "Ava",
+    "Ethan", "Isabella", "Liam", "Mia", "Noah", "Charlotte", "William", "Amelia",
+]  # fmt: skip
+_LAST_NAMES = [
+    "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez",
+    "Martinez", "Hernandez", "Lopez", "Wilson", "Anderson", "Thomas", "Taylor", "Moore",
+]  # fmt: skip
+_CITIES = ["Phoenix", "Houston", "Washington", "Seattle", "Denver", "Columbus", "Chicago"]
+_DEPARTMENTS = ["Engineering", "Support", "Marketing", "Sales", "Legal", "Accounting"]
+
+# slug -> noun used to build product titles (search-friendly: "phone", "laptop", ...)
+_CATEGORIES = {
+    "beauty": "Mascara",
+    "fragrances": "Perfume",
+    "furniture": "Sofa",
+    "groceries": "Apples",
+    "home-decoration": "Vase",
+    "kitchen-accessories": "Blender",
+    "laptops": "Laptop",
+    "mens-shirts": "Shirt",
+    "mens-shoes": "Sneakers",
+    "mens-watches": "Watch",
+    "mobile-accessories": "Phone Charger",
+    "motorcycle": "Motorcycle",
+    "skin-care": "Moisturizer",
+    "smartphones": "Smartphone",
+    "sports-accessories": "Football",
+    "sunglasses": "Sunglasses",
+    "tablets": "Tablet",
+    "tops": "Top",
+    "vehicle": "Sedan",
+    "womens-bags": "Handbag",
+    "womens-dresses": "Dress",
+    "womens-jewellery": "Necklace",
+    "womens-shoes": "Heels",
+    "womens-watches": "Watch",
+}
+_BRANDS = ["Apple", "Samsung", "Essence", "Chanel", "Dior", "Gucci", "Asus", "Nike", "Rolex"]
+_ADJECTIVES = ["Classic", "Premium", "Compact", "Modern", "Deluxe", "Essential", "Pro"]
+
+_WORDS = (
+    "his mother had always taught him not to ever think of himself as better than others "
+    "the city lights glowed as the night settled over quiet streets and busy cafes "
+    "she wondered if the ocean would remember the footprints left along the shore"
+).split()
+_POST_TAGS = ["history", "american", "crime", "french", "fiction", "english", "magical", "love"]
+
+_CUISINES = ["Italian", "Asian", "American", "Mexican", "Mediterranean", "Indian", "Japanese"]
+_DISHES = [
+    "Chicken Alfredo", "Margherita Pizza", "Vegetable Stir-Fry", "Chicken Tikka Masala",
+    "Beef Tacos", "Greek Salad", "Pancakes", "Chicken Biryani", "Shrimp Scampi",
+    "Mushroom Risotto", "Breakfast Burrito", "Miso Soup",
+]  # fmt: skip
+_INGREDIENTS = ["Salt", "Pepper", "Olive oil", "Garlic", "Onion", "Tomato", "Butter", "Rice"]
+_MEAL_TYPES = ["Breakfast", "Lunch", "Dinner", "Snack", "Dessert"]
+_DIFFICULTIES = ["Easy", "Medium"]
+
+
+@dataclass(frozen=True)
+class Dataset:
+    users: list[dict[str, Any]]
+    products: list[dict[str, Any]]
+    categories: list[str]
+    posts: list[dict[str, Any]]
+    comments: list[dict[str, Any]]
+    carts: list[dict[str, Any]]
+    recipes: list[dict[str, Any]]
+    todos: list[dict[str, Any]]
+
+
+def _sentence(rng: random.Random, n_words: int) -> str:
+    words = [rng.choice(_WORDS) for _ in range(n_words)]
+    return " ".join(words).capitalize() + "."
+
+
+def _users(rng: random.Random) -> list[dict[str, Any]]:
+    users: list[dict[str, Any]] = []
+    for i in range(1, USERS_TOTAL + 1):
+        first = _FIRST_NAMES[(i - 1) % len(_FIRST_NAMES)]
+        last = _LAST_NAMES[((i - 1) // len(_FIRST_NAMES) + i) % len(_LAST_NAMES)]
+        username = f"{first[:5].lower()}{last[0].lower()}{i if i > 1 else ''}"
+        password = f"{username}pass"
+        if i == 1:
+            first, last, username, password = "Emily", "Johnson", DEMO_USERNAME, DEMO_PASSWORD
+        users.append(
+            {
+                "id": i,
+                "firstName": first,
+                "lastName": last,
+                "age": rng.randint(18, 70),
+                "gender": "female" if i % 2 else "male",
+                "email": f"{first.lower()}.{last.lower()}{i}@x.dummyjson.com",
+                "phone": f"+1 {rng.randint(200, 999)}-{rng.randint(200, 999)}-{rng.randint(1000, 9999)}",
+                "username": username,
+                "password": password,
+                "birthDate": f"{rng.randint(1955, 2005)}-{rng.randint(1, 12)}-{rng.randint(1, 28)}",
+                "image": f"https://dummyjson.com/icon/{username}/128",
+                "address": {
+                    "address": f"{rng.randint(100, 9999)} Main Street",
+                    "city": rng.choice(_CITIES),
+                    "postalCode": f"{rng.randint(10000, 99999)}",
+                    "country": "United States",
+                },
+                "company": {
+                    "department": rng.choice(_DEPARTMENTS),
+                    "name": f"{rng.choice(_LAST_NAMES)} Group",
+                    "title": "Manager",
+                },
+                "role": "admin" if i == 1 else "user",
+            }
+        )
+    return users
+
+
+def _products(rng: random.Random) -> list[dict[str, Any]]:
+    slugs = list(_CATEGORIES)
+    products: list[dict[str, Any]] = []
+    for i in range(1, PRODUCTS_TOTAL + 1):
+        category = slugs[(i - 1) % len(slugs)]
+        brand = rng.choice(_BRANDS)
+        title = f"{brand} {rng.choice(_ADJECTIVES)} {_CATEGORIES[category]}"
+        products.append(
+            {
+                "id": i,
+                "title": title,
+                "description": _sentence(rng, 12),
+                "category": category,
+                "price": round(rng.uniform(1, 1999), 2),
+                "discountPercentage": round(rng.uniform(0, 20), 2),
+                "rating": round(rng.uniform(1, 5), 2),
+                "stock": rng.randint(0, 150),
+                "tags": [category.split("-")[0]],
+                "brand": brand,
+                "sku": f"SKU-{i:05d}",
+                "thumbnail": f"https://cdn.dummyjson.com/products/images/{category}/{i}/thumbnail.png",
+                "images": [f"https://cdn.dummyjson.com/products/images/{category}/{i}/1.png"],
+            }
+        )
+    return products
+
+
+def _posts(rng: random.Random) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": i,
+            "title": _sentence(rng, 6)[:-1],
+            "body": _sentence(rng, 30),
+            "tags": rng.sample(_POST_TAGS, 3),
+            "reactions": {"likes": rng.randint(0, 2000), "dislikes": rng.randint(0, 200)},
+            "views": rng.randint(0, 5000),
+            "userId": rng.randint(1, USERS_TOTAL),
+        }
+        for i in range(1, POSTS_TOTAL + 1)
+    ]
+
+
+def _comments(rng: random.Random, users: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    comments: list[dict[str, Any]] = []
+    for i in range(1, COMMENTS_TOTAL + 1):
+        user = rng.choice(users)
+        comments.append(
+            {
+                "id": i,
+                "body": _sentence(rng, 8),
+                # Spread comments so every post in the first half has at least one.
+                "postId": (i - 1) % (POSTS_TOTAL // 2) + 1,
+                "likes": rng.randint(0, 10),
+                "user": {
+                    "id": user["id"],
+                    "username": user["username"],
+                    "fullName": f"{user['firstName']} {user['lastName']}",
+                },
+            }
+        )
+    return comments
+
+
+def cart_line(product: dict[str, Any], quantity: int) -> dict[str, Any]:
+    total = round(product["price"] * quantity, 2)
+    return {
+        "id": product["id"],
+        "title": product["title"],
+        "price": product["price"],
+        "quantity": quantity,
+        "total": total,
+        "discountPercentage": product["discountPercentage"],
+        "discountedTotal": round(total * (1 - product["discountPercentage"] / 100), 2),
+        "thumbnail": product["thumbnail"],
+    }
+
+
+def cart_totals(lines: list[dict[str, Any]]) -> dict[str, Any]:
+    return {
+        "total": round(sum(p["total"] for p in lines), 2),
+        "discountedTotal": round(sum(p["discountedTotal"] for p in lines), 2),
+        "totalProducts": len(lines),
+        "totalQuantity": sum(p["quantity"] for p in lines),
+    }
+
+
+def _carts(rng: random.Random, products: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    carts: list[dict[str, Any]] = []
+    for i in range(1, CARTS_TOTAL + 1):
+        lines = [cart_line(p, rng.randint(1, 5)) for p in rng.sample(products, rng.randint(1, 5))]
+        user_id = 1 if i == 1 else rng.randint(2, USERS_TOTAL)
+        carts.append({"id": i, "products": lines, **cart_totals(lines), "userId": user_id})
+    return carts
+
+
+def _recipes(rng: random.Random) -> list[dict[str, Any]]:
+    recipes: list[dict[str, Any]] = []
+    for i in range(1, RECIPES_TOTAL + 1):
+        dish = _DISHES[(i - 1) % len(_DISHES)]
+        cuisine = rng.choice(_CUISINES)
+        name = dish if i <= len(_DISHES) else f"{cuisine} {dish}"
+        recipes.append(
+            {
+                "id": i,
+                "name": name,
+                "ingredients": rng.sample(_INGREDIENTS, 4),
+                "instructions": [_sentence(rng, 8) for _ in range(3)],
+                "prepTimeMinutes": rng.randint(5, 30),
+                "cookTimeMinutes": rng.randint(5, 60),
+                "servings": rng.randint(1, 6),
+                "difficulty": rng.choice(_DIFFICULTIES),
+                "cuisine": cuisine,
+                "caloriesPerServing": rng.randint(100, 800),
+                "tags": [cuisine, dish.split()[-1]],
+                "userId": rng.randint(1, USERS_TOTAL),
+                "image": f"https://cdn.dummyjson.com/recipe-images/{i}.webp",
+                "rating": round(rng.uniform(3, 5), 1),
+                "reviewCount": rng.randint(0, 100),
+                "mealType": [_MEAL_TYPES[(i - 1) % len(_MEAL_TYPES)]],
+            }
+        )
+    return recipes
+
+
+def _todos(rng: random.Random) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": i,
+            "todo": _sentence(rng, 5),
+            "completed": rng.random() < 0.5,
+            # Keep user 1 populated for the child-resource endpoints.
+            "userId": 1 if i % 25 == 1 else rng.randint(1, USERS_TOTAL),
+        }
+        for i in range(1, TODOS_TOTAL + 1)
+    ]
+
+
+@lru_cache(maxsize=1)
+def load_dataset(seed: int = 42) -> Dataset:
+    """
+    Deterministic DummyJSON-shaped dataset (built once per process).
+    Treat as read-only: handlers copy records before changing them.
+    """
+    rng = random.Random(seed)
+    users = _users(rng)
+    products = _products(rng)
+    return Dataset(
+        users=users,
+        products=products,
+        categories=list(_CATEGORIES),
+        posts=_posts(rng),
+        comments=_comments(rng, users),
+        carts=_carts(rng, products),
+        recipes=_recipes(rng),
+        todos=_todos(rng),
+    )
@@ -0,0 +1,154 @@
+"""
+Pluggable JSON codec (JSON_CODEC): stdlib `json` by default, orjson / msgspec when installed.
+
+Every codec has the same three calls:
+
+    loads(bytes | str) -> Any          raises ValueError on invalid JSON
+    dumps(obj) -> bytes                compact UTF-8, the bytes httpx would send for `json=`
+    dumps_text(obj, indent=, sort_keys=) -> str    report / artifact files
+
+Decoded values are plain dict / list / str / int / float / bool / None whichever codec
+decodes them. "auto" picks the first installed of orjson, msgspec, falling back to stdlib.
+
+ApiClient uses the codec of its Settings; code without a Settings at hand (schema files,
+reporting CLIs) uses default_codec(): the one configure_default() set (the pytest session
+does that from JSON_CODEC), else the JSON_CODEC environment variable, else stdlib.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import threading
+from typing import Any
+
+JSON_CODECS = ("stdlib", "orjson", "msgspec", "auto")
+
+# "auto" preference, fastest first
+_AUTO_ORDER = ("orjson", "msgspec")
+
+
+class JsonCodec:
+    """The stdlib codec; the faster ones override the three calls."""
+
+    name = "stdlib"
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        # Same options as httpx's own `json=` encoding.
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode(
+            "utf-8"
+        )
+
+    def dumps_text(self, obj: Any, *, indent: bool = False, sort_keys: bool = False) -> str:
+        return json.dumps(obj, indent=2 if indent else None, sort_keys=sort_keys)
+
+
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+        # The stdlib turns int / float / bool dict keys into strings; so do we.
+        self._option = orjson.OPT_NON_STR_KEYS
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._orjson.loads(data)  # orjson.JSONDecodeError is a ValueError
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj, option=self._option)
+
+    def dumps_text(self, obj: Any, *, indent: bool = False, sort_keys: bool = False) -> str:
+        option = self._option
+        if indent:
+            option |= self._orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= self._orjson.OPT_SORT_KEYS
+        return self._orjson.dumps(obj, option=option).decode("utf-8")
+
+
+class MsgspecCodec(JsonCodec):
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._msgspec = msgspec
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+        self._sorted_encoder = msgspec.json.Encoder(order="sorted")
+
+    def loads(self, data: bytes | str) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._msgspec.DecodeError as exc:
+            raise ValueError(str(exc)) from None
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def dumps_text(self, obj: Any, *, indent: bool = False, sort_keys: bool = False) -> str:
+        data = (self._sorted_encoder if sort_keys else self._encoder).encode(obj)
+        if indent:
+            data = self._msgspec.json.format(data, indent=2)
+        return data.decode("utf-8")
+
+
+_FACTORIES: dict[str, type[JsonCodec]] = {
+    "stdlib": JsonCodec,
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+}
+
+_codecs: dict[str, JsonCodec] = {}
+_default: str | None = None
+_lock = threading.Lock()
+
+
+def codec_available(name: str) -> bool:
+    """Whether `name` can be used here (its library is installed); "auto" always can."""
+    if name in ("stdlib", "auto"):
+        return True
+    return name in _FACTORIES and importlib.util.find_spec(name) is not None
+
+
+def resolve_codec_name(name: str) -> str:
+    """Concrete codec name for a JSON_CODEC value ("auto" -> best installed)."""
+    if name not in JSON_CODECS:
+        raise ValueError(f"Unknown JSON codec {name!r}; use one of {JSON_CODECS}")
+    if name == "auto":
+        return next((n for n in _AUTO_ORDER if codec_available(n)), "stdlib")
+    return name
+
+
+def get_codec(name: str = "stdlib") -> JsonCodec:
+    """Process-wide codec instance; raises ValueError when its library is missing."""
+    name = resolve_codec_name(name)
+    with _lock:
+        codec = _codecs.get(name)
+        if codec is None:
+            if not codec_available(name):
+                raise ValueError(
+                    f"JSON codec {name!r} needs the {name} package (pip install {name})"
+                )
+            codec = _codecs[name] = _FACTORIES[name]()
+    return codec
+
+
+def configure_default(name: str) -> JsonCodec:
+    """Make `name` the codec default_codec() returns (e.g. from Settings.json_codec)."""
+    global _default
+    codec = get_codec(name)
+    _default = codec.name
+    return codec
+
+
+def default_codec() -> JsonCodec:
+    if _default is not None:
+        return get_codec(_default)
+    return get_codec(os.getenv("JSON_CODEC", "").strip() or "stdlib")
@@ -0,0 +1,164 @@
+"""
+Incremental decoding of the item list of a JSON response.
+
+JsonItemStream is fed the body chunk by chunk (e.g. httpx `iter_bytes()`) and returns the
+items of one top-level array as soon as each is complete:
+
+    {"products": [{...}, {...}, ...], "total": 194, ...}   key="products"
+    [{...}, {...}, ...]                                      key=None
+
+Only the current item (plus one chunk) is buffered, so memory stays flat however long the
+list is. Other top-level keys before the list are decoded and dropped; everything after
+the list's closing bracket is ignored.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+from typing import Any
+
+_WHITESPACE = " \t\n\r"
+# What may follow a complete value; anything else may be more of it ("1" + ".5", "1e" + "3")
+_VALUE_END = frozenset(_WHITESPACE + ",]}:")
+_COMPACT_AT = 1 << 16
+
+
+class JsonStreamError(ValueError):
+    """The body is not JSON of the expected shape."""
+
+
+class _NeedMore(Exception):
+    pass
+
+
+class JsonItemStream:
+    def __init__(self, key: str | None = None):
+        self.key = key
+        self.items_seen = 0
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pos = 0
+        self._final = False
+        # start -> (keys_first | keys_next)* -> items_first -> items_next* -> done
+        self._state = "start"
+
+    # -----------------------
+    # Public API
+    # -----------------------
+
+    def feed(self, data: bytes) -> list[Any]:
+        self._buf += self._text.decode(data)
+        return self._drain()
+
+    def close(self) -> list[Any]:
+        """Flush the tail; raises JsonStreamError if the list never completed."""
+        self._buf += self._text.decode(b"", final=True)
+        self._final = True
+        items = self._drain()
+        if self._state == "missing":
+            raise JsonStreamError(f"Top-level key {self.key!r} not found")
+        if self._state != "done":
+            raise JsonStreamError(
+                f"Body ended inside the item list after {self.items_seen} item(s)"
+            )
+        return items
+
+    # -----------------------
+    # Parsing
+    # -----------------------
+
+    def _drain(self) -> list[Any]:
+        items: list[Any] = []
+        while self._state not in ("done", "missing"):
+            start = self._pos
+            try:
+                item = self._step()
+            except _NeedMore:
+                self._pos = start
+                break
+            if item is not _NOTHING:
+                items.append(item)
+        if self._pos >= _COMPACT_AT:
+            self._buf = self._buf[self._pos :]
+            self._pos = 0
+        self.items_seen += len(items)
+        return items
+
+    def _step(self) -> Any:
+        state = self._state
+        ch = self._peek()
+
+        if state == "start":
+            expected = "{" if self.key is not None else "["
+            if ch != expected:
+                raise JsonStreamError(f"Expected {expected!r} at the top level, got {ch!r}")
+            self._pos += 1
+            self._state = "keys_first" if self.key is not None else "items_first"
+            return _NOTHING
+
+        if state in ("keys_first", "keys_next"):
+            if ch == "}":
+                self._pos += 1
+                self._state = "missing"
+                return _NOTHING
+            if state == "keys_next":
+                self._expect(",")
+            name = self._value()
+            if not isinstance(name, str):
+                raise JsonStreamError(f"Expected an object key, got {name!r}")
+            self._expect(":")
+            if name == self.key:
+                self._expect("[")
+                self._state = "items_first"
+            else:
+                self._value()  # some other top-level field: decode and drop
+                self._state = "keys_next"
+            return _NOTHING
+
+        # items_first / items_next
+        if ch == "]":
+            self._pos += 1
+            self._state = "done"
+            return _NOTHING
+        if state == "items_next":
+            self._expect(",")
+        item = self._value()
+        self._state = "items_next"
+        return item
+
+    def _peek(self) -> str:
+        buf, pos = self._buf, self._pos
+        while pos < len(buf) and buf[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+        if pos >= len(buf):
+            if self._final:
+                raise JsonStreamError("Unexpected end of body")
+            raise _NeedMore
+        return buf[pos]
+
+    def _expect(self, ch: str) -> None:
+        got = self._peek()
+        if got != ch:
+            raise JsonStreamError(f"Expected {ch!r} at offset {self._pos}, got {got!r}")
+        self._pos += 1
+
+    def _value(self) -> Any:
+        self._peek()
+        try:
+            value, end = self._decoder.raw_decode(self._buf, self._pos)
+        except json.JSONDecodeError as exc:
+            if self._final:
+                raise JsonStreamError(str(exc)) from None
+            raise _NeedMore from None
+        if not self._final and (end >= len(self._buf) or self._buf[end] not in _VALUE_END):
+            # A number split across chunks decodes as a shorter prefix ("1" of "1.5"):
+            # only a delimiter after it proves the value is complete.
+            raise _NeedMore
+        self._pos = end
+        return value
+
+
+_NOTHING: Any = object()
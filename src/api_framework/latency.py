@@ -0,0 +1,73 @@
+"""
+Endpoint latency histograms (process-wide).
+
+Every ApiClient / AsyncApiClient in the process records the end-to-end latency of each
+request it sends (retries and backoff included; cache hits and replays excluded) under
+"METHOD /route/{id}". The pytest session writes them next to the JUnit XML and
+reporting/metrics.py merges workers into p50 / p90 / p99 / max per endpoint.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import threading
+from collections.abc import Iterator
+from typing import Any
+
+from .histogram import LogHistogram
+
+
+class LatencyRecorder:
+    def __init__(self) -> None:
+        self._histograms: dict[str, LogHistogram] = {}
+        self._listeners: list[LatencyRecorder] = []
+        self._lock = threading.Lock()
+
+    def record(self, key: str, elapsed_ms: float) -> None:
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = LogHistogram()
+            hist.record(elapsed_ms)
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener.record(key, elapsed_ms)
+
+    @contextlib.contextmanager
+    def capture(self) -> Iterator[LatencyRecorder]:
+        """A scratch recorder that also receives everything recorded here while open."""
+        captured = LatencyRecorder()
+        with self._lock:
+            self._listeners.append(captured)
+        try:
+            yield captured
+        finally:
+            with self._lock:
+                self._listeners.remove(captured)
+
+    def histogram(self, key: str | None = None) -> LogHistogram:
+        """One endpoint's histogram, or all endpoints merged (key=None)."""
+        merged = LogHistogram()
+        with self._lock:
+            for k, h in self._histograms.items():
+                if key is None or k == key:
+                    merged.merge(h)
+        return merged
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            return {key: h.to_dict() for key, h in sorted(self._histograms.items())}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+    def __len__(self) -> int:
+        return len(self._histograms)
+
+
+_shared = LatencyRecorder()
+
+
+def shared_recorder() -> LatencyRecorder:
+    return _shared
@@ -0,0 +1,140 @@
+"""
+pytest plugin: latency budgets (SLOs) per test and endpoint.
+
+    @pytest.mark.latency_budget(p95_ms=200, route="GET /products/{id}")
+    @pytest.mark.latency_budget(max_ms=1500)                 # every request made by the test
+    @pytest.mark.latency_budget(p99_ms=300, route="GET /users/search", mode="warn")
+
+Limits: p50_ms, p90_ms, p95_ms, p99_ms, max_ms. `route` is "METHOD /template/{id}" as used
+in the metrics report; without it the budget covers all requests of the test.
+
+Requests are captured from every ApiClient / AsyncApiClient in the process (the `api`
+fixture included) while the test body runs; fixture setup is not counted. A budget
+with no matching request (typo in `route`, or every call served by the response cache)
+only warns.
+
+`--latency-budget=fail|warn|off` (default fail) sets the mode for markers that don't
+choose one; "off" skips the checks entirely.
+"""
+
+from __future__ import annotations
+
+import warnings
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+
+from .histogram import LogHistogram
+from .latency import LatencyRecorder, shared_recorder
+
+LIMITS: dict[str, float] = {
+    "p50_ms": 50,
+    "p90_ms": 90,
+    "p95_ms": 95,
+    "p99_ms": 99,
+    "max_ms": 100,
+}
+MODES = ("fail", "warn", "off")
+
+
+class LatencyBudgetExceeded(AssertionError):
+    """A test broke a latency_budget marker (mode=fail)."""
+
+
+class LatencyBudgetWarning(UserWarning):
+    """A test broke a latency_budget marker (mode=warn)."""
+
+
+@dataclass(frozen=True)
+class LatencyBudget:
+    limits: dict[str, float]
+    route: str | None = None
+    mode: str | None = None
+
+    @classmethod
+    def from_marker(cls, marker: pytest.Mark) -> LatencyBudget:
+        kwargs: dict[str, Any] = dict(marker.kwargs)
+        route = kwargs.pop("route", None)
+        mode = kwargs.pop("mode", None)
+        unknown = set(kwargs) - set(LIMITS)
+        if marker.args or unknown or not kwargs:
+            raise pytest.UsageError(
+                f"latency_budget takes route=, mode= and at least one of {', '.join(LIMITS)}; "
+                f"got args={marker.args} kwargs={marker.kwargs}"
+            )
+        if mode is not None and mode not in MODES:
+            raise pytest.UsageError(f"latency_budget mode must be one of {MODES}, got {mode!r}")
+        return cls(limits={k: float(v) for k, v in kwargs.items()}, route=route, mode=mode)
+
+    @property
+    def label(self) -> str:
+        return self.route or "all requests"
+
+    def check(self, recorder: LatencyRecorder) -> list[str] | None:
+        """Human-readable violations (empty when the budget holds, None without samples)."""
+        label = self.label
+        hist: LogHistogram = recorder.histogram(self.route)
+        if not hist.count:
+            return None
+
+        problems = []
+        for name, limit in self.limits.items():
+            pct = LIMITS[name]
+            observed = hist.max if pct == 100 else hist.percentile(pct)
+            if observed > limit:
+                problems.append(
+                    f"{label}: {name.removesuffix('_ms')} {observed:.1f} ms > budget "
+                    f"{limit:g} ms (n={hist.count})"
+                )
+        return problems
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--latency-budget",
+        action="store",
+        default="fail",
+        choices=MODES,
+        help="What a broken @pytest.mark.latency_budget does: fail (default), warn or off",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        "latency_budget(p95_ms=..., route='GET /path/{id}', mode='fail'|'warn'): "
+        "per-test latency SLO",
+    )
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item: pytest.Item):
+    default_mode = item.config.getoption("--latency-budget")
+    budgets = [LatencyBudget.from_marker(m) for m in item.iter_markers("latency_budget")]
+    if not budgets or default_mode == "off":
+        return (yield)
+
+    with shared_recorder().capture() as captured:
+        result = yield
+
+    failures: list[str] = []
+    for budget in budgets:
+        mode = budget.mode or default_mode
+        if mode == "off":
+            continue
+        problems = budget.check(captured)
+        if problems is None:
+            warnings.warn(
+                LatencyBudgetWarning(f"{budget.label}: no requests recorded"), stacklevel=1
+            )
+            continue
+        for problem in problems:
+            if mode == "fail":
+                failures.append(problem)
+            else:
+                warnings.warn(LatencyBudgetWarning(problem), stacklevel=1)
+
+    if failures:
+        raise LatencyBudgetExceeded("Latency budget exceeded:\n  " + "\n  ".join(failures))
+    return result
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import dataclasses
+import json
+from pathlib import Path
+from typing import Any
+
+from api_framework.config import settings_for
+from api_framework.load.runner import LoadRunner
+from api_framework.load.scenario import ScenarioError, load_scenario
+from api_framework.validation.settings import validate_settings
+
+# Open-loop load / soak driver for the domain clients:
+#   python -m api_framework.load tools/load/browse.toml --env inproc
+#   python -m api_framework.load tools/load/browse.toml --env staging --rps 100 --duration 600
+#
+# Prints throughput, error rate and latency percentiles per report window and overall;
+# --out-json keeps the full report.
+
+
+def format_report(report: dict[str, Any]) -> str:
+    lat = report["latency"]
+    lines = [
+        f"Scenario {report['scenario']}: target {report['target_rps']} rps "
+        f"for {report['duration_seconds']}s",
+        "",
+        f"{'t (s)':>7} {'done':>7} {'rps':>8} {'err':>5} {'drop':>5} "
+        f"{'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9}",
+    ]
+    for w in report["windows"]:
+        lines.append(
+            f"{w['t_start_s']:>7} {w['completed']:>7} {w['rps']:>8} {w['errors']:>5} "
+            f"{w['dropped']:>5} {w['p50_ms']:>9} {w['p90_ms']:>9} {w['p99_ms']:>9} {w['max_ms']:>9}"
+        )
+    lines += [
+        "",
+        f"Completed {report['completed']}/{report['scheduled']} "
+        f"(dropped {report['dropped']}) in {report['elapsed_seconds']}s "
+        f"-> {report['achieved_rps']} rps, errors {report['error_rate_percent']}%",
+        f"Latency p50 {lat['p50_ms']} / p90 {lat['p90_ms']} / p99 {lat['p99_ms']} "
+        f"/ max {lat['max_ms']} ms",
+        "",
+    ]
+    for name, c in report["calls"].items():
+        lines.append(
+            f"  {name:<40} n={c['count']:<6} err={c['errors']:<5} "
+            f"p50={c['p50_ms']} p90={c['p90_ms']} p99={c['p99_ms']} ms"
+        )
+    if report["errors"]:
+        lines.append("")
+        lines.append("Errors: " + ", ".join(f"{k}={v}" for k, v in report["errors"].items()))
+    return "\n".join(lines)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(prog="python -m api_framework.load")
+    ap.add_argument("scenario", help="Scenario file (.toml or .json)")
+    ap.add_argument(
+        "--env", default="local", help="env/.env.<name> to load; 'inproc' = in-process stand-in"
+    )
+    ap.add_argument("--rps", type=float, default=None, help="Override target_rps")
+    ap.add_argument("--duration", type=float, default=None, help="Override duration_seconds")
+    ap.add_argument("--seed", type=int, default=None, help="Override seed")
+    ap.add_argument("--out-json", default="", help="Write the full report as JSON")
+    args = ap.parse_args()
+
+    try:
+        scenario = load_scenario(args.scenario)
+    except (OSError, ScenarioError) as exc:
+        print(f"ERROR: {exc}")
+        return 2
+
+    overrides = {
+        "target_rps": args.rps,
+        "duration_seconds": args.duration,
+        "seed": args.seed,
+    }
+    scenario = dataclasses.replace(
+        scenario, **{k: v for k, v in overrides.items() if v is not None}
+    )
+
+    settings = settings_for(args.env)
+    validate_settings(settings)
+
+    report = asyncio.run(LoadRunner(scenario, settings).run()).as_dict()
+    print(format_report(report))
+
+    if args.out_json:
+        out = Path(args.out_json)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(json.dumps(report, indent=2, sort_keys=True), encoding="utf-8")
+        print(f"\nWrote {out}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
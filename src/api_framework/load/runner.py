@@ -0,0 +1,176 @@
+"""
+Open-loop load runner.
+
+Arrivals are scheduled at a fixed 1 / target_rps interval no matter how fast responses
+come back, and latency is measured from each call's *scheduled* start, so a slow
+backend shows up as latency instead of silently lowering the request rate
+(no coordinated omission). When more than `max_in_flight` calls are outstanding, new
+arrivals are dropped and counted rather than queued.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from api_framework.client import AsyncApiClient
+from api_framework.config import Settings
+from api_framework.histogram import LogHistogram
+from api_framework.load.scenario import Scenario, ScenarioCall, async_client_classes
+
+
+@dataclass
+class _Window:
+    latency: LogHistogram = field(default_factory=LogHistogram)
+    errors: int = 0
+    dropped: int = 0
+
+
+@dataclass
+class LoadReport:
+    scenario: Scenario
+    elapsed_seconds: float = 0.0
+    scheduled: int = 0
+    dropped: int = 0
+    errors: Counter[str] = field(default_factory=Counter)
+    latency: LogHistogram = field(default_factory=LogHistogram)
+    per_call: dict[str, LogHistogram] = field(default_factory=dict)
+    per_call_errors: Counter[str] = field(default_factory=Counter)
+    windows: dict[int, _Window] = field(default_factory=dict)
+
+    @property
+    def completed(self) -> int:
+        return self.latency.count
+
+    def window(self, index: int) -> _Window:
+        w = self.windows.get(index)
+        if w is None:
+            w = self.windows[index] = _Window()
+        return w
+
+    def as_dict(self) -> dict[str, Any]:
+        s = self.scenario
+        error_total = sum(self.errors.values())
+        return {
+            "scenario": s.name,
+            "target_rps": s.target_rps,
+            "duration_seconds": s.duration_seconds,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "scheduled": self.scheduled,
+            "completed": self.completed,
+            "dropped": self.dropped,
+            "achieved_rps": round(self.completed / self.elapsed_seconds, 2)
+            if self.elapsed_seconds
+            else 0.0,
+            "error_rate_percent": round(error_total / self.completed * 100, 2)
+            if self.completed
+            else 0.0,
+            "errors": dict(self.errors.most_common()),
+            "latency": self.latency.summary(),
+            "calls": {
+                name: {**h.summary(), "errors": self.per_call_errors.get(name, 0)}
+                for name, h in sorted(self.per_call.items())
+            },
+            "windows": [
+                {
+                    "t_start_s": round(i * s.window_seconds, 3),
+                    "completed": w.latency.count,
+                    "rps": round(w.latency.count / _window_span(s, i), 2),
+                    "errors": w.errors,
+                    "dropped": w.dropped,
+                    **{k: v for k, v in w.latency.summary().items() if k != "count"},
+                }
+                for i, w in sorted(self.windows.items())
+            ],
+        }
+
+
+def _window_span(s: Scenario, index: int) -> float:
+    # The last window may be cut short by the end of the run.
+    return max(min(s.window_seconds, s.duration_seconds - index * s.window_seconds), 1e-9)
+
+
+def _error_name(result: Any) -> str | None:
+    # Raw (*_raw) methods return the Response; strict ones raise on non-2xx.
+    if isinstance(result, httpx.Response) and result.is_error:
+        return f"HTTP {result.status_code}"
+    return None
+
+
+class LoadRunner:
+    def __init__(self, scenario: Scenario, settings: Settings):
+        self.scenario = scenario
+        self.settings = settings
+        self.rng = random.Random(scenario.seed)
+        self.report = LoadReport(scenario=scenario)
+
+    async def _one(
+        self, call: ScenarioCall, fn: Any, kwargs: dict[str, Any], scheduled: float, window: int
+    ) -> None:
+        error: str | None
+        try:
+            error = _error_name(await fn(**kwargs))
+        except httpx.HTTPStatusError as exc:
+            error = f"HTTP {exc.response.status_code}"
+        except Exception as exc:
+            error = type(exc).__name__
+
+        latency_ms = (time.perf_counter() - scheduled) * 1000
+        report = self.report
+        report.latency.record(latency_ms)
+        report.window(window).latency.record(latency_ms)
+        hist = report.per_call.get(call.name)
+        if hist is None:
+            hist = report.per_call[call.name] = LogHistogram()
+        hist.record(latency_ms)
+        if error is not None:
+            report.errors[error] += 1
+            report.per_call_errors[call.name] += 1
+            report.window(window).errors += 1
+
+    async def run(self) -> LoadReport:
+        s = self.scenario
+        concurrency = int(s.concurrency or self.settings.max_concurrency)
+        max_in_flight = int(s.max_in_flight or concurrency * 10)
+        interval = 1.0 / s.target_rps
+        total = int(s.duration_seconds * s.target_rps)
+        weights = [c.weight for c in s.calls]
+
+        async with AsyncApiClient(self.settings, max_concurrency=concurrency) as api:
+            classes = async_client_classes()
+            bound = [getattr(classes[c.client](api), c.method) for c in s.calls]
+
+            pending: set[asyncio.Task[None]] = set()
+            start = time.perf_counter()
+            for n in range(total):
+                scheduled = start + n * interval
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                window = int(n * interval // s.window_seconds)
+                self.report.scheduled += 1
+                if len(pending) >= max_in_flight:
+                    self.report.dropped += 1
+                    self.report.window(window).dropped += 1
+                    continue
+
+                i = self.rng.choices(range(len(s.calls)), weights=weights)[0]
+                call = s.calls[i]
+                task = asyncio.create_task(
+                    self._one(call, bound[i], call.sample_args(self.rng), scheduled, window)
+                )
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+
+            if pending:
+                await asyncio.gather(*pending)
+            self.report.elapsed_seconds = time.perf_counter() - start
+
+        return self.report
@@ -0,0 +1,145 @@
+"""
+Load scenarios: weighted domain-client calls plus the rate / duration to drive them at.
+
+Scenario file (TOML or JSON):
+
+    name = "browse"
+    target_rps = 50
+    duration_seconds = 30
+    window_seconds = 5       # report interval
+    concurrency = 20         # connections / in-flight HTTP requests (AsyncApiClient)
+    max_in_flight = 200      # outstanding calls before new arrivals are dropped
+    seed = 42                # call mix + argument sampling are reproducible
+
+    [[calls]]
+    call = "ProductsClient.search_products"
+    weight = 60
+    args = { q = { choice = ["phone", "laptop", "watch"] } }
+
+    [[calls]]
+    call = "UsersClient.get_user"
+    weight = 30
+    args = { user_id = { range = [1, 208] } }
+
+Argument values are literals, `{ choice = [...] }` (uniform pick) or `{ range = [lo, hi] }`
+(uniform int, inclusive). Calls run on the Async* variant of the named client.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import pkgutil
+import random
+import tomllib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import api_framework.clients as clients_pkg
+
+
+class ScenarioError(ValueError):
+    """Invalid scenario file."""
+
+
+@dataclass(frozen=True)
+class ScenarioCall:
+    client: str  # e.g. "ProductsClient"
+    method: str  # e.g. "search_products"
+    weight: float
+    args: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def name(self) -> str:
+        return f"{self.client}.{self.method}"
+
+    def sample_args(self, rng: random.Random) -> dict[str, Any]:
+        return {key: _sample(value, rng) for key, value in self.args.items()}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    calls: list[ScenarioCall]
+    target_rps: float
+    duration_seconds: float
+    window_seconds: float = 5.0
+    concurrency: int | None = None
+    max_in_flight: int | None = None
+    seed: int | None = None
+
+
+def _sample(value: Any, rng: random.Random) -> Any:
+    if isinstance(value, dict) and len(value) == 1:
+        if "choice" in value:
+            return rng.choice(value["choice"])
+        if "range" in value:
+            lo, hi = value["range"]
+            return rng.randint(int(lo), int(hi))
+    return value
+
+
+def async_client_classes() -> dict[str, type]:
+    """'ProductsClient' -> AsyncProductsClient, for every module in api_framework.clients."""
+    found: dict[str, type] = {}
+    for mod in pkgutil.iter_modules(clients_pkg.__path__):
+        if not mod.name.endswith("_client"):
+            continue
+        module = importlib.import_module(f"{clients_pkg.__name__}.{mod.name}")
+        for attr, obj in vars(module).items():
+            if (
+                attr.startswith("Async")
+                and isinstance(obj, type)
+                and obj.__module__ == module.__name__
+            ):
+                found[attr.removeprefix("Async")] = obj
+    return found
+
+
+def _parse_call(raw: dict[str, Any], classes: dict[str, type]) -> ScenarioCall:
+    client, _, method = str(raw.get("call", "")).partition(".")
+    if client not in classes:
+        raise ScenarioError(f"Unknown client {client!r}; known: {', '.join(sorted(classes))}")
+    if method.startswith("_") or not callable(getattr(classes[client], method, None)):
+        raise ScenarioError(f"{client} has no method {method!r}")
+    if method.startswith(("iter_", "stream_")):
+        raise ScenarioError(f"{client}.{method} is an item iterator, not a single call")
+
+    weight = float(raw.get("weight", 1))
+    if weight <= 0:
+        raise ScenarioError(f"{client}.{method}: weight must be > 0")
+    return ScenarioCall(
+        client=client, method=method, weight=weight, args=dict(raw.get("args") or {})
+    )
+
+
+def parse_scenario(data: dict[str, Any], *, default_name: str = "scenario") -> Scenario:
+    classes = async_client_classes()
+    calls = [_parse_call(c, classes) for c in data.get("calls") or []]
+    if not calls:
+        raise ScenarioError("Scenario needs at least one [[calls]] entry")
+
+    scenario = Scenario(
+        name=str(data.get("name") or default_name),
+        calls=calls,
+        target_rps=float(data.get("target_rps", 10)),
+        duration_seconds=float(data.get("duration_seconds", 30)),
+        window_seconds=float(data.get("window_seconds", 5)),
+        concurrency=data.get("concurrency"),
+        max_in_flight=data.get("max_in_flight"),
+        seed=data.get("seed"),
+    )
+    if scenario.target_rps <= 0 or scenario.duration_seconds <= 0 or scenario.window_seconds <= 0:
+        raise ScenarioError("target_rps, duration_seconds and window_seconds must be > 0")
+    return scenario
+
+
+def load_scenario(path: str | Path) -> Scenario:
+    path = Path(path)
+    raw = path.read_bytes()
+    if path.suffix.lower() == ".json":
+        data = json.loads(raw)
+    else:
+        data = tomllib.loads(raw.decode("utf-8"))
+    return parse_scenario(data, default_name=path.stem)
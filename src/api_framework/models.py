@@ -0,0 +1,425 @@
+"""
+Typed, slotted models for the DummyJSON entities (User, Product, Post, Comment, Cart, Recipe).
+
+Models are `@dataclass(slots=True, kw_only=True)` classes whose snake_case attributes map to
+the camelCase JSON keys (`first_name` <- "firstName"). Keys a model has no field for are
+kept, as they came, in its `extra` dict (None when there are none) and as_dict() puts them
+back, so nothing in the payload is lost. A catalog of models retains about 15-30% less
+memory than the parsed dicts of the same payload (the strings are shared;
+tools/bench/models.py); keys kept in `extra` cost what they cost in a dict.
+
+    page = decode_page(Product, data, key="products")
+    page.items[0].discount_percentage
+    user = decode(User, data, validate=True)
+
+decode() does not go through __init__. By default values are taken as they come (nested
+models are still built) and absent fields are None. validate=True also checks required
+fields and JSON types while decoding and raises ModelValidationError with every problem and
+its JSON pointer, like validate_list_items. It is not a JSON Schema check (no formats, ranges,
+and the keys in `extra` are not checked).
+"""
+
+from __future__ import annotations
+
+import functools
+import types
+import typing
+from collections.abc import Callable
+from dataclasses import MISSING, dataclass, field, fields
+from typing import Any, Generic, TypeVar
+
+from .validation.items import MAX_REPORTED_ERRORS, ItemError, json_pointer
+
+M = TypeVar("M", bound="Model")
+
+_MISSING: Any = object()
+
+
+class ModelValidationError(ValueError):
+    def __init__(self, model: type, errors: list[ItemError]):
+        lines = [f"{e.pointer or '/'}: {e.message}" for e in errors[:MAX_REPORTED_ERRORS]]
+        more = len(errors) - MAX_REPORTED_ERRORS
+        if more > 0:
+            lines.append(f"... and {more} more")
+        super().__init__(
+            f"{len(errors)} error(s) decoding {model.__name__}:\n  " + "\n  ".join(lines)
+        )
+        self.errors = errors
+
+
+@dataclass(slots=True, kw_only=True)
+class Model:
+    """Base of the entity models; `extra` holds the JSON keys the model has no field for."""
+
+    extra: dict[str, Any] | None = field(default=None, repr=False)
+
+    @classmethod
+    def from_json(cls: type[M], data: Any, *, validate: bool = False) -> M:
+        return decode(cls, data, validate=validate)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Back to the JSON shape (camelCase keys, plus `extra`); None fields are left out."""
+        out: dict[str, Any] = {}
+        for f in _spec(type(self)):
+            value = getattr(self, f.attr)
+            if value is not None:
+                out[f.key] = _encode(value)
+        if self.extra:
+            out.update(self.extra)
+        return out
+
+
+# -----------------------
+# Entities
+# -----------------------
+
+
+@dataclass(slots=True, kw_only=True)
+class Address(Model):
+    address: str | None = None
+    city: str | None = None
+    postal_code: str | None = None
+    country: str | None = None
+
+
+@dataclass(slots=True, kw_only=True)
+class Company(Model):
+    name: str | None = None
+    department: str | None = None
+    title: str | None = None
+
+
+@dataclass(slots=True, kw_only=True)
+class User(Model):
+    id: int
+    username: str
+    first_name: str | None = None
+    last_name: str | None = None
+    age: int | None = None
+    gender: str | None = None
+    email: str | None = None
+    phone: str | None = None
+    birth_date: str | None = None
+    image: str | None = None
+    role: str | None = None
+    address: Address | None = None
+    company: Company | None = None
+
+
+@dataclass(slots=True, kw_only=True)
+class Product(Model):
+    id: int
+    title: str
+    price: float
+    category: str
+    description: str | None = None
+    discount_percentage: float | None = None
+    rating: float | None = None
+    stock: int | None = None
+    brand: str | None = None
+    sku: str | None = None
+    thumbnail: str | None = None
+    tags: list[str] | None = None
+    images: list[str] | None = None
+
+
+@dataclass(slots=True, kw_only=True)
+class Reactions(Model):
+    likes: int | None = None
+    dislikes: int | None = None
+
+
+@dataclass(slots=True, kw_only=True)
+class Post(Model):
+    id: int
+    title: str
+    body: str
+    user_id: int
+    tags: list[str]
+    reactions: Reactions | int  # older DummyJSON data has a plain count
+    views: int
+
+
+@dataclass(slots=True, kw_only=True)
+class CommentUser(Model):
+    id: int | None = None
+    username: str | None = None
+    full_name: str | None = None
+
+
+@dataclass(slots=True, kw_only=True)
+class Comment(Model):
+    id: int
+    body: str
+    post_id: int
+    user: CommentUser
+    likes: int | None = None
+
+
+@dataclass(slots=True, kw_only=True)
+class CartProduct(Model):
+    id: int
+    title: str
+    price: float
+    quantity: int
+    total: float
+    discount_percentage: float
+    discounted_total: float
+    thumbnail: str | None = None
+
+
+@dataclass(slots=True, kw_only=True)
+class Cart(Model):
+    id: int
+    user_id: int
+    products: list[CartProduct]
+    total: float
+    discounted_total: float
+    total_products: int
+    total_quantity: int
+
+
+@dataclass(slots=True, kw_only=True)
+class Recipe(Model):
+    id: int
+    name: str
+    ingredients: list[str] | None = None
+    instructions: list[str] | None = None
+    prep_time_minutes: int | None = None
+    cook_time_minutes: int | None = None
+    servings: int | None = None
+    difficulty: str | None = None
+    cuisine: str | None = None
+    calories_per_serving: int | None = None
+    tags: list[str] | None = None
+    user_id: int | None = None
+    image: str | None = None
+    rating: float | None = None
+    review_count: int | None = None
+    meal_type: list[str] | None = None
+
+
+@dataclass(slots=True)
+class Page(Generic[M]):
+    """A `limit/skip` list response: the decoded items plus the envelope counters."""
+
+    items: list[M]
+    total: int
+    skip: int
+    limit: int
+
+
+# -----------------------
+# Decoding
+# -----------------------
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, Model):
+        return value.as_dict()
+    if type(value) is list:
+        return [_encode(v) for v in value]
+    return value
+
+
+# Python type -> (JSON type name, instance check); bool is not a number, 1.0 is an integer
+_SCALARS: dict[Any, tuple[str, Callable[[Any], bool]]] = {
+    int: ("integer", lambda v: type(v) is int or (type(v) is float and v.is_integer())),
+    float: ("number", lambda v: type(v) is int or type(v) is float),
+    str: ("string", lambda v: type(v) is str),
+    bool: ("boolean", lambda v: type(v) is bool),
+    type(None): ("null", lambda v: v is None),
+}
+
+
+@dataclass(frozen=True)
+class _Shape:
+    kind: str  # "any" | "scalar" | "model" | "list" | "union"
+    json_type: str
+    check: Callable[[Any], bool] | None = None  # scalar
+    model: type | None = None  # model
+    inner: tuple[_Shape, ...] = ()  # list: (item,), union: alternatives
+    nested: bool = False  # a model somewhere inside: decoding must rebuild the value
+
+
+@functools.cache
+def _shape(hint: Any) -> _Shape:
+    if hint is Any:
+        return _Shape("any", "any")
+    if hint in _SCALARS:
+        json_type, check = _SCALARS[hint]
+        return _Shape("scalar", json_type, check=check)
+    if isinstance(hint, type) and issubclass(hint, Model):
+        return _Shape("model", "object", model=hint, nested=True)
+    origin = typing.get_origin(hint)
+    if origin is list:
+        (item,) = typing.get_args(hint) or (Any,)
+        inner = _shape(item)
+        return _Shape("list", "array", inner=(inner,), nested=inner.nested)
+    if origin in (types.UnionType, typing.Union):
+        alternatives = tuple(_shape(a) for a in typing.get_args(hint))
+        return _Shape(
+            "union",
+            ", ".join(repr(a.json_type) for a in alternatives),
+            inner=alternatives,
+            nested=any(a.nested for a in alternatives),
+        )
+    raise TypeError(f"Unsupported model field type: {hint!r}")
+
+
+@dataclass(frozen=True)
+class _Field:
+    attr: str
+    key: str  # JSON key
+    required: bool  # no default: must be present (validate=True)
+    shape: _Shape
+    set: Callable[[Any, Any], None]  # slot descriptor __set__
+
+
+def _json_key(attr: str) -> str:
+    head, *rest = attr.split("_")
+    return head + "".join(part.title() for part in rest)
+
+
+_specs: dict[type, tuple[_Field, ...]] = {}
+_known_keys: dict[type, frozenset[str]] = {}
+_set_extra = Model.__dict__["extra"].__set__
+
+
+def _spec(cls: type) -> tuple[_Field, ...]:
+    spec = _specs.get(cls)
+    if spec is None:
+        hints = typing.get_type_hints(cls)
+        spec = _specs[cls] = tuple(
+            _Field(
+                attr=f.name,
+                key=_json_key(f.name),
+                required=f.default is MISSING and f.default_factory is MISSING,
+                shape=_shape(hints[f.name]),
+                set=cls.__dict__[f.name].__set__,
+            )
+            for f in fields(cls)
+            if f.name != "extra"
+        )
+        _known_keys[cls] = frozenset(f.key for f in spec)
+    return spec
+
+
+def _extra(cls: type, data: dict[str, Any]) -> dict[str, Any] | None:
+    known = _known_keys[cls]
+    if data.keys() <= known:
+        return None
+    return {k: v for k, v in data.items() if k not in known}
+
+
+def _type_error(value: Any, shape: _Shape, path: list[Any], errors: list[ItemError]) -> None:
+    expected = shape.json_type if shape.kind == "union" else repr(shape.json_type)
+    errors.append(ItemError(json_pointer(path), "type", f"{value!r} is not of type {expected}"))
+
+
+def _convert(
+    shape: _Shape, value: Any, validate: bool, path: list[Any], errors: list[ItemError]
+) -> Any:
+    kind = shape.kind
+    if kind == "scalar":
+        if validate and not shape.check(value):  # type: ignore[misc]
+            _type_error(value, shape, path, errors)
+        return value
+    if kind == "model":
+        if type(value) is dict:
+            return _decode(shape.model, value, validate, path, errors)  # type: ignore[arg-type]
+        if validate:
+            _type_error(value, shape, path, errors)
+        return value
+    if kind == "list":
+        if type(value) is not list:
+            if validate:
+                _type_error(value, shape, path, errors)
+            return value
+        (item,) = shape.inner
+        if not validate and not item.nested:
+            return value
+        return [_convert(item, v, validate, [*path, i], errors) for i, v in enumerate(value)]
+    if kind == "union":
+        if not validate:
+            model = next((a for a in shape.inner if a.kind == "model"), None)
+            if model is not None and type(value) is dict:
+                return _decode(model.model, value, False, path, errors)  # type: ignore[arg-type]
+            return value
+        for alternative in shape.inner:
+            attempt: list[ItemError] = []
+            out = _convert(alternative, value, True, path, attempt)
+            if not attempt:
+                return out
+        _type_error(value, shape, path, errors)
+        return value
+    return value  # any
+
+
+def _decode(
+    cls: type[M], data: dict[str, Any], validate: bool, path: list[Any], errors: list[ItemError]
+) -> M:
+    obj = cls.__new__(cls)
+    get = data.get
+    spec = _spec(cls)
+    _set_extra(obj, _extra(cls, data))
+    if not validate:
+        for f in spec:
+            value = get(f.key)
+            if value is not None and f.shape.nested:
+                value = _convert(f.shape, value, False, path, errors)
+            f.set(obj, value)
+        return obj
+
+    for f in spec:
+        value = get(f.key, _MISSING)
+        if value is _MISSING:
+            if f.required:
+                errors.append(
+                    ItemError(json_pointer(path), "required", f"{f.key!r} is a required property")
+                )
+            value = None
+        else:
+            value = _convert(f.shape, value, True, [*path, f.key], errors)
+        f.set(obj, value)
+    return obj
+
+
+def decode(model: type[M], data: Any, *, validate: bool = False) -> M:
+    """One `model` from a decoded JSON object; raises ModelValidationError."""
+    errors: list[ItemError] = []
+    if type(data) is not dict:
+        errors.append(ItemError("", "type", f"{data!r} is not of type 'object'"))
+        raise ModelValidationError(model, errors)
+    obj = _decode(model, data, validate, [], errors)
+    if errors:
+        raise ModelValidationError(model, errors)
+    return obj
+
+
+def decode_page(model: type[M], data: Any, *, key: str, validate: bool = False) -> Page[M]:
+    """A list response (`{key: [...], total, skip, limit}`) as a Page of `model`."""
+    errors: list[ItemError] = []
+    if type(data) is not dict:
+        errors.append(ItemError("", "type", f"{data!r} is not of type 'object'"))
+        raise ModelValidationError(Page, errors)
+
+    envelope = {}
+    for name in ("total", "skip", "limit"):
+        value = data.get(name, _MISSING)
+        if value is _MISSING:
+            errors.append(ItemError("", "required", f"{name!r} is a required property"))
+            value = None
+        elif validate:
+            _convert(_shape(int), value, True, [name], errors)
+        envelope[name] = value
+
+    raw = data.get(key, _MISSING)
+    if raw is _MISSING:
+        errors.append(ItemError("", "required", f"{key!r} is a required property"))
+        raw = []
+    items = _convert(_shape(list[model]), raw, validate, [key], errors)  # type: ignore[valid-type]
+
+    if errors:
+        raise ModelValidationError(Page, errors)
+    return Page(items=items, **envelope)
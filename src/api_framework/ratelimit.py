@@ -0,0 +1,261 @@
+"""
+Client-side token-bucket rate limiting (RATE_LIMIT_RPS > 0 or RATE_LIMIT_ROUTE_RPS).
+
+- per-path-prefix buckets (RATE_LIMIT_ROUTE_RPS, longest prefix wins) and a global bucket
+  (RATE_LIMIT_RPS / RATE_LIMIT_BURST) for every other path; a request takes a token from
+  its route's bucket only, so a route may be slower or faster than the global rate, and
+  with RATE_LIMIT_RPS=0 only the listed routes are limited
+- adaptive: `Retry-After` (429 / 503) and `X-RateLimit-Remaining: 0` + `X-RateLimit-Reset`
+  pause the bucket until the server says it is safe again
+- buckets are shared by every thread / task of the process; with RATE_LIMIT_SHARED_PATH
+  they live in a small file guarded by an exclusive flock, shared by all xdist workers
+
+`acquire()` reserves a token and returns how long the caller must wait for it, so the
+same limiter serves ApiClient (time.sleep) and AsyncApiClient (asyncio.sleep).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import math
+import os
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+try:  # POSIX only; the shared (cross-process) backend needs it
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+GLOBAL_BUCKET = "*"
+
+# X-RateLimit-Reset above this is an epoch timestamp, below it a delay in seconds.
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+@dataclass
+class RateLimitStats:
+    acquired: int = 0
+    delayed: int = 0
+    waited_seconds: float = 0.0
+    throttled: int = 0  # responses that paused a bucket (Retry-After / X-RateLimit-*)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "acquired": self.acquired,
+            "delayed": self.delayed,
+            "waited_seconds": round(self.waited_seconds, 3),
+            "throttled": self.throttled,
+        }
+
+
+# -----------------------
+# Bucket state stores
+# -----------------------
+
+
+class _MemoryStore:
+    """Per-process bucket state (threads + asyncio tasks)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._states: dict[str, dict[str, float]] = {}
+
+    @staticmethod
+    def now() -> float:
+        return time.monotonic()
+
+    @contextlib.contextmanager
+    def state(self, name: str) -> Iterator[dict[str, float]]:
+        with self._lock:
+            yield self._states.setdefault(name, {})
+
+
+class _FileStore:
+    """
+    Bucket state in one JSON file, read-modify-written under an exclusive flock.
+    Uses wall-clock time so every process agrees on refill timing.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        if fcntl is None:
+            raise RuntimeError("RATE_LIMIT_SHARED_PATH needs fcntl (POSIX only)")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def now() -> float:
+        return time.time()
+
+    @contextlib.contextmanager
+    def state(self, name: str) -> Iterator[dict[str, float]]:
+        with self._lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            with os.fdopen(fd, "r+b") as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    raw = f.read()
+                    try:
+                        states = json.loads(raw) if raw else {}
+                    except ValueError:
+                        states = {}  # torn / foreign file: start over
+                    yield states.setdefault(name, {})
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps(states, separators=(",", ":")).encode("utf-8"))
+                    f.flush()
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+
+# -----------------------
+# Buckets
+# -----------------------
+
+
+class TokenBucket:
+    def __init__(self, name: str, rate: float, burst: int, store: _MemoryStore | _FileStore):
+        self.name = name
+        self.rate = rate
+        self.burst = burst
+        self._store = store
+
+    def reserve(self) -> float:
+        """Take one token (possibly going into debt); returns seconds until it is ours."""
+        with self._store.state(self.name) as st:
+            now = self._store.now()
+            tokens = st.get("tokens", float(self.burst))
+            updated = st.get("updated", now)
+            tokens = min(float(self.burst), tokens + (now - updated) * self.rate)
+
+            blocked_until = st.get("blocked_until", 0.0)
+            if blocked_until > now:
+                # Server-imposed pause: no refill until it is over.
+                tokens = min(tokens, 0.0)
+
+            tokens -= 1.0
+            st["tokens"] = tokens
+            st["updated"] = now
+
+            wait = -tokens / self.rate if tokens < 0 else 0.0
+            return max(wait, blocked_until - now, 0.0)
+
+    def pause(self, seconds: float) -> None:
+        with self._store.state(self.name) as st:
+            now = self._store.now()
+            st["blocked_until"] = max(st.get("blocked_until", 0.0), now + seconds)
+
+
+def _retry_after_seconds(value: str) -> float | None:
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def throttle_seconds(resp: httpx.Response) -> float | None:
+    """How long the server asked us to back off, if at all."""
+    if resp.status_code in (429, 503) and "retry-after" in resp.headers:
+        return _retry_after_seconds(resp.headers["retry-after"])
+
+    remaining = resp.headers.get("x-ratelimit-remaining")
+    reset = resp.headers.get("x-ratelimit-reset")
+    if remaining is None or reset is None:
+        return None
+    try:
+        if float(remaining) > 0:
+            return None
+        reset_value = float(reset)
+    except ValueError:
+        return None
+    if reset_value > _EPOCH_THRESHOLD:
+        return max(reset_value - time.time(), 0.0)
+    return max(reset_value, 0.0)
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        *,
+        rps: float,
+        burst: int | None = None,
+        route_rps: dict[str, float] | None = None,
+        shared_path: str | None = None,
+    ):
+        store: _MemoryStore | _FileStore = (
+            _FileStore(shared_path) if shared_path else _MemoryStore()
+        )
+        # Shared buckets live in a flocked file: acquire() blocks on file I/O
+        self.shared = isinstance(store, _FileStore)
+        self.stats = RateLimitStats()
+        self._lock = threading.Lock()
+        # rps <= 0: paths without a route bucket are not limited
+        self.global_bucket = (
+            TokenBucket(GLOBAL_BUCKET, rps, burst or max(1, math.ceil(rps)), store)
+            if rps > 0
+            else None
+        )
+        # Longest prefix first so "/products/categories" beats "/products".
+        self.route_buckets = [
+            TokenBucket(prefix, rate, max(1, math.ceil(rate)), store)
+            for prefix, rate in sorted(
+                (route_rps or {}).items(), key=lambda kv: len(kv[0]), reverse=True
+            )
+        ]
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> RateLimiter | None:
+        rps = getattr(settings, "rate_limit_rps", 0.0) or 0.0
+        if rps <= 0 and not getattr(settings, "rate_limit_route_rps", None):
+            return None
+        return cls(
+            rps=rps,
+            burst=settings.rate_limit_burst,
+            route_rps=settings.rate_limit_route_rps,
+            shared_path=settings.rate_limit_shared_path,
+        )
+
+    def _bucket(self, path: str) -> TokenBucket | None:
+        """The route's bucket, else the global one (None: `path` is not limited)."""
+        for bucket in self.route_buckets:
+            if path.startswith(bucket.name):
+                return bucket
+        return self.global_bucket
+
+    def acquire(self, path: str) -> float:
+        """Reserve a token for `path`; returns the seconds to wait before sending."""
+        bucket = self._bucket(path)
+        if bucket is None:
+            return 0.0
+        wait = bucket.reserve()
+
+        with self._lock:
+            self.stats.acquired += 1
+            if wait > 0:
+                self.stats.delayed += 1
+                self.stats.waited_seconds += wait
+        return wait
+
+    def observe(self, path: str, resp: httpx.Response) -> None:
+        """Adapt to server throttling hints on `resp`."""
+        seconds = throttle_seconds(resp)
+        bucket = self._bucket(path)
+        if not seconds or bucket is None:
+            return
+        with self._lock:
+            self.stats.throttled += 1
+        bucket.pause(seconds)
@@ -1,5 +1,21 @@
+"""
+Redaction of credentials in logged headers and JSON bodies.
+
+Redactor compiles its key rules once: exact names (case-insensitive), globs ("*secret*")
+and "re:<regex>" patterns, all matched against the whole key, ignoring case. redact() walks
+the payload depth-first on an explicit stack (no recursion, so no recursion limit) and
+copies on write: only the dicts / lists on a path to a redacted value are copied, everything
+else is returned as is (the input is never modified; a payload with nothing to redact comes
+back as the same object). Containers deeper than `max_depth`, and whatever is left
+once `max_nodes` values have been visited, are replaced by TRUNCATED, so nothing is
+logged unchecked.
+"""
+
 from __future__ import annotations
 
+import fnmatch
+import re
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any
 
 SENSITIVE_HEADERS = {"authorization", "cookie", "set-cookie"}
@@ -13,23 +29,160 @@ SENSITIVE_JSON_KEYS = {
     "password",
 }
 
+REDACTED = "***REDACTED***"
+TRUNCATED = "***TRUNCATED***"
+
+_GLOB_CHARS = frozenset("*?[")
+_KEY_CACHE_SIZE = 4096
+
 
 def redact_headers(headers: dict[str, str]) -> dict[str, str]:
     out: dict[str, str] = {}
     for k, v in headers.items():
         if k.lower() in SENSITIVE_HEADERS:
-            out[k] = "***REDACTED***"
+            out[k] = REDACTED
         else:
             out[k] = v
     return out
 
 
-def redact_json(obj: Any) -> Any:
-    if isinstance(obj, dict):
-        return {
-            k: "***REDACTED***" if k in SENSITIVE_JSON_KEYS else redact_json(v)
-            for k, v in obj.items()
-        }
-    if isinstance(obj, list):
-        return [redact_json(x) for x in obj]
-    return obj
+def compile_key_rules(rules: Iterable[str]) -> re.Pattern[str]:
+    """One case-insensitive full-match pattern for exact / glob / "re:" key rules."""
+    parts: list[str] = []
+    for rule in rules:
+        if rule.startswith("re:"):
+            pattern = rule[3:]
+        elif _GLOB_CHARS & set(rule):
+            pattern = fnmatch.translate(rule).removesuffix(r"\Z")
+        else:
+            pattern = re.escape(rule)
+        parts.append(f"(?:{pattern})")
+    # An empty rule set matches nothing.
+    return re.compile("|".join(parts) or r"(?!)", re.IGNORECASE)
+
+
+class Redactor:
+    def __init__(
+        self,
+        keys: Iterable[str] = SENSITIVE_JSON_KEYS,
+        *,
+        max_depth: int = 64,
+        max_nodes: int = 200_000,
+        mask: Callable[[str, Any], Any] | None = None,
+    ):
+        if max_depth < 1 or max_nodes < 1:
+            raise ValueError("max_depth and max_nodes must be >= 1")
+        self.rules = tuple(keys)
+        self.max_depth = max_depth
+        self.max_nodes = max_nodes
+        # Replacement for a sensitive value, given its key and value (default: REDACTED)
+        self.mask = mask
+        self._pattern = compile_key_rules(self.rules)
+        # Catalog payloads repeat the same few keys: remember the verdict per key, so most
+        # dicts are cleared by one `keys <= safe` set check.
+        self._safe: set[str] = set()
+        self._sensitive: set[str] = set()
+
+    @classmethod
+    def from_settings(cls, settings: Any, **kwargs: Any) -> Redactor:
+        """Default keys + REDACT_JSON_KEYS rules, REDACT_MAX_DEPTH / REDACT_MAX_NODES limits."""
+        return cls(
+            [*SENSITIVE_JSON_KEYS, *settings.redact_json_keys],
+            max_depth=settings.redact_max_depth,
+            max_nodes=settings.redact_max_nodes,
+            **kwargs,
+        )
+
+    def is_sensitive(self, key: Any) -> bool:
+        if type(key) is not str:
+            return False
+        if key in self._safe:
+            return False
+        if key in self._sensitive:
+            return True
+        sensitive = self._pattern.fullmatch(key) is not None
+        if len(self._safe) >= _KEY_CACHE_SIZE:
+            self._safe.clear()
+        (self._sensitive if sensitive else self._safe).add(key)
+        return sensitive
+
+    def redact(self, obj: Any) -> Any:
+        if not isinstance(obj, (dict, list)):
+            return obj
+        if obj and len(obj) > self.max_nodes:
+            return TRUNCATED
+
+        # Depth-first on an explicit stack (no recursion, so no recursion limit): the stack
+        # holds the path from the root to the container being walked. A frame copies its
+        # container on the first write; when it is done, that copy is written into its
+        # parent, so only the containers on a path to a redacted value are copied.
+        max_depth, open_frame = self.max_depth, self._open
+        budget = self.max_nodes - len(obj)
+        root = open_frame(obj, None, None)
+        stack = [root]
+        while stack:
+            frame = stack[-1]
+            for key, child in frame.items:
+                if not isinstance(child, (dict, list)):
+                    continue
+                if len(stack) >= max_depth or len(child) > budget:
+                    if child:
+                        if len(stack) < max_depth:
+                            budget = -1  # out of budget: every container after it is cut
+                        frame.write(key, TRUNCATED)
+                    continue
+                budget -= len(child)
+                stack.append(open_frame(child, frame, key))
+                break
+            else:
+                stack.pop()
+                if frame.copy is not None and frame.parent is not None:
+                    frame.parent.write(frame.key, frame.copy)
+        return obj if root.copy is None else root.copy
+
+    def _open(self, node: Any, parent: _Frame | None, key: Any) -> _Frame:
+        """A frame for `node`, its sensitive values already masked (in its copy)."""
+        if isinstance(node, list):
+            return _Frame(node, parent, key, enumerate(node))
+        keys = node.keys()
+        if keys <= self._safe:
+            return _Frame(node, parent, key, iter(node.items()))
+        for k in keys - self._safe:
+            self.is_sensitive(k)
+        hits = keys & self._sensitive
+        if not hits:
+            return _Frame(node, parent, key, iter(node.items()))
+        frame = _Frame(node, parent, key, ((k, v) for k, v in node.items() if k not in hits))
+        for k in hits:
+            value = node[k]
+            masked = REDACTED if self.mask is None else self.mask(k, value)
+            if masked != value:
+                frame.write(k, masked)
+        return frame
+
+
+class _Frame:
+    """A container on the walk's stack: where it sits (parent, key) and its copy, if any."""
+
+    __slots__ = ("node", "parent", "key", "items", "copy")
+
+    def __init__(self, node: Any, parent: _Frame | None, key: Any, items: Iterator[Any]):
+        self.node = node
+        self.parent = parent
+        self.key = key
+        self.items = items  # (key, value) pairs left to walk
+        self.copy: Any = None
+
+    def write(self, key: Any, value: Any) -> None:
+        if self.copy is None:
+            node = self.node
+            self.copy = dict(node) if isinstance(node, dict) else list(node)
+        self.copy[key] = value
+
+
+_default = Redactor()
+
+
+def redact_json(obj: Any, redactor: Redactor | None = None) -> Any:
+    """`obj` with sensitive values replaced (default rules unless `redactor` is given)."""
+    return (redactor or _default).redact(obj)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any
+
+from api_framework.circuit import STATE_SEVERITY
+from api_framework.histogram import LogHistogram
+from api_framework.jsoncodec import default_codec
+
+# Client feature counters (ApiClient.stats()) persisted per test session:
+# - pytest --client-stats artifacts/client-stats.json writes one file per process
+#   (xdist workers add their id: client-stats-gw0.json, client-stats-gw1.json, ...)
+# - metrics.py --client-stats artifacts/client-stats.json merges all of them
+
+
+def worker_path(path: Path) -> Path:
+    worker = os.getenv("PYTEST_XDIST_WORKER", "").strip()
+    return path.with_name(f"{path.stem}-{worker}{path.suffix}") if worker else path
+
+
+def write_client_stats(path: Path, stats: dict[str, Any]) -> Path:
+    out = worker_path(path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(default_codec().dumps_text(stats, indent=True, sort_keys=True), encoding="utf-8")
+    return out
+
+
+def load_client_stats(path: Path) -> list[dict[str, Any]]:
+    return load_worker_json(path)
+
+
+def load_worker_json(path: Path) -> list[dict[str, Any]]:
+    """The file itself plus every per-worker sibling (<stem>-gw*.json)."""
+    files = sorted({p for p in [path, *path.parent.glob(f"{path.stem}-*{path.suffix}")]})
+    loaded: list[dict[str, Any]] = []
+    for f in files:
+        if not f.exists():
+            continue
+        try:
+            loaded.append(default_codec().loads(f.read_bytes()))
+        except Exception:
+            continue
+    return loaded
+
+
+def _merge_histograms(into: dict[str, Any], key: str, data: dict[str, Any]) -> None:
+    hist = LogHistogram.from_dict(data)
+    if key in into:
+        hist.merge(LogHistogram.from_dict(into[key]))
+    into[key] = hist.to_dict()
+
+
+def merge_client_stats(snapshots: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Sum counters across processes. Circuit breakers keep the worst state seen
+    (open > half_open > closed) and sum their counters; phase histograms are merged.
+    """
+    merged: dict[str, Any] = {}
+    for snap in snapshots:
+        for section, values in snap.items():
+            if section == "phases":
+                routes = merged.setdefault(section, {})
+                for route, phases in values.items():
+                    for phase, data in phases.items():
+                        _merge_histograms(routes.setdefault(route, {}), phase, data)
+                continue
+
+            if section == "circuit_breakers":
+                breakers = merged.setdefault(section, {})
+                for key, b in values.items():
+                    agg = breakers.setdefault(
+                        key,
+                        {
+                            "state": "closed",
+                            "consecutive_failures": 0,
+                            "opened": 0,
+                            "short_circuited": 0,
+                        },
+                    )
+                    if STATE_SEVERITY.get(b["state"], 0) > STATE_SEVERITY.get(agg["state"], 0):
+                        agg["state"] = b["state"]
+                    for counter in ("consecutive_failures", "opened", "short_circuited"):
+                        agg[counter] += b.get(counter, 0)
+                continue
+
+            agg = merged.setdefault(section, {})
+            for counter, value in values.items():
+                if isinstance(value, (int, float)):
+                    agg[counter] = round(agg.get(counter, 0) + value, 3)
+    return merged
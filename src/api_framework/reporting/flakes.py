@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import argparse
-import json
 import os
 import time
 import xml.etree.ElementTree as ET
@@ -9,6 +8,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal
 
+from api_framework.jsoncodec import default_codec
+
 Outcome = Literal["passed", "failed", "skipped"]
 
 
@@ -66,14 +67,16 @@ def load_history(history_path: Path) -> dict[str, list[dict[str, str]]]:
     if not history_path.exists():
         return {}
     try:
-        return json.loads(history_path.read_text(encoding="utf-8"))
+        return default_codec().loads(history_path.read_bytes())
     except Exception:
         return {}
 
 
 def save_history(history_path: Path, history: dict[str, list[dict[str, str]]]) -> None:
     history_path.parent.mkdir(parents=True, exist_ok=True)
-    history_path.write_text(json.dumps(history, indent=2, sort_keys=True), encoding="utf-8")
+    history_path.write_text(
+        default_codec().dumps_text(history, indent=True, sort_keys=True), encoding="utf-8"
+    )
 
 
 def update_history(
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+from api_framework.histogram import LogHistogram
+from api_framework.jsoncodec import default_codec
+from api_framework.reporting.client_stats import load_worker_json, worker_path
+
+# Endpoint latency histograms (api_framework.latency) persisted next to the JUnit XML:
+# - artifacts/junit-smoke.xml -> artifacts/junit-smoke.latency.json
+#   (xdist workers: junit-smoke.latency-gw0.json, junit-smoke.latency-gw1.json, ...)
+# - metrics.py merges every worker file into p50/p90/p99/max per endpoint
+
+
+def latency_path_for(junit_path: Path) -> Path:
+    return junit_path.with_name(f"{junit_path.stem}.latency.json")
+
+
+def write_latency(path: Path, histograms: dict[str, dict[str, Any]]) -> Path:
+    out = worker_path(path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(default_codec().dumps_text(histograms, sort_keys=True), encoding="utf-8")
+    return out
+
+
+def load_latency(path: Path) -> dict[str, LogHistogram]:
+    """Merge the file and its per-worker siblings into one histogram per endpoint."""
+    merged: dict[str, LogHistogram] = {}
+    for snapshot in load_worker_json(path):
+        for endpoint, data in snapshot.items():
+            hist = LogHistogram.from_dict(data)
+            if endpoint in merged:
+                merged[endpoint].merge(hist)
+            else:
+                merged[endpoint] = hist
+    return merged
+
+
+def summarize_latency(histograms: dict[str, LogHistogram]) -> list[dict[str, Any]]:
+    rows = [{"endpoint": endpoint, **h.summary()} for endpoint, h in histograms.items()]
+    rows.sort(key=lambda r: r["p99_ms"], reverse=True)
+    return rows
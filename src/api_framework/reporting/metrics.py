@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import argparse
-import json
 import os
 import time
 import xml.etree.ElementTree as ET
@@ -9,9 +8,17 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from api_framework.histogram import LogHistogram
+from api_framework.jsoncodec import default_codec
+from api_framework.reporting.client_stats import load_client_stats, merge_client_stats
+from api_framework.reporting.latency import latency_path_for, load_latency, summarize_latency
+from api_framework.timings import PHASE_ORDER
+
 # This script produces a stakeholder-friendly metrics snapshot from:
 # - JUnit XML (pytest --junitxml=...)
 # - Optional flake history JSON (.cache/flakes/history.json)
+# - Optional ApiClient counters (pytest --client-stats ..., merged across xdist workers)
+# - Endpoint latency histograms written next to the JUnit XML (merged across xdist workers)
 #
 # Outputs:
 # - metrics.json (machine readable)
@@ -119,7 +126,7 @@ def load_flake_history(history_path: Path) -> dict[str, list[dict[str, str]]]:
     if not history_path.exists():
         return {}
     try:
-        return json.loads(history_path.read_text(encoding="utf-8"))
+        return default_codec().loads(history_path.read_bytes())
     except Exception:
         return {}
 
@@ -159,12 +166,31 @@ def compute_flake_summary(flake_history: dict[str, list[dict[str, str]]]) -> dic
     }
 
 
+def summarize_phases(phases: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Per route: count + p50/p90/p99/max per phase, slowest routes (p90 total) first.
+    """
+    rows: list[dict[str, Any]] = []
+    for route, by_phase in phases.items():
+        summaries = {
+            phase: LogHistogram.from_dict(by_phase[phase]).summary()
+            for phase in PHASE_ORDER
+            if phase in by_phase
+        }
+        total = summaries.get("total", {})
+        rows.append({"route": route, "count": total.get("count", 0), "phases": summaries})
+    rows.sort(key=lambda r: r["phases"].get("total", {}).get("p90_ms", 0.0), reverse=True)
+    return rows
+
+
 def build_metrics(
     *,
     suite: str,
     junit_path: Path,
     cases: list[TestCase],
     flake_history: dict[str, list[dict[str, str]]] | None,
+    client_stats: dict[str, Any] | None = None,
+    endpoints: list[dict[str, Any]] | None = None,
 ) -> dict[str, Any]:
     total = len(cases)
     passed = sum(1 for c in cases if c.outcome == "passed")
@@ -218,6 +244,11 @@ def build_metrics(
     if flake_history is not None:
         flake_summary = compute_flake_summary(flake_history)
 
+    # API client counters; phase histograms become per-route percentiles
+    client = dict(client_stats or {})
+    if "phases" in client:
+        client["phases"] = summarize_phases(client["phases"])[:25]  # cap for readability
+
     # Pass rate (avoid divide by zero)
     pass_rate = (passed / total * 100.0) if total else 0.0
 
@@ -238,6 +269,8 @@ def build_metrics(
         "slowest_tests": slowest_tests,
         "files": files_summary[:25],  # cap for readability
         "flakes": flake_summary,
+        "client": client,
+        "endpoints": (endpoints or [])[:50],  # slowest p99 first; cap for readability
         "generated_at_utc": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
     }
 
@@ -279,6 +312,49 @@ def write_md(out_md: Path, metrics: dict[str, Any]) -> None:
     else:
         lines.append("✅ No failures.\n\n")
 
+    endpoints = metrics.get("endpoints") or []
+    if endpoints:
+        lines.append("## Endpoint latency (ms)\n\n")
+        lines.append("| Endpoint | Count | p50 | p90 | p99 | Max |\n")
+        lines.append("|---|---:|---:|---:|---:|---:|\n")
+        for e in endpoints:
+            lines.append(
+                f"| `{e['endpoint']}` | {e['count']} | {e['p50_ms']} | {e['p90_ms']} "
+                f"| {e['p99_ms']} | {e['max_ms']} |\n"
+            )
+        lines.append("\n")
+
+    client = metrics.get("client") or {}
+    if client:
+        lines.append("## API client\n\n")
+        breakers = client.get("circuit_breakers") or {}
+        if breakers:
+            lines.append("| Circuit | State | Opened | Short-circuited |\n")
+            lines.append("|---|---|---:|---:|\n")
+            for key, b in breakers.items():
+                state = f"**{b['state']}**" if b["state"] != "closed" else b["state"]
+                lines.append(f"| `{key}` | {state} | {b['opened']} | {b['short_circuited']} |\n")
+            lines.append("\n")
+        for section, counters in client.items():
+            if section in ("circuit_breakers", "phases"):
+                continue
+            pairs = ", ".join(f"{k}={v}" for k, v in sorted(counters.items()))
+            lines.append(f"- {section}: {pairs}\n")
+        lines.append("\n")
+
+        phases = client.get("phases") or []
+        if phases:
+            lines.append("## Slow phases (p90 ms per attempt)\n\n")
+            lines.append("| Route | Count | " + " | ".join(PHASE_ORDER) + " |\n")
+            lines.append("|---|---:|" + "---:|" * len(PHASE_ORDER) + "\n")
+            for row in phases:
+                cells = [
+                    str(row["phases"][p]["p90_ms"]) if p in row["phases"] else "–"
+                    for p in PHASE_ORDER
+                ]
+                lines.append(f"| `{row['route']}` | {row['count']} | " + " | ".join(cells) + " |\n")
+            lines.append("\n")
+
     lines.append("## Slowest tests\n\n")
     lines.append("| Test | Outcome | Duration (s) |\n")
     lines.append("|---|---|---:|\n")
@@ -297,6 +373,16 @@ def main() -> int:
         "--junit", required=True, help="Path to JUnit XML (e.g. artifacts/junit-smoke.xml)"
     )
     ap.add_argument("--flakes-history", default="", help="Path to flake history JSON (optional)")
+    ap.add_argument(
+        "--client-stats",
+        default="",
+        help="ApiClient counters JSON from pytest --client-stats (optional, per-worker files merged)",
+    )
+    ap.add_argument(
+        "--latency",
+        default="",
+        help="Endpoint latency histograms JSON (default: <junit stem>.latency.json next to --junit)",
+    )
     ap.add_argument("--out-json", default="artifacts/metrics.json", help="Output JSON file")
     ap.add_argument("--out-md", default="artifacts/metrics.md", help="Output Markdown file")
     args = ap.parse_args()
@@ -313,18 +399,30 @@ def main() -> int:
     if flakes_history_path:
         flake_history = load_flake_history(Path(flakes_history_path))
 
+    client_stats: dict[str, Any] | None = None
+    client_stats_path = (args.client_stats or "").strip()
+    if client_stats_path:
+        client_stats = merge_client_stats(load_client_stats(Path(client_stats_path)))
+
+    latency_path = Path(args.latency) if args.latency.strip() else latency_path_for(junit_path)
+    endpoints = summarize_latency(load_latency(latency_path))
+
     metrics = build_metrics(
         suite=args.suite,
         junit_path=junit_path,
         cases=cases,
         flake_history=flake_history,
+        client_stats=client_stats,
+        endpoints=endpoints,
     )
 
     out_json = Path(args.out_json)
     out_md = Path(args.out_md)
 
     out_json.parent.mkdir(parents=True, exist_ok=True)
-    out_json.write_text(json.dumps(metrics, indent=2, sort_keys=True), encoding="utf-8")
+    out_json.write_text(
+        default_codec().dumps_text(metrics, indent=True, sort_keys=True), encoding="utf-8"
+    )
 
     write_md(out_md, metrics)
 
@@ -0,0 +1,191 @@
+"""
+Request log: one compact JSON line per HTTP attempt (REQUEST_LOG_PATH, e.g.
+artifacts/requests.jsonl), independent of the API_DEBUG_LOG console output.
+
+    {"ts":1760000000.123,"correlation_id":"9f..","test":"tests/x_test.py::test_y",
+     "method":"GET","route":"/users/{id}","status":200,"attempt":1,"duration_ms":12.345,
+     "request_bytes":0,"response_bytes":1234}
+
+- `test` is the running pytest node id (PYTEST_CURRENT_TEST; null outside pytest)
+- failed attempts have "status": null and "error": "<exception type>"
+- `response_bytes` counts bytes read off the wire (compressed size when gzip'd; the body
+  size for transports that hand over content directly, such as inproc)
+- files rotate at REQUEST_LOG_MAX_BYTES into <path>.1 .. <path>.N (REQUEST_LOG_BACKUPS);
+  xdist workers write their own file (requests-gw0.jsonl, ...)
+
+`iter_request_log(path)` streams the records of every file back (rotations and workers
+included) for post-run tooling.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO, Any
+
+import httpx
+
+from .config import Settings
+from .jsoncodec import JsonCodec, default_codec, get_codec
+from .reporting.client_stats import worker_path
+from .timings import route_template
+
+
+def current_test() -> str | None:
+    # "tests/x.py::test_y (call)" -> "tests/x.py::test_y"
+    current = os.environ.get("PYTEST_CURRENT_TEST")
+    return current.rsplit(" ", 1)[0] if current else None
+
+
+def _response_bytes(resp: httpx.Response | None) -> int | None:
+    if resp is None:
+        return None
+    try:
+        return resp.num_bytes_downloaded or len(resp.content)
+    except httpx.ResponseNotRead:
+        return resp.num_bytes_downloaded
+
+
+class RequestLog:
+    """Size-rotated JSONL file, shared by the clients of a process (thread-safe)."""
+
+    _shared: dict[Path, RequestLog] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        max_bytes: int = 50_000_000,
+        backups: int = 5,
+        codec: JsonCodec | None = None,
+    ):
+        self.path = path
+        self.codec = codec or get_codec()
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._lock = threading.Lock()
+        self._file: IO[str] | None = None
+        self._size = 0
+        self.records = 0
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> RequestLog | None:
+        if not settings.request_log_path:
+            return None
+        path = worker_path(Path(settings.request_log_path))
+        with cls._shared_lock:
+            log = cls._shared.get(path)
+            if log is None:
+                log = cls._shared[path] = cls(
+                    path,
+                    max_bytes=settings.request_log_max_bytes,
+                    backups=settings.request_log_backups,
+                    codec=get_codec(settings.json_codec),
+                )
+                atexit.register(log.close)
+        return log
+
+    @classmethod
+    def flush_all(cls) -> None:
+        with cls._shared_lock:
+            logs = list(cls._shared.values())
+        for log in logs:
+            log.flush()
+
+    def record(
+        self,
+        req: httpx.Request,
+        resp: httpx.Response | None,
+        *,
+        correlation_id: str,
+        attempt: int,
+        elapsed_ms: float,
+        exc: BaseException | None = None,
+    ) -> None:
+        try:
+            request_bytes: int | None = len(req.content)
+        except httpx.RequestNotRead:
+            request_bytes = None
+        entry: dict[str, Any] = {
+            "ts": round(time.time(), 3),
+            "correlation_id": correlation_id,
+            "test": current_test(),
+            "method": req.method,
+            "route": route_template(req.url.path),
+            "status": resp.status_code if resp is not None else None,
+            "attempt": attempt,
+            "duration_ms": round(elapsed_ms, 3),
+            "request_bytes": request_bytes,
+            "response_bytes": _response_bytes(resp),
+        }
+        if exc is not None:
+            entry["error"] = type(exc).__name__
+        self._write(self.codec.dumps(entry).decode("utf-8") + "\n")
+
+    def _write(self, line: str) -> None:
+        size = len(line.encode("utf-8"))
+        with self._lock:
+            if self._file is None:
+                self._open()
+            elif self._size and self._size + size > self.max_bytes:
+                self._rotate()
+            assert self._file is not None
+            self._file.write(line)
+            self._size += size
+            self.records += 1
+
+    def _open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")  # noqa: SIM115
+        self._size = self._file.tell()
+
+    def _rotate(self) -> None:
+        assert self._file is not None
+        self._file.close()
+        if self.backups > 0:
+            for n in range(self.backups - 1, 0, -1):
+                src = self.path.with_name(f"{self.path.name}.{n}")
+                if src.exists():
+                    os.replace(src, self.path.with_name(f"{self.path.name}.{n + 1}"))
+            os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink(missing_ok=True)
+        self._open()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def request_log_files(path: Path) -> list[Path]:
+    """<path>, its per-worker siblings and their rotations, oldest rotation first."""
+    bases = sorted({path, *path.parent.glob(f"{path.stem}-*{path.suffix}")})
+    files: list[Path] = []
+    for base in bases:
+        rotated = base.parent.glob(f"{base.name}.*")
+        numbered = [p for p in rotated if p.suffix[1:].isdigit()]
+        files += sorted(numbered, key=lambda p: -int(p.suffix[1:]))
+        if base.exists():
+            files.append(base)
+    return files
+
+
+def iter_request_log(path: Path) -> Iterator[dict[str, Any]]:
+    codec = default_codec()
+    for f in request_log_files(path):
+        with f.open(encoding="utf-8") as fh:
+            for line in fh:
+                if line.strip():
+                    yield codec.loads(line)
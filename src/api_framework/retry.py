@@ -0,0 +1,201 @@
+"""
+Retry policy for ApiClient / AsyncApiClient.
+
+- backoff strategies (RETRY_BACKOFF):
+  - exponential: base * 2^(n-1), clamped to [base, cap] (the historical default)
+  - full_jitter: uniform(0, min(cap, base * 2^(n-1)))
+  - decorrelated_jitter: min(cap, uniform(base, previous_sleep * 3))
+- retry budget (RETRY_BUDGET_RATIO): retries allowed per session are capped at
+  RETRY_BUDGET_MIN_RETRIES + ratio * requests, so a struggling backend is not hit
+  with a retry storm
+- deadline (REQUEST_DEADLINE_SECONDS): total time across attempts of one logical request
+- every decision is counted in `RetryStats` (retried / gave up and why)
+
+Jittered strategies spread parallel workers out instead of retrying in lockstep.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+GIVE_UP_REASONS = ("exhausted", "budget", "deadline", "circuit_open")
+
+
+class Backoff(Protocol):
+    def next_sleep(self, attempt_num: int, previous_sleep: float) -> float: ...
+
+
+@dataclass(frozen=True)
+class ExponentialBackoff:
+    base: float = 0.5
+    cap: float = 4.0
+
+    def next_sleep(self, attempt_num: int, previous_sleep: float) -> float:
+        return min(max(self.base * (2 ** (attempt_num - 1)), self.base), self.cap)
+
+
+@dataclass(frozen=True)
+class FullJitterBackoff:
+    base: float = 0.5
+    cap: float = 4.0
+    rng: random.Random = field(default_factory=random.Random, compare=False)
+
+    def next_sleep(self, attempt_num: int, previous_sleep: float) -> float:
+        return self.rng.uniform(0.0, min(self.cap, self.base * (2 ** (attempt_num - 1))))
+
+
+@dataclass(frozen=True)
+class DecorrelatedJitterBackoff:
+    base: float = 0.5
+    cap: float = 4.0
+    rng: random.Random = field(default_factory=random.Random, compare=False)
+
+    def next_sleep(self, attempt_num: int, previous_sleep: float) -> float:
+        upper = max(previous_sleep or self.base, self.base) * 3
+        return min(self.cap, self.rng.uniform(self.base, upper))
+
+
+# RETRY_BACKOFF name -> strategy; register custom strategies here.
+BACKOFF_STRATEGIES: dict[str, type] = {
+    "exponential": ExponentialBackoff,
+    "full_jitter": FullJitterBackoff,
+    "decorrelated_jitter": DecorrelatedJitterBackoff,
+}
+
+
+@dataclass
+class RetryStats:
+    requests: int = 0
+    attempts: int = 0
+    retries: int = 0
+    slept_seconds: float = 0.0
+    gave_up: dict[str, int] = field(default_factory=lambda: dict.fromkeys(GIVE_UP_REASONS, 0))
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "attempts": self.attempts,
+            "retries": self.retries,
+            "slept_seconds": round(self.slept_seconds, 3),
+            **{f"gave_up_{reason}": n for reason, n in self.gave_up.items()},
+        }
+
+
+class RetryBudget:
+    """Session-wide cap: retries <= min_retries + ratio * requests."""
+
+    def __init__(self, ratio: float, *, min_retries: int = 10):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.requests = 0
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self.retries >= self.min_retries + self.ratio * self.requests:
+                return False
+            self.retries += 1
+            return True
+
+
+@dataclass
+class RetryState:
+    """One logical request (all of its attempts)."""
+
+    started_at: float
+    deadline_at: float | None
+    previous_sleep: float = 0.0
+    give_up_reason: str | None = None
+
+    def remaining(self) -> float | None:
+        if self.deadline_at is None:
+            return None
+        return self.deadline_at - time.monotonic()
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        *,
+        max_attempts: int = 3,
+        backoff: Backoff | None = None,
+        budget: RetryBudget | None = None,
+        deadline_seconds: float | None = None,
+    ):
+        self.max_attempts = max_attempts
+        self.backoff = backoff or ExponentialBackoff()
+        self.budget = budget
+        self.deadline_seconds = deadline_seconds
+        self.stats = RetryStats()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> RetryPolicy:
+        strategy = BACKOFF_STRATEGIES[getattr(settings, "retry_backoff", "exponential")]
+        ratio = getattr(settings, "retry_budget_ratio", None)
+        return cls(
+            # Use configured attempts if present; default to 3 otherwise.
+            max_attempts=int(getattr(settings, "retry_attempts", 3) or 3),
+            backoff=strategy(
+                base=getattr(settings, "retry_backoff_base", 0.5),
+                cap=getattr(settings, "retry_backoff_cap", 4.0),
+            ),
+            budget=(
+                RetryBudget(ratio, min_retries=settings.retry_budget_min_retries)
+                if ratio is not None
+                else None
+            ),
+            deadline_seconds=getattr(settings, "request_deadline_seconds", None),
+        )
+
+    def start(self) -> RetryState:
+        if self.budget is not None:
+            self.budget.record_request()
+        with self._lock:
+            self.stats.requests += 1
+        now = time.monotonic()
+        deadline_at = now + self.deadline_seconds if self.deadline_seconds else None
+        return RetryState(started_at=now, deadline_at=deadline_at)
+
+    def record_attempt(self) -> None:
+        with self._lock:
+            self.stats.attempts += 1
+
+    def decide(
+        self, state: RetryState, attempt_num: int, *, circuit_open: bool = False
+    ) -> float | None:
+        """
+        After a retryable failure: seconds to sleep before the next attempt,
+        or None to give up (reason kept in state.give_up_reason and counted).
+        """
+        sleep_seconds = self.backoff.next_sleep(attempt_num, state.previous_sleep)
+        remaining = state.remaining()
+
+        if attempt_num >= self.max_attempts:
+            reason = "exhausted"
+        elif circuit_open:
+            reason = "circuit_open"
+        elif remaining is not None and remaining <= sleep_seconds:
+            reason = "deadline"
+        elif self.budget is not None and not self.budget.try_spend():
+            reason = "budget"
+        else:
+            state.previous_sleep = sleep_seconds
+            with self._lock:
+                self.stats.retries += 1
+                self.stats.slept_seconds += sleep_seconds
+            return sleep_seconds
+
+        state.give_up_reason = reason
+        with self._lock:
+            self.stats.gave_up[reason] += 1
+        return None
@@ -0,0 +1,123 @@
+"""
+Conditional GETs (CONDITIONAL_REQUESTS=1).
+
+Remembers ETag / Last-Modified per request key (method + URL + auth identity) together
+with the body, sends If-None-Match / If-Modified-Since on the next GET, and turns a
+304 Not Modified back into a normal 200 Response over the stored body, so domain
+clients never see the difference.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from .cache import decoded_headers
+
+_CONDITIONAL_HEADERS = ("if-none-match", "if-modified-since")
+
+
+@dataclass
+class _Validated:
+    etag: str | None
+    last_modified: str | None
+    status_code: int
+    headers: list[tuple[str, str]]
+    content: bytes
+
+
+@dataclass
+class RevalidationStats:
+    stored: int = 0
+    not_modified: int = 0
+    bytes_saved: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "stored": self.stored,
+            "not_modified": self.not_modified,
+            "bytes_saved": self.bytes_saved,
+        }
+
+
+def has_conditional_headers(headers: dict[str, str]) -> bool:
+    return any(k.lower() in _CONDITIONAL_HEADERS for k in headers)
+
+
+class RevalidationCache:
+    def __init__(self, *, max_entries: int = 512):
+        self.max_entries = max_entries
+        self.stats = RevalidationStats()
+        self._entries: OrderedDict[Any, _Validated] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> RevalidationCache | None:
+        if not getattr(settings, "conditional_requests_enabled", False):
+            return None
+        return cls(max_entries=settings.response_cache_max_entries)
+
+    def conditional_headers(self, key: Any) -> dict[str, str]:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return {}
+        headers: dict[str, str] = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def resolve(self, key: Any, resp: httpx.Response) -> httpx.Response:
+        """
+        304 -> rebuilt 200 over the stored body; 200 with validators -> remembered.
+        Anything else passes through untouched.
+        """
+        if resp.status_code == 304:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+            if entry is None:
+                return resp
+
+            self.stats.not_modified += 1
+            self.stats.bytes_saved += len(entry.content)
+            # Fresh validators from the 304 win over the stored ones.
+            headers = httpx.Headers(entry.headers)
+            for name in ("etag", "last-modified", "cache-control", "date", "expires"):
+                if name in resp.headers:
+                    headers[name] = resp.headers[name]
+            return httpx.Response(
+                entry.status_code,
+                headers=headers,
+                content=entry.content,
+                request=resp.request,
+                extensions=resp.extensions,
+            )
+
+        etag = resp.headers.get("etag")
+        last_modified = resp.headers.get("last-modified")
+        if resp.status_code == 200 and (etag or last_modified):
+            entry = _Validated(
+                etag=etag,
+                last_modified=last_modified,
+                status_code=resp.status_code,
+                headers=decoded_headers(resp),
+                content=resp.content,
+            )
+            with self._lock:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            self.stats.stored += 1
+        return resp
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,115 @@
+"""
+Request coalescing ("single-flight") for concurrent identical idempotent requests.
+
+While one caller (the leader) has a request in flight, identical requests from other
+threads / tasks wait for it and receive a copy of its result instead of sending their own.
+`stats.coalesced` counts the calls saved.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+@dataclass
+class SingleFlightStats:
+    leaders: int = 0
+    coalesced: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {"leaders": self.leaders, "coalesced": self.coalesced}
+
+
+@dataclass
+class _Call:
+    done: threading.Event = field(default_factory=threading.Event)
+    result: Any = None
+    error: BaseException | None = None
+
+
+def _identity(value: T) -> T:
+    return value
+
+
+class SingleFlight(Generic[T]):
+    """
+    Thread-based single-flight (sync ApiClient).
+    `share` gives each waiter its own copy of the leader's result.
+    """
+
+    def __init__(self, share: Callable[[T], T] = _identity):
+        self.share = share
+        self.stats = SingleFlightStats()
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.stats.leaders += 1
+            else:
+                self.stats.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return self.share(call.result)
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+
+class AsyncSingleFlight(Generic[T]):
+    """
+    Event-loop single-flight (AsyncApiClient).
+    """
+
+    def __init__(self, share: Callable[[T], T] = _identity):
+        self.share = share
+        self.stats = SingleFlightStats()
+        self._calls: dict[Hashable, asyncio.Future[T]] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        pending = self._calls.get(key)
+        if pending is not None:
+            self.stats.coalesced += 1
+            # shield: a cancelled waiter must not cancel the leader's call
+            return self.share(await asyncio.shield(pending))
+
+        fut: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        self._calls[key] = fut
+        self.stats.leaders += 1
+        try:
+            result = await fn()
+            fut.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except BaseException as exc:
+            fut.set_exception(exc)
+            # Mark retrieved: no waiter is a valid outcome, not a lost error.
+            fut.exception()
+            raise
+        finally:
+            self._calls.pop(key, None)
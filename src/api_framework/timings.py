@@ -0,0 +1,107 @@
+"""
+Per-phase HTTP timings from httpcore trace events.
+
+Every attempt sent by ApiClient / AsyncApiClient carries a `trace` extension; the
+response gets `response.extensions["timings"]` (milliseconds):
+
+- connect:  TCP connect, name resolution included (httpcore does not trace DNS separately)
+- tls:      TLS handshake
+- send:     request headers + body written
+- wait:     waiting for the response headers (server think time, TTFB)
+- download: response body read
+- total:    the whole attempt as seen by the client (pool wait and overhead included)
+
+Phases that did not happen (reused keep-alive connection, plain http, in-process
+transport) are absent. Timings are aggregated per "METHOD /route/{id}" into
+LogHistograms for the metrics report.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from typing import Any
+
+from .histogram import LogHistogram
+
+# httpcore trace step (without the "connection." / "http11." / "http2." prefix) -> phase
+_PHASES = {
+    "connect_tcp": "connect",
+    "connect_unix_socket": "connect",
+    "start_tls": "tls",
+    "send_request_headers": "send",
+    "send_request_body": "send",
+    "receive_response_headers": "wait",
+    "receive_response_body": "download",
+}
+
+PHASE_ORDER = ("connect", "tls", "send", "wait", "download", "total")
+
+_ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F-]{32,36})$")
+
+
+def route_template(path: str) -> str:
+    """'/users/12/carts' -> '/users/{id}/carts' (ids are numeric or uuid-like segments)."""
+    parts = [("{id}" if _ID_SEGMENT.match(p) else p) for p in path.split("/")]
+    return "/".join(parts) or "/"
+
+
+def route_key(method: str, path: str) -> str:
+    return f"{method.upper()} {route_template(path)}"
+
+
+class PhaseTimer:
+    """Trace callback for one attempt: pass as extensions={"trace": timer} (sync)
+    or extensions={"trace": timer.atrace} (async)."""
+
+    __slots__ = ("_started", "phases")
+
+    def __init__(self) -> None:
+        self._started: dict[str, float] = {}
+        self.phases: dict[str, float] = {}
+
+    def __call__(self, name: str, info: dict[str, Any]) -> None:
+        step, _, edge = name.partition(".")[2].rpartition(".")
+        phase = _PHASES.get(step)
+        if phase is None:
+            return
+        now = time.perf_counter()
+        if edge == "started":
+            self._started[step] = now
+            return
+        started = self._started.pop(step, None)
+        if started is not None:
+            self.phases[phase] = self.phases.get(phase, 0.0) + (now - started) * 1000
+
+    async def atrace(self, name: str, info: dict[str, Any]) -> None:
+        self(name, info)
+
+    def timings(self, total_ms: float) -> dict[str, float]:
+        out = {p: round(self.phases[p], 3) for p in PHASE_ORDER if p in self.phases}
+        out["total"] = round(total_ms, 3)
+        return out
+
+
+class PhaseTimings:
+    """Per-route, per-phase histograms (thread-safe)."""
+
+    def __init__(self) -> None:
+        self._routes: dict[str, dict[str, LogHistogram]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: str, timings: dict[str, float]) -> None:
+        with self._lock:
+            phases = self._routes.setdefault(key, {})
+            for phase, ms in timings.items():
+                hist = phases.get(phase)
+                if hist is None:
+                    hist = phases[phase] = LogHistogram()
+                hist.record(ms)
+
+    def snapshot(self) -> dict[str, dict[str, dict[str, Any]]]:
+        with self._lock:
+            return {
+                key: {phase: h.to_dict() for phase, h in phases.items()}
+                for key, phases in sorted(self._routes.items())
+            }
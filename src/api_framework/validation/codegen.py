@@ -0,0 +1,281 @@
+"""
+Code-generated fast-path validators for the Draft 2020-12 subset our contract schemas use.
+
+compile_fast(schema) turns a schema into a plain Python predicate (one generated function
+per subschema, trivial type-only subschemas inlined) that returns True when the instance
+is valid. It is an accept-fast path: when it returns False the caller re-runs
+jsonschema to get the real ValidationError, so error messages are unchanged.
+
+Supported: type, enum, const, required, properties, additionalProperties,
+items (single schema), minItems / maxItems, minimum / maximum / exclusiveMinimum /
+exclusiveMaximum, minLength / maxLength, pattern, allOf / anyOf / oneOf / not, boolean
+schemas; annotations ($schema, title, description, ...) are ignored. Anything else
+($ref, prefixItems, format assertions, ...) raises UnsupportedSchema and the schema
+stays on jsonschema.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from typing import Any
+
+
+class UnsupportedSchema(ValueError):
+    """The schema uses a keyword the code generator does not handle."""
+
+
+_ANNOTATIONS = frozenset(
+    {
+        "$schema",
+        "$id",
+        "$comment",
+        "title",
+        "description",
+        "default",
+        "examples",
+        "deprecated",
+        "readOnly",
+        "writeOnly",
+    }
+)
+
+_SUPPORTED = _ANNOTATIONS | {
+    "type",
+    "enum",
+    "const",
+    "required",
+    "properties",
+    "additionalProperties",
+    "items",
+    "minItems",
+    "maxItems",
+    "minimum",
+    "maximum",
+    "exclusiveMinimum",
+    "exclusiveMaximum",
+    "minLength",
+    "maxLength",
+    "pattern",
+    "allOf",
+    "anyOf",
+    "oneOf",
+    "not",
+}
+
+# JSON type -> Python predicate on `v` (bool is not a number, 1.0 is an integer)
+_TYPE_EXPR = {
+    "object": "type(v) is dict",
+    "array": "type(v) is list",
+    "string": "type(v) is str",
+    "boolean": "type(v) is bool",
+    "null": "v is None",
+    "integer": "(type(v) is int or (type(v) is float and v.is_integer()))",
+    "number": "(type(v) is int or type(v) is float)",
+}
+# Guard for keywords that only apply to one kind of instance
+_KIND_GUARD = {
+    "object": "type(v) is dict",
+    "array": "type(v) is list",
+    "string": "type(v) is str",
+    "number": "(type(v) is int or type(v) is float)",
+}
+_KIND_OF_TYPE = {"integer": "number", "number": "number"}
+
+
+def json_equal(a: Any, b: Any) -> bool:
+    """Equality with JSON semantics (True != 1, 1 == 1.0)."""
+    if isinstance(a, bool) or isinstance(b, bool):
+        return isinstance(a, bool) and isinstance(b, bool) and a == b
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(json_equal(x, y) for x, y in zip(a, b, strict=True))
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(json_equal(a[k], b[k]) for k in a)
+    return a == b
+
+
+class _Generator:
+    def __init__(self) -> None:
+        self.functions: list[str] = []
+        self.constants: dict[str, Any] = {"_json_equal": json_equal}
+        self._count = 0
+
+    def const(self, value: Any) -> str:
+        name = f"_c{len(self.constants)}"
+        self.constants[name] = value
+        return name
+
+    def check(self, schema: Any, var: str) -> str:
+        """Expression that is truthy when `var` matches `schema`."""
+        if schema is True or schema == {}:
+            return "True"
+        if schema is False:
+            return "False"
+        if not isinstance(schema, dict):
+            raise UnsupportedSchema(f"schema must be an object or boolean, got {schema!r}")
+
+        # {"type": "<one type>"} (plus annotations) is inlined
+        keys = set(schema) - _ANNOTATIONS
+        if keys == {"type"} and isinstance(schema["type"], str):
+            return "(" + re.sub(r"\bv\b", var, self._type_expr(schema["type"])) + ")"
+        return f"{self.function(schema)}({var})"
+
+    def _type_expr(self, name: str) -> str:
+        expr = _TYPE_EXPR.get(name)
+        if expr is None:
+            raise UnsupportedSchema(f"unknown type {name!r}")
+        return expr
+
+    def function(self, schema: dict[str, Any]) -> str:
+        unknown = set(schema) - _SUPPORTED
+        if unknown:
+            raise UnsupportedSchema(f"unsupported keywords: {', '.join(sorted(unknown))}")
+
+        self._count += 1
+        name = f"_s{self._count}"
+        body: list[str] = []
+
+        types = schema.get("type")
+        kinds: set[str] | None = None
+        if types is not None:
+            names = [types] if isinstance(types, str) else list(types)
+            body.append(f"if not ({' or '.join(self._type_expr(t) for t in names)}):")
+            body.append("    return False")
+            kinds = {_KIND_OF_TYPE.get(t, t) for t in names}
+
+        if "enum" in schema:
+            c = self.const(list(schema["enum"]))
+            body.append(f"if not any(_json_equal(v, e) for e in {c}):")
+            body.append("    return False")
+        if "const" in schema:
+            c = self.const(schema["const"])
+            body.append(f"if not _json_equal(v, {c}):")
+            body.append("    return False")
+
+        self._guarded(body, "object", kinds, self._object_checks(schema))
+        self._guarded(body, "array", kinds, self._array_checks(schema))
+        self._guarded(body, "number", kinds, self._number_checks(schema))
+        self._guarded(body, "string", kinds, self._string_checks(schema))
+
+        for sub in schema.get("allOf", ()):
+            body.append(f"if not {self.check(sub, 'v')}:")
+            body.append("    return False")
+        if "anyOf" in schema:
+            any_of = " or ".join(self.check(sub, "v") for sub in schema["anyOf"])
+            body.append(f"if not ({any_of}):")
+            body.append("    return False")
+        if "oneOf" in schema:
+            one_of = ", ".join(f"bool({self.check(sub, 'v')})" for sub in schema["oneOf"])
+            body.append(f"if sum(({one_of},)) != 1:")
+            body.append("    return False")
+        if "not" in schema:
+            body.append(f"if {self.check(schema['not'], 'v')}:")
+            body.append("    return False")
+
+        body.append("return True")
+        self.functions.append(
+            f"def {name}(v):\n" + "\n".join(f"    {line}" for line in body) + "\n"
+        )
+        return name
+
+    @staticmethod
+    def _guarded(body: list[str], kind: str, kinds: set[str] | None, checks: list[str]) -> None:
+        if not checks:
+            return
+        if kinds is not None and kinds <= {kind}:
+            body.extend(checks)  # the type check above already guarantees the kind
+            return
+        if kinds is not None and kind not in kinds:
+            return  # keywords for a kind the type check already excludes
+        body.append(f"if {_KIND_GUARD[kind]}:")
+        body.extend(f"    {line}" for line in checks)
+
+    def _object_checks(self, schema: dict[str, Any]) -> list[str]:
+        out: list[str] = []
+        required = schema.get("required") or []
+        if required:
+            c = self.const(tuple(required))
+            out += [f"for k in {c}:", "    if k not in v:", "        return False"]
+
+        properties: dict[str, Any] = schema.get("properties") or {}
+        for key, sub in properties.items():
+            expr = self.check(sub, "x")
+            if expr == "True":
+                continue
+            out += [
+                f"x = v.get({key!r}, _missing)",
+                f"if x is not _missing and not {expr}:",
+                "    return False",
+            ]
+
+        additional = schema.get("additionalProperties", True)
+        if additional is False:
+            c = self.const(frozenset(properties))
+            out += [f"if not v.keys() <= {c}:", "    return False"]
+        elif additional is not True:
+            c = self.const(frozenset(properties))
+            expr = self.check(additional, "x")
+            out += [
+                "for k, x in v.items():",
+                f"    if k not in {c} and not {expr}:",
+                "        return False",
+            ]
+        return out
+
+    def _array_checks(self, schema: dict[str, Any]) -> list[str]:
+        out: list[str] = []
+        if "minItems" in schema:
+            out += [f"if len(v) < {int(schema['minItems'])}:", "    return False"]
+        if "maxItems" in schema:
+            out += [f"if len(v) > {int(schema['maxItems'])}:", "    return False"]
+        if "items" in schema:
+            items = schema["items"]
+            if items is False:
+                out += ["if v:", "    return False"]
+            else:
+                expr = self.check(items, "x")
+                if expr != "True":
+                    out += ["for x in v:", f"    if not {expr}:", "        return False"]
+        return out
+
+    def _number_checks(self, schema: dict[str, Any]) -> list[str]:
+        out: list[str] = []
+        for keyword, op in (
+            ("minimum", "<"),
+            ("maximum", ">"),
+            ("exclusiveMinimum", "<="),
+            ("exclusiveMaximum", ">="),
+        ):
+            if keyword in schema:
+                out += [f"if v {op} {self.const(schema[keyword])}:", "    return False"]
+        return out
+
+    def _string_checks(self, schema: dict[str, Any]) -> list[str]:
+        out: list[str] = []
+        if "minLength" in schema:
+            out += [f"if len(v) < {int(schema['minLength'])}:", "    return False"]
+        if "maxLength" in schema:
+            out += [f"if len(v) > {int(schema['maxLength'])}:", "    return False"]
+        if "pattern" in schema:
+            c = self.const(re.compile(schema["pattern"]))
+            out += [f"if {c}.search(v) is None:", "    return False"]
+        return out
+
+
+def generate_source(schema: Any) -> tuple[str, str, dict[str, Any]]:
+    """(python source, entry function name, constants) for `schema`."""
+    gen = _Generator()
+    entry = gen.check(schema, "v")
+    if not entry.startswith("_s"):
+        # Root is a boolean / type-only schema: wrap the expression.
+        gen.functions.append(f"def _root(v):\n    return bool({entry})\n")
+        entry = "_root(v)"
+    return "\n".join(gen.functions), entry.partition("(")[0], gen.constants
+
+
+def compile_fast(schema: Any) -> Callable[[Any], bool]:
+    """Predicate for `schema`; raises UnsupportedSchema outside the supported subset."""
+    source, entry, constants = generate_source(schema)
+    namespace: dict[str, Any] = {**constants, "_missing": object()}
+    exec(compile(source, "<schema-codegen>", "exec"), namespace)  # noqa: S102
+    return namespace[entry]
@@ -0,0 +1,247 @@
+"""
+Item-level validation for big list payloads (`/products?limit=0` and friends).
+
+validate_list_items() splits a list schema into its envelope (everything but the item
+list's `items`) and the item subschema, validates the envelope once, and then the items:
+
+- all of them (default), in chunks on a process pool when `workers > 1` (one pool per
+  process, reused by later calls)
+- or a deterministic sample: first, last and `sample` random items drawn with `seed`
+
+The items are checked against the root schema as a resource (a `$ref` into the list's
+`items`), so `$ref`s such as `#/$defs/product` inside them resolve as they do for the
+whole document.
+
+Every error is gathered with its JSON pointer (e.g. `/products/17/price`) and raised as a
+single ListValidationError (a jsonschema.ValidationError). Items go through the codegen
+fast path first when the registry uses that backend.
+"""
+
+from __future__ import annotations
+
+import copy
+import random
+import threading
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from jsonschema import Draft202012Validator, ValidationError
+from referencing import Registry
+from referencing.jsonschema import DRAFT202012
+
+from .codegen import UnsupportedSchema, compile_fast
+from .schema import SchemaRegistry, schema_registry
+
+MAX_REPORTED_ERRORS = 20
+
+# Base URI for list schemas without an $id of their own
+_ROOT_URI = "urn:api-framework:list-schema"
+
+
+@dataclass(frozen=True)
+class ItemError:
+    pointer: str  # JSON pointer into the payload
+    keyword: str  # failing schema keyword (type, required, minimum, ...)
+    message: str
+
+
+@dataclass(frozen=True)
+class ListValidationReport:
+    key: str
+    total: int  # items in the payload
+    checked: int  # items validated (== total unless sampled)
+
+
+class ListValidationError(ValidationError):
+    def __init__(self, errors: list[ItemError], report: ListValidationReport):
+        lines = [f"{e.pointer or '/'}: {e.message}" for e in errors[:MAX_REPORTED_ERRORS]]
+        more = len(errors) - MAX_REPORTED_ERRORS
+        if more > 0:
+            lines.append(f"... and {more} more")
+        super().__init__(
+            f"{len(errors)} schema error(s) in {report.checked}/{report.total} "
+            f"'{report.key}' items checked:\n  " + "\n  ".join(lines)
+        )
+        self.errors = errors
+        self.report = report
+
+
+def json_pointer(parts: Iterable[Any]) -> str:
+    return "".join("/" + str(p).replace("~", "~0").replace("/", "~1") for p in parts)
+
+
+@dataclass(frozen=True)
+class _Checker:
+    validator: Draft202012Validator
+    fast: Callable[[Any], bool] | None
+
+    @classmethod
+    def build(cls, schema: Any, backend: str) -> _Checker:
+        fast = None
+        if backend == "codegen":
+            try:
+                fast = compile_fast(schema)
+            except UnsupportedSchema:
+                fast = None
+        return cls(Draft202012Validator(schema), fast)
+
+    @classmethod
+    def for_items(cls, schema: dict[str, Any], key: str, backend: str) -> _Checker:
+        """Checker for the items of list `key`, resolving $refs against the root `schema`."""
+        uri = schema.get("$id") or _ROOT_URI
+        registry = Registry().with_resource(uri, DRAFT202012.create_resource(schema))
+        pointer = json_pointer(["properties", key, "items"])
+        fast = None
+        if backend == "codegen":
+            try:  # codegen has no $ref support: items using one take the jsonschema path
+                fast = compile_fast(schema["properties"][key]["items"])
+            except UnsupportedSchema:
+                fast = None
+        return cls(Draft202012Validator({"$ref": f"{uri}#{pointer}"}, registry=registry), fast)
+
+    def errors(self, instance: Any, prefix: Sequence[Any]) -> list[ItemError]:
+        if self.fast is not None and self.fast(instance):
+            return []
+        return [
+            ItemError(json_pointer([*prefix, *e.absolute_path]), str(e.validator), e.message)
+            for e in self.validator.iter_errors(instance)
+        ]
+
+
+@dataclass(frozen=True)
+class _SplitSchema:
+    ident: tuple[Any, ...]  # (path, mtime, list key, backend): the split cache key
+    envelope: _Checker
+    schema: dict[str, Any]  # root schema (picklable, for pool workers)
+    item_checker: _Checker
+
+
+_split_cache: dict[tuple[Path, int, str, str], _SplitSchema] = {}
+
+
+def _list_key(schema: dict[str, Any]) -> str:
+    keys = [
+        k
+        for k, sub in (schema.get("properties") or {}).items()
+        if isinstance(sub, dict) and sub.get("type") == "array" and "items" in sub
+    ]
+    if len(keys) != 1:
+        raise ValueError(f"Cannot tell the item list apart (array properties: {keys}); pass key=")
+    return keys[0]
+
+
+def _split(registry: SchemaRegistry, schema_path: str | Path, key: str | None) -> tuple[str, Any]:
+    entry = registry.compiled(schema_path)
+    schema = entry.validator.schema
+    key = key or _list_key(schema)
+    cache_key = (Path(schema_path).resolve(), entry.mtime_ns, key, registry.backend)
+    split = _split_cache.get(cache_key)
+    if split is None:
+        try:
+            schema["properties"][key]["items"]
+        except (KeyError, TypeError):
+            raise ValueError(f"{schema_path}: properties.{key}.items not found") from None
+        envelope = copy.deepcopy(schema)
+        del envelope["properties"][key]["items"]
+        split = _split_cache[cache_key] = _SplitSchema(
+            ident=cache_key,
+            envelope=_Checker.build(envelope, registry.backend),
+            schema=schema,
+            item_checker=_Checker.for_items(schema, key, registry.backend),
+        )
+    return key, split
+
+
+def sample_indices(total: int, sample: int, seed: int) -> list[int]:
+    """First, last and `sample` seeded random positions (sorted, unique)."""
+    if total == 0:
+        return []
+    picked = {0, total - 1}
+    rest = range(1, total - 1)
+    picked.update(random.Random(seed).sample(rest, min(sample, len(rest))))
+    return sorted(picked)
+
+
+# One process pool per process (replaced when a call asks for another size); its workers
+# keep a compiled item checker per split schema.
+_pool: ProcessPoolExecutor | None = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+_worker_checkers: dict[tuple[Any, ...], _Checker] = {}
+
+
+def _process_pool(workers: int) -> ProcessPoolExecutor:
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _pool, _pool_workers = ProcessPoolExecutor(max_workers=workers), workers
+        return _pool
+
+
+def _check_chunk(
+    ident: tuple[Any, ...], schema: dict[str, Any], chunk: list[tuple[int, Any]]
+) -> list[ItemError]:
+    key, backend = ident[-2:]
+    checker = _worker_checkers.get(ident)
+    if checker is None:
+        checker = _worker_checkers[ident] = _Checker.for_items(schema, key, backend)
+    out: list[ItemError] = []
+    for index, item in chunk:
+        out += checker.errors(item, (key, index))
+    return out
+
+
+def validate_list_items(
+    payload: Any,
+    schema_path: str | Path,
+    *,
+    key: str | None = None,
+    sample: int | None = None,
+    seed: int = 0,
+    workers: int = 0,
+    chunk_size: int = 500,
+    registry: SchemaRegistry | None = None,
+) -> ListValidationReport:
+    """
+    Validate a list payload envelope + items; raises ListValidationError with every error.
+
+    key:     the item list property (default: the schema's only array property with items)
+    sample:  validate first, last and `sample` random items (seeded) instead of all
+    workers: > 1 spreads item chunks over the (shared) process pool
+    """
+    registry = registry or schema_registry()
+    key, split = _split(registry, schema_path, key)
+
+    errors = split.envelope.errors(payload, ())
+    items = payload.get(key) if isinstance(payload, dict) else None
+    if not isinstance(items, list):
+        # The envelope check already reported the missing / mistyped list.
+        report = ListValidationReport(key=key, total=0, checked=0)
+        if errors:
+            raise ListValidationError(errors, report)
+        return report
+
+    if sample is None:
+        selected = list(enumerate(items))
+    else:
+        selected = [(i, items[i]) for i in sample_indices(len(items), sample, seed)]
+
+    chunks = [selected[i : i + chunk_size] for i in range(0, len(selected), chunk_size)]
+    if workers > 1 and len(chunks) > 1:
+        pool = _process_pool(workers)
+        n = len(chunks)
+        for chunk_errors in pool.map(_check_chunk, [split.ident] * n, [split.schema] * n, chunks):
+            errors += chunk_errors
+    else:
+        for index, item in selected:
+            errors += split.item_checker.errors(item, (key, index))
+
+    report = ListValidationReport(key=key, total=len(items), checked=len(selected))
+    if errors:
+        raise ListValidationError(errors, report)
+    return report
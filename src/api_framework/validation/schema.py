@@ -1,22 +1,153 @@
 # API contracts
 from __future__ import annotations
 
-import json
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any
 
 from jsonschema import Draft202012Validator
 
+from ..jsoncodec import default_codec
+from .codegen import UnsupportedSchema, compile_fast
+
+# Contract schemas live next to the tests that use them (preloaded at collection time).
+SCHEMA_GLOB = "tests/*/schemas/*.schema.json"
+
+# "jsonschema": Draft202012Validator only; "codegen": generated fast path first (see
+# api_framework.validation.codegen), jsonschema for errors and unsupported schemas
+SCHEMA_BACKENDS = ("jsonschema", "codegen")
+
 
 def load_schema(schema_path: str | Path) -> dict[str, Any]:
     path = Path(schema_path)
-    return json.loads(path.read_text(encoding="utf-8"))
+    return default_codec().loads(path.read_bytes())
+
+
+@dataclass
+class SchemaStats:
+    compiled: int = 0  # schema files loaded, checked and compiled (mtime changes included)
+    cache_hits: int = 0
+    validations: int = 0
+    fast_schemas: int = 0  # compiled with the codegen backend
+    fast_validations: int = 0  # payloads accepted by the generated validator
+    compile_ms: float = 0.0
+    validate_ms: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        out = asdict(self)
+        out["compile_ms"] = round(self.compile_ms, 3)
+        out["validate_ms"] = round(self.validate_ms, 3)
+        return out
+
+
+@dataclass(frozen=True)
+class CompiledSchema:
+    mtime_ns: int
+    validator: Draft202012Validator
+    fast: Callable[[Any], bool] | None = None  # codegen backend, when the schema allows it
+
+
+class SchemaRegistry:
+    """
+    Compiled Draft 2020-12 validators, one per schema file and process.
+
+    Entries are keyed by resolved path and revalidated against the file's mtime, so a
+    schema edited mid-session is picked up; the schema itself is checked
+    (check_schema) once, when compiled. Thread-safe.
+    """
+
+    def __init__(self, backend: str = "jsonschema") -> None:
+        self._compiled: dict[Path, CompiledSchema] = {}
+        self._lock = threading.Lock()
+        self.backend = backend
+        self.stats = SchemaStats()
+
+    def configure(self, *, backend: str) -> None:
+        if backend not in SCHEMA_BACKENDS:
+            raise ValueError(f"Unknown schema backend {backend!r}; use one of {SCHEMA_BACKENDS}")
+        if backend != self.backend:
+            self.backend = backend
+            self.clear()
+
+    def compiled(self, schema_path: str | Path) -> CompiledSchema:
+        path = Path(schema_path).resolve()
+        mtime = path.stat().st_mtime_ns
+        with self._lock:
+            cached = self._compiled.get(path)
+            if cached is not None and cached.mtime_ns == mtime:
+                self.stats.cache_hits += 1
+                return cached
+
+        start = time.perf_counter()
+        schema = load_schema(path)
+        Draft202012Validator.check_schema(schema)
+        fast = None
+        if self.backend == "codegen":
+            try:
+                fast = compile_fast(schema)
+            except UnsupportedSchema:
+                fast = None  # stays on jsonschema
+        entry = CompiledSchema(mtime, Draft202012Validator(schema), fast)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        with self._lock:
+            self._compiled[path] = entry
+            self.stats.compiled += 1
+            self.stats.fast_schemas += fast is not None
+            self.stats.compile_ms += elapsed_ms
+        return entry
+
+    def validator(self, schema_path: str | Path) -> Draft202012Validator:
+        return self.compiled(schema_path).validator
+
+    def validate(self, payload: Any, schema_path: str | Path) -> None:
+        entry = self.compiled(schema_path)
+        start = time.perf_counter()
+        accepted = False
+        try:
+            # The generated validator only accepts; jsonschema produces the errors.
+            accepted = entry.fast is not None and entry.fast(payload)
+            if not accepted:
+                entry.validator.validate(payload)
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            with self._lock:
+                self.stats.validations += 1
+                self.stats.fast_validations += accepted
+                self.stats.validate_ms += elapsed_ms
+
+    def preload(self, paths: Iterable[str | Path]) -> int:
+        """Compile every schema up front; returns how many were loaded."""
+        count = 0
+        for path in paths:
+            self.compiled(path)
+            count += 1
+        return count
+
+    def clear(self) -> None:
+        with self._lock:
+            self._compiled.clear()
+
+
+_registry = SchemaRegistry()
+
+
+def schema_registry() -> SchemaRegistry:
+    """The process-wide registry used by validate_json_schema."""
+    return _registry
+
+
+def preload_schemas(root: str | Path, pattern: str = SCHEMA_GLOB) -> int:
+    return _registry.preload(sorted(Path(root).glob(pattern)))
 
 
 def validate_json_schema(payload: Any, schema_path: str | Path) -> None:
     """
     Validates `payload` against a JSON Schema file using Draft 2020-12 validator.
     Raises jsonschema.ValidationError on mismatch.
+    The compiled validator is cached per file (see SchemaRegistry).
     """
-    schema = load_schema(schema_path)
-    Draft202012Validator(schema).validate(payload)
+    _registry.validate(payload, schema_path)
@@ -1,13 +1,19 @@
 # config correctness
 from __future__ import annotations
 
+import re
+from pathlib import Path
+
 from api_framework.config import Settings
+from api_framework.jsoncodec import codec_available
+from api_framework.redaction import compile_key_rules
+from api_framework.retry import BACKOFF_STRATEGIES
 
 
 def validate_settings(s: Settings) -> None:
     # Base config
-    if not str(s.base_url).startswith(("http://", "https://")):
-        raise ValueError("BASE_URL must start with http:// or https://")
+    if not str(s.base_url).startswith(("http://", "https://", "inproc://")):
+        raise ValueError("BASE_URL must start with http://, https:// or inproc://")
 
     if s.timeout_seconds <= 0:
         raise ValueError("TIMEOUT_SECONDS must be > 0")
@@ -15,6 +21,76 @@ def validate_settings(s: Settings) -> None:
     if s.retry_attempts < 0:
         raise ValueError("RETRY_ATTEMPTS must be >= 0")
 
+    if s.retry_backoff not in BACKOFF_STRATEGIES:
+        raise ValueError(f"RETRY_BACKOFF must be one of: {', '.join(sorted(BACKOFF_STRATEGIES))}")
+
+    if s.retry_backoff_base <= 0 or s.retry_backoff_cap < s.retry_backoff_base:
+        raise ValueError("RETRY_BACKOFF_BASE must be > 0 and <= RETRY_BACKOFF_CAP")
+
+    if s.retry_budget_ratio is not None and s.retry_budget_ratio < 0:
+        raise ValueError("RETRY_BUDGET_RATIO must be >= 0")
+
+    if s.retry_budget_min_retries < 0:
+        raise ValueError("RETRY_BUDGET_MIN_RETRIES must be >= 0")
+
+    if s.request_deadline_seconds is not None and s.request_deadline_seconds <= 0:
+        raise ValueError("REQUEST_DEADLINE_SECONDS must be > 0")
+
+    if s.debug_log_queue_size < 1:
+        raise ValueError("DEBUG_LOG_QUEUE_SIZE must be >= 1")
+
+    if s.debug_log_max_body_chars < 1:
+        raise ValueError("DEBUG_LOG_MAX_BODY_CHARS must be >= 1")
+
+    if s.redact_max_depth < 1:
+        raise ValueError("REDACT_MAX_DEPTH must be >= 1")
+
+    if s.redact_max_nodes < 1:
+        raise ValueError("REDACT_MAX_NODES must be >= 1")
+
+    try:
+        compile_key_rules(s.redact_json_keys)
+    except re.error as exc:
+        raise ValueError(f"REDACT_JSON_KEYS has an invalid pattern: {exc}") from None
+
+    if s.request_log_max_bytes < 1024:
+        raise ValueError("REQUEST_LOG_MAX_BYTES must be >= 1024")
+
+    if s.request_log_backups < 0:
+        raise ValueError("REQUEST_LOG_BACKUPS must be >= 0")
+
+    if not codec_available(s.json_codec):
+        raise ValueError(
+            f"JSON_CODEC={s.json_codec} but the {s.json_codec} package is not installed"
+        )
+
+    if s.max_concurrency < 1:
+        raise ValueError("MAX_CONCURRENCY must be >= 1")
+
+    if s.response_cache_max_entries < 1:
+        raise ValueError("RESPONSE_CACHE_MAX_ENTRIES must be >= 1")
+
+    if s.rate_limit_rps < 0:
+        raise ValueError("RATE_LIMIT_RPS must be >= 0")
+
+    if s.rate_limit_burst is not None and s.rate_limit_burst < 1:
+        raise ValueError("RATE_LIMIT_BURST must be >= 1")
+
+    if any(rps <= 0 for rps in s.rate_limit_route_rps.values()):
+        raise ValueError("RATE_LIMIT_ROUTE_RPS values must be > 0")
+
+    if s.circuit_failure_threshold < 1:
+        raise ValueError("CIRCUIT_FAILURE_THRESHOLD must be >= 1")
+
+    if s.circuit_reset_seconds <= 0:
+        raise ValueError("CIRCUIT_RESET_SECONDS must be > 0")
+
+    if s.circuit_half_open_max_calls < 1:
+        raise ValueError("CIRCUIT_HALF_OPEN_MAX_CALLS must be >= 1")
+
+    if s.cassette_mode == "replay" and not Path(s.cassette_path).exists():
+        raise ValueError(f"CASSETTE_MODE=replay but CASSETTE_PATH not found: {s.cassette_path}")
+
     # Auth config:
     # Allow either:
     # 1) AUTH_HEADER_VALUE (fast path token), OR
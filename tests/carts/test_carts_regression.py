@@ -42,6 +42,15 @@ def test_carts_by_user(api):
         assert all(c.get("userId") == 1 for c in data["carts"])
 
 
+@pytest.mark.regression
+def test_get_many_carts_keeps_order_and_reports_errors(api):
+    result = CartsClient(api).get_many([3, 0, 1, 2], concurrency=4)
+
+    assert [c["id"] if c else None for c in result.items] == [3, None, 1, 2]
+    assert list(result.errors) == [0]
+    assert not result.ok
+
+
 # -----------------------
 # NEGATIVE (regression)
 # -----------------------
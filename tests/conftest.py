@@ -1,16 +1,38 @@
+from pathlib import Path
+
 import pytest
 
 from api_framework.client import ApiClient
 from api_framework.config import settings_for
+from api_framework.debuglog import DebugLog
+from api_framework.jsoncodec import configure_default
+from api_framework.latency import shared_recorder
+from api_framework.reporting.client_stats import write_client_stats
+from api_framework.reporting.latency import latency_path_for, write_latency
+from api_framework.requestlog import RequestLog
+from api_framework.validation.schema import preload_schemas, schema_registry
 from api_framework.validation.settings import validate_settings
 
+# @pytest.mark.latency_budget(...) checks (see api_framework.latency_budget); pytester runs
+# small suites for the framework tests of pytest plugins
+pytest_plugins = ("api_framework.latency_budget", "pytester")
+
 
 def pytest_addoption(parser):
     parser.addoption(
         "--env",
         action="store",
         default="local",
-        help="Environment name to load from env/.env.<name> (default: local)",
+        help=(
+            "Environment name to load from env/.env.<name> (default: local); "
+            "'inproc' runs against the in-process DummyJSON stand-in (no network)"
+        ),
+    )
+    parser.addoption(
+        "--client-stats",
+        action="store",
+        default="",
+        help="Write ApiClient feature counters (cache, circuit breakers, ...) to this JSON file",
     )
 
 
@@ -23,7 +45,61 @@ def settings(request):
 
 
 @pytest.fixture(scope="session")
-def api(settings):
+def api(request, settings):
     client = ApiClient(settings)
     yield client
     client.close()
+
+    stats_path = request.config.getoption("--client-stats")
+    if stats_path:
+        stats = client.stats()
+        schemas = schema_registry().stats
+        if schemas.validations:
+            stats["schema_validation"] = schemas.as_dict()
+        write_client_stats(Path(stats_path), stats)
+
+
+@pytest.fixture
+def make_api(settings):
+    # Own ApiClient with settings overrides, e.g. make_api(rate_limit_rps=20.0); every
+    # client made by the test is closed at teardown
+    clients: list[ApiClient] = []
+
+    def make(**overrides) -> ApiClient:
+        client = ApiClient(settings.model_copy(update=overrides))
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
+
+
+def pytest_collection_finish(session):
+    # Compile every contract schema once per process, before the first test runs
+    if session.items:
+        env_settings = settings_for(session.config.getoption("--env"))
+        # Schemas and report artifacts use the session's JSON_CODEC too
+        configure_default(env_settings.json_codec)
+        schema_registry().configure(backend=env_settings.schema_backend)
+        preload_schemas(session.config.rootpath)
+
+
+@pytest.hookimpl(wrapper=True, trylast=True)
+def pytest_runtest_call(item):
+    # API_DEBUG_LOG=1: drain the background writer while this test's output is still captured
+    try:
+        return (yield)
+    finally:
+        DebugLog.flush_all()
+
+
+def pytest_sessionfinish(session):
+    DebugLog.flush_all()
+    RequestLog.flush_all()
+
+    # Endpoint latency histograms next to the JUnit XML (one file per xdist worker)
+    junit = session.config.getoption("xmlpath", default=None)
+    recorder = shared_recorder()
+    if junit and len(recorder):
+        write_latency(latency_path_for(Path(junit)), recorder.snapshot())
@@ -0,0 +1,86 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from api_framework.inproc.app import INPROC_HTTP_BASE_URL, INPROC_SCHEME, inproc_transport
+
+
+class TransportProbe(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    The in-process stand-in behind a probe: records every request, tracks how many are
+    in flight, and can delay responses or fail the next N requests with ConnectError.
+    """
+
+    def __init__(self):
+        self.inner = inproc_transport()
+        self.requests: list[httpx.Request] = []
+        self.delay = 0.0
+        self.fail_next = 0
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _enter(self, request: httpx.Request) -> bool:
+        with self._lock:
+            self.requests.append(request)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            fail = self.fail_next > 0
+            self.fail_next -= fail
+        return fail
+
+    def _leave(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        fail = self._enter(request)
+        try:
+            time.sleep(self.delay)
+            if fail:
+                raise httpx.ConnectError("probe: connection refused", request=request)
+            return self.inner.handle_request(request)
+        finally:
+            self._leave()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        fail = self._enter(request)
+        try:
+            await asyncio.sleep(self.delay)
+            if fail:
+                raise httpx.ConnectError("probe: connection refused", request=request)
+            return await self.inner.handle_async_request(request)
+        finally:
+            self._leave()
+
+    def paths(self, method: str = "GET") -> list[str]:
+        return [r.url.path for r in self.requests if r.method == method]
+
+
+@pytest.fixture
+def probe(monkeypatch):
+    # Clients built during the test against the stand-in talk to the probe instead
+    probe = TransportProbe()
+    monkeypatch.setattr("api_framework.client.inproc_transport", lambda: probe)
+    return probe
+
+
+@pytest.fixture
+def inproc_settings(settings):
+    # The session settings pointed at the stand-in (the probe), whatever --env says
+    return settings.model_copy(update={"base_url": f"{INPROC_SCHEME}dummyjson"})
+
+
+@pytest.fixture
+def inproc_list():
+    # The stand-in's full `limit=0` list payload, e.g. inproc_list("users")
+    def fetch(resource: str) -> dict:
+        with httpx.Client(transport=inproc_transport(), base_url=INPROC_HTTP_BASE_URL) as http:
+            resp = http.get(f"/{resource}", params={"limit": 0})
+            resp.raise_for_status()
+            return resp.json()
+
+    return fetch
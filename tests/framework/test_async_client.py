@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+
+from api_framework.client import AsyncApiClient
+
+pytestmark = pytest.mark.framework
+
+
+def _run(settings, fn, **overrides):
+    async def main():
+        async with AsyncApiClient(settings.model_copy(update=overrides)) as api:
+            return api, await fn(api)
+
+    return asyncio.run(main())
+
+
+def test_async_retries_keep_one_correlation_id(inproc_settings, probe):
+    probe.fail_next = 2
+
+    api, resp = _run(
+        inproc_settings,
+        lambda api: api.get("/users/1"),
+        retry_attempts=3,
+        retry_backoff_base=0.01,
+        retry_backoff_cap=0.01,
+    )
+
+    assert resp.status_code == 200
+    ids = {r.headers["x-correlation-id"] for r in probe.requests}
+    assert len(probe.requests) == 3 and len(ids) == 1
+    assert api.stats()["retries"]["attempts"] == 3
+
+
+def test_async_gather_gets_one_correlation_id_per_request(inproc_settings, probe):
+    async def fetch(api):
+        return await asyncio.gather(
+            *(api.get(f"/users/{i}") for i in range(1, 6)),
+            api.get("/users/6", headers={"x-correlation-id": "caller-id"}),
+        )
+
+    _, responses = _run(inproc_settings, fetch)
+
+    ids = [r.request.headers["x-correlation-id"] for r in responses]
+    assert len(set(ids)) == 6
+    assert ids[-1] == "caller-id"
+
+
+def test_async_semaphore_bounds_in_flight_requests(inproc_settings, probe):
+    probe.delay = 0.02
+
+    async def fetch(api):
+        return await asyncio.gather(*(api.get(f"/products/{i}") for i in range(1, 13)))
+
+    _, responses = _run(inproc_settings, fetch, max_concurrency=3)
+
+    assert [r.status_code for r in responses] == [200] * 12
+    assert probe.peak == 3
+
+
+def test_async_concurrent_first_auth_calls_share_one_login(inproc_settings, probe):
+    probe.delay = 0.01
+
+    async def fetch(api):
+        return await asyncio.gather(*(api.get("/auth/me", auth=True) for _ in range(8)))
+
+    _, responses = _run(
+        inproc_settings,
+        fetch,
+        auth_username="emilys",
+        auth_password="emilyspass",  # pragma: allowlist secret
+        auth_header_value=None,
+    )
+
+    assert [r.status_code for r in responses] == [200] * 8
+    assert probe.paths("POST").count("/auth/login") == 1
+    assert len({r.request.headers["authorization"] for r in responses}) == 1
@@ -0,0 +1,27 @@
+import httpx
+import pytest
+
+from api_framework.cache import cache_key
+from api_framework.clients.products_client import ProductsClient
+
+pytestmark = pytest.mark.framework
+
+
+def test_list_categories_served_from_response_cache(make_api):
+    api = make_api(response_cache_enabled=True)
+    client = ProductsClient(api)
+    first = client.list_categories()
+    second = client.list_categories()
+
+    assert first == second
+    assert api.cache.stats.hits == 1
+    assert api.cache.stats.misses == 1
+
+
+def test_cache_key_escapes_query_values():
+    split = cache_key("GET", httpx.URL("/products/search", params={"q": "a", "b": "c"}), None)
+    joined = cache_key("GET", httpx.URL("/products/search", params={"q": "a&b=c"}), None)
+    reordered = cache_key("get", httpx.URL("/products/search?b=c&q=a"), None)
+
+    assert split != joined
+    assert split == reordered
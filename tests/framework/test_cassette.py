@@ -0,0 +1,147 @@
+import multiprocessing
+import sys
+import zlib
+from contextlib import closing
+
+import httpx
+import pytest
+
+from api_framework import cassette as cassette_module
+from api_framework.cassette import Cassette, CassetteMiss
+from api_framework.client import ApiClient
+from api_framework.clients.auth_client import AuthApiClient
+
+pytestmark = pytest.mark.framework
+
+CREDENTIALS = {"username": "emilys", "password": "emilyspass"}  # pragma: allowlist secret
+
+
+def _client(settings, path, mode) -> closing[ApiClient]:
+    update = {"cassette_mode": mode, "cassette_path": str(path)}
+    return closing(ApiClient(settings.model_copy(update=update)))
+
+
+def _stored_records(path) -> list[bytes]:
+    header = len(cassette_module._DATA_MAGIC) + cassette_module._RUN_ID_SIZE
+    data, records = path.read_bytes()[header:], []
+    while data:
+        record = zlib.decompressobj()
+        records.append(record.decompress(data))
+        data = record.unused_data
+    return records
+
+
+def _exchange(method, url, status=200, content=b"{}") -> tuple[httpx.Request, httpx.Response]:
+    req = httpx.Request(method, f"https://dummyjson.com{url}")
+    return req, httpx.Response(status, content=content, request=req)
+
+
+def test_recorded_auth_flow_replays_without_tokens_on_disk(inproc_settings, tmp_path):
+    path = tmp_path / "auth.cassette"
+    with _client(inproc_settings, path, "record") as api:
+        auth = AuthApiClient(api)
+        recorded = auth.login(**CREDENTIALS)
+        refreshed = auth.refresh(refresh_token=recorded["refreshToken"])
+        user = api.get("/users/1").json()
+
+    stored = b"".join(_stored_records(path))
+    for secret in (recorded["accessToken"], recorded["refreshToken"], refreshed["accessToken"]):
+        assert secret.encode() not in stored
+
+    with _client(inproc_settings, path, "replay") as api:
+        auth = AuthApiClient(api)
+        replayed = auth.login(**CREDENTIALS)
+        # The placeholder goes back in the refresh body and matches the recorded refresh
+        assert replayed["refreshToken"].startswith("***REDACTED:")
+        assert auth.refresh(refresh_token=replayed["refreshToken"])["accessToken"]
+        assert api.get("/users/1").json() == {**user, "password": "***REDACTED***"}
+        with pytest.raises(CassetteMiss):
+            api.get("/users/2")
+
+
+def test_record_starts_the_cassette_afresh(inproc_settings, tmp_path, monkeypatch):
+    path = tmp_path / "api.cassette"
+    with _client(inproc_settings, path, "record") as api:
+        api.get("/users/1")
+    # A later run re-records: nothing stale survives it
+    monkeypatch.setattr(cassette_module, "_RUN_ID", "a-later-run")
+    with _client(inproc_settings, path, "record") as api:
+        api.get("/posts/1")
+
+    with _client(inproc_settings, path, "replay") as api:
+        assert api.get("/posts/1").status_code == 200
+        with pytest.raises(CassetteMiss):
+            api.get("/users/1")
+
+
+def test_index_is_written_as_interactions_are_recorded(tmp_path):
+    path = tmp_path / "api.cassette"
+    recorder = Cassette(path, "record")
+    recorder.record(*_exchange("GET", "/users/1", content=b'{"id": 1}'))
+    recorder.record(*_exchange("GET", "/users/1", content=b'{"id": 1, "n": 2}'))
+
+    # Killed before close(): the journal is replayed as is
+    player = Cassette(path, "replay")
+    try:
+        assert len(player) == 2
+        req, _ = _exchange("GET", "/users/1")
+        assert player.play(req).json() == {"id": 1}
+        assert player.play(req).json() == {"id": 1, "n": 2}
+    finally:
+        player.close()
+        recorder.close()
+
+
+def test_corrupt_index_is_rejected(tmp_path):
+    path = tmp_path / "api.cassette"
+    recorder = Cassette(path, "record")
+    recorder.record(*_exchange("GET", "/users/1"))
+    recorder.close()
+    path.with_name("api.cassette.idx").write_bytes(b"not an index at all")
+
+    player = Cassette(path, "replay")
+    with pytest.raises(ValueError, match="Not a cassette index"):
+        player.play(_exchange("GET", "/users/1")[0])
+
+
+def _record_in_process(path, resource: str, start) -> None:
+    start.wait()
+    recorder = Cassette(path, "record")
+    for n in range(50):
+        recorder.record(*_exchange("GET", f"/{resource}/{n}", content=b'{"n": %d}' % n))
+    recorder.close()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="cross-process recording needs flock")
+def test_processes_recording_one_cassette_share_it(tmp_path, monkeypatch):
+    path = tmp_path / "api.cassette"
+    monkeypatch.setattr(cassette_module, "_RUN_ID", "an-earlier-run")
+    stale = Cassette(path, "record")
+    stale.record(*_exchange("GET", "/carts/1"))
+    stale.close()
+
+    # Two xdist-like workers of one run (same run id), recording at the same time
+    monkeypatch.setattr(cassette_module, "_RUN_ID", "this-run")
+    ctx = multiprocessing.get_context("fork")
+    start = ctx.Event()
+    workers = [
+        ctx.Process(target=_record_in_process, args=(path, resource, start))
+        for resource in ("users", "posts")
+    ]
+    for worker in workers:
+        worker.start()
+    start.set()
+    for worker in workers:
+        worker.join(30)
+    assert [worker.exitcode for worker in workers] == [0, 0]
+
+    player = Cassette(path, "replay")
+    try:
+        assert len(player) == 100
+        for resource in ("users", "posts"):
+            for n in range(50):
+                assert player.play(_exchange("GET", f"/{resource}/{n}")[0]).json() == {"n": n}
+        with pytest.raises(CassetteMiss):
+            player.play(_exchange("GET", "/carts/1")[0])
+    finally:
+        player.close()
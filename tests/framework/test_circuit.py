@@ -0,0 +1,61 @@
+import asyncio
+
+import httpx
+import pytest
+
+from api_framework.circuit import CircuitOpenError
+from api_framework.client import AsyncApiClient
+from api_framework.clients.users_client import UsersClient
+
+pytestmark = pytest.mark.framework
+
+
+@pytest.mark.negative
+def test_circuit_breaker_fails_fast_on_dead_backend(make_api):
+    api = make_api(
+        base_url="http://127.0.0.1:9",  # discard port: connection refused
+        circuit_breaker_enabled=True,
+        circuit_failure_threshold=1,
+    )
+    client = UsersClient(api)
+    # First failure opens the circuit: no retry sleeps after that.
+    with pytest.raises(httpx.ConnectError):
+        client.get_user_raw(1)
+    with pytest.raises(CircuitOpenError):
+        client.get_user_raw(2)
+
+    (breaker,) = api.stats()["circuit_breakers"].values()
+    assert breaker["state"] == "open"
+    assert breaker["short_circuited"] == 1
+
+
+@pytest.mark.negative
+def test_cancelled_half_open_trial_frees_its_slot(inproc_settings, probe):
+    settings = inproc_settings.model_copy(
+        update={
+            "circuit_breaker_enabled": True,
+            "circuit_failure_threshold": 1,
+            "circuit_reset_seconds": 0.05,
+            "circuit_half_open_max_calls": 1,
+            "retry_attempts": 1,
+        }
+    )
+
+    async def main():
+        async with AsyncApiClient(settings) as api:
+            probe.fail_next = 1
+            with pytest.raises(httpx.ConnectError):
+                await api.get("/users/1")
+            await asyncio.sleep(0.06)
+
+            # The half-open trial hangs and is cancelled (e.g. a test timeout)
+            probe.delay = 1.0
+            trial = asyncio.create_task(api.get("/users/1"))
+            await asyncio.sleep(0.05)
+            trial.cancel()
+            await asyncio.gather(trial, return_exceptions=True)
+
+            probe.delay = 0.0
+            return await api.get("/users/1")
+
+    assert asyncio.run(main()).status_code == 200
@@ -0,0 +1,42 @@
+import json
+
+import pytest
+from jsonschema import Draft202012Validator, ValidationError
+
+from api_framework.validation.codegen import UnsupportedSchema, compile_fast
+from api_framework.validation.schema import SchemaRegistry
+
+pytestmark = pytest.mark.framework
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [1, 1.0, 1.5, True, None, "a", "", [], {}, {"id": 1}, {"id": True}, {"id": 0}, {"x": 1}],
+)
+def test_codegen_matches_jsonschema_semantics(instance):
+    schema = {
+        "anyOf": [
+            {"type": "integer", "minimum": 1},
+            {"type": "string", "minLength": 1},
+            {
+                "type": "object",
+                "required": ["id"],
+                "properties": {"id": {"type": "integer", "exclusiveMinimum": 0}},
+                "additionalProperties": False,
+            },
+        ]
+    }
+    assert compile_fast(schema)(instance) == Draft202012Validator(schema).is_valid(instance)
+
+
+def test_codegen_falls_back_on_unsupported_keywords(tmp_path):
+    schema = {"$defs": {"id": {"type": "integer"}}, "properties": {"id": {"$ref": "#/$defs/id"}}}
+    with pytest.raises(UnsupportedSchema):
+        compile_fast(schema)
+
+    schema_path = tmp_path / "ref.schema.json"
+    schema_path.write_text(json.dumps(schema), encoding="utf-8")
+    registry = SchemaRegistry(backend="codegen")
+    with pytest.raises(ValidationError):
+        registry.validate({"id": "x"}, schema_path)
+    assert registry.stats.fast_schemas == 0
@@ -0,0 +1,46 @@
+import json
+
+import pytest
+
+from api_framework.clients.users_client import UsersClient
+
+pytestmark = pytest.mark.framework
+
+
+def test_debug_log_writes_trimmed_redacted_json_lines(make_api, monkeypatch, tmp_path):
+    monkeypatch.setenv("API_DEBUG_LOG", "1")
+    log_path = tmp_path / "debug.jsonl"
+    api = make_api(debug_log_path=str(log_path), response_cache_enabled=False)
+
+    UsersClient(api).list_users(limit=10, skip=0)
+    api.debug_log.flush()
+
+    (line,) = log_path.read_text(encoding="utf-8").splitlines()
+    record = json.loads(line)
+    assert record["event"] == "exchange"
+    assert record["status_code"] == 200
+    users = record["response_body"]["users"]
+    assert len(users) == 2
+    assert {u["password"] for u in users} == {"***REDACTED***"}
+
+
+def test_clients_with_different_redaction_rules_get_their_own_writer(
+    make_api, monkeypatch, tmp_path
+):
+    monkeypatch.setenv("API_DEBUG_LOG", "1")
+    log_path = tmp_path / "debug.jsonl"
+    plain = make_api(debug_log_path=str(log_path), response_cache_enabled=False)
+    strict = make_api(
+        debug_log_path=str(log_path), response_cache_enabled=False, redact_json_keys=["email"]
+    )
+    assert strict.debug_log is not plain.debug_log
+    assert make_api(debug_log_path=str(log_path)).debug_log is plain.debug_log
+
+    UsersClient(plain).get_user(1)
+    plain.debug_log.flush()
+    UsersClient(strict).get_user(1)
+    strict.debug_log.flush()
+
+    first, second = (json.loads(line) for line in log_path.read_text().splitlines())
+    assert first["response_body"]["email"] != "***REDACTED***"
+    assert second["response_body"]["email"] == "***REDACTED***"
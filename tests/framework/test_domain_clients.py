@@ -0,0 +1,31 @@
+import asyncio
+import gc
+
+import pytest
+
+from api_framework.client import AsyncApiClient
+from api_framework.clients.products_client import AsyncProductsClient
+
+pytestmark = pytest.mark.framework
+
+
+def test_async_prefetch_failing_after_early_stop_is_retrieved(inproc_settings, probe):
+    unhandled: list[dict] = []
+
+    async def main():
+        asyncio.get_running_loop().set_exception_handler(lambda _, ctx: unhandled.append(ctx))
+        settings = inproc_settings.model_copy(update={"retry_attempts": 1})
+        async with AsyncApiClient(settings) as api:
+            pages = AsyncProductsClient(api).iter_products(page_size=5, prefetch=True)
+            first = await anext(pages)
+            probe.fail_next = 1  # the prefetch of page 2, scheduled but not run yet
+            await asyncio.sleep(0.01)
+            await pages.aclose()
+        gc.collect()
+        return first
+
+    first = asyncio.run(main())
+
+    assert first["id"] == 1
+    assert probe.paths() == ["/products", "/products"]
+    assert unhandled == []
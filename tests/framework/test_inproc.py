@@ -0,0 +1,16 @@
+import httpx
+import pytest
+
+from api_framework.inproc.app import INPROC_HTTP_BASE_URL, inproc_transport
+
+pytestmark = pytest.mark.framework
+
+
+@pytest.mark.parametrize("resource", ["products", "posts", "users", "recipes"])
+def test_inproc_add_ignores_client_sent_id(resource):
+    with httpx.Client(transport=inproc_transport(), base_url=INPROC_HTTP_BASE_URL) as http:
+        total = http.get(f"/{resource}", params={"limit": 1}).json()["total"]
+        resp = http.post(f"/{resource}/add", json={"id": 1, "title": "new"})
+
+    assert resp.status_code == 201
+    assert resp.json() == {"id": total + 1, "title": "new"}
@@ -0,0 +1,23 @@
+import pytest
+
+from api_framework.clients.posts_client import PostsClient
+from api_framework.jsoncodec import codec_available, get_codec
+
+pytestmark = pytest.mark.framework
+
+
+@pytest.mark.parametrize(
+    "codec", [name for name in ("stdlib", "orjson", "msgspec") if codec_available(name)]
+)
+def test_json_codec_matches_stdlib_on_the_wire(make_api, codec):
+    payload = {"title": "héllo ✓", "userId": 1, "tags": ["a", "b"], "draft": False}
+    api = make_api(json_codec=codec)
+    resp = api.post("/posts/add", json=payload)
+    page = PostsClient(api).list_posts(limit=5)
+    reference = api.get("/posts", params={"limit": 5}).json()
+
+    assert api.codec.name == codec
+    assert resp.request.content == get_codec("stdlib").dumps(payload)
+    assert resp.request.headers["content-type"] == "application/json"
+    assert api.decode(resp) == resp.json()
+    assert page == reference
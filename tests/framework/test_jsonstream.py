@@ -0,0 +1,47 @@
+import json
+import tracemalloc
+
+import pytest
+
+from api_framework.jsonstream import JsonItemStream
+
+pytestmark = pytest.mark.framework
+
+
+def test_json_item_stream_memory_stays_flat():
+    item = json.dumps({"id": 1, "title": "x" * 200, "tags": ["a", "b"]})
+
+    def body():
+        yield b'{"products": ['
+        for n in range(20_000):
+            yield (("," if n else "") + item).encode()
+        yield b'], "total": 20000}'
+
+    parser = JsonItemStream("products")
+    tracemalloc.start()
+    try:
+        count = 0
+        for chunk in body():
+            count += len(parser.feed(chunk))
+        count += len(parser.close())
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert count == 20_000
+    assert peak < 1_000_000  # the body is ~4.6 MB
+
+
+@pytest.mark.parametrize("key", ["products", None])
+def test_json_item_stream_fed_one_byte_at_a_time_matches_json_loads(key):
+    items = [1.5, -2, 3e10, -4.25e-3, 0, "café ☃", True, None, {"a": [1, 2.0]}, []]
+    doc = {"skip": -0.5, key: items, "total": 1e2} if key else items
+    body = json.dumps(doc, ensure_ascii=False).encode()
+
+    parser = JsonItemStream(key)
+    decoded = []
+    for i in range(len(body)):
+        decoded += parser.feed(body[i : i + 1])
+    decoded += parser.close()
+
+    assert decoded == (json.loads(body)[key] if key else json.loads(body))
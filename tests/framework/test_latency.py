@@ -0,0 +1,26 @@
+import pytest
+
+from api_framework.clients.users_client import UsersClient
+
+pytestmark = pytest.mark.framework
+
+
+def test_responses_carry_phase_timings(api):
+    r = UsersClient(api).get_user_raw(1)
+
+    timings = r.extensions["timings"]
+    assert timings["total"] >= sum(v for k, v in timings.items() if k != "total")
+    assert "GET /users/{id}" in api.phase_timings.snapshot()
+
+
+def test_endpoint_latency_histogram_records_calls(make_api):
+    # Own client without the response cache: cache hits are not latency samples.
+    api = make_api(response_cache_enabled=False)
+    before = api.latency.snapshot().get("GET /users/{id}", {}).get("count", 0)
+    client = UsersClient(api)
+    for user_id in (1, 2, 3):
+        client.get_user(user_id)
+
+    hist = api.latency.snapshot()["GET /users/{id}"]
+    assert hist["count"] == before + 3
+    assert hist["max_ms"] >= hist["min_ms"] > 0
@@ -0,0 +1,83 @@
+import pytest
+
+from api_framework.client import ApiClient
+from api_framework.clients.products_client import ProductsClient
+from api_framework.latency import LatencyRecorder
+from api_framework.latency_budget import LatencyBudget
+
+pytestmark = pytest.mark.framework
+
+
+def test_latency_budget_reports_broken_percentiles():
+    recorder = LatencyRecorder()
+    for ms in (20, 25, 30, 400):
+        recorder.record("GET /products/{id}", ms)
+
+    budget = LatencyBudget(limits={"p50_ms": 100, "p95_ms": 200}, route="GET /products/{id}")
+    (problem,) = budget.check(recorder)
+
+    assert problem.startswith("GET /products/{id}: p95 400.0 ms > budget 200 ms")
+    assert LatencyBudget(limits={"max_ms": 1}, route="GET /users/{id}").check(recorder) is None
+
+
+# The marker itself, on requests to the in-process stand-in (no network noise)
+@pytest.mark.latency_budget(p95_ms=2000, route="GET /products/{id}")
+def test_latency_budget_marker_checks_the_tests_requests(inproc_settings):
+    api = ApiClient(inproc_settings)
+    try:
+        for product_id in (1, 2, 3):
+            assert ProductsClient(api).get_product(product_id)["id"] == product_id
+    finally:
+        api.close()
+
+
+# A test breaking its budget, run as a suite of its own (pytester)
+BROKEN_BUDGET_SUITE = """
+import pytest
+
+from api_framework.client import ApiClient
+from api_framework.config import settings_for
+
+
+@pytest.mark.latency_budget(max_ms=0.001, route="GET /products/{{id}}"{mode})
+def test_product():
+    api = ApiClient(settings_for("inproc"))
+    try:
+        assert api.get("/products/1").status_code == 200
+    finally:
+        api.close()
+"""
+
+
+@pytest.fixture
+def broken_budget_suite(pytester):
+    pytester.makeconftest('pytest_plugins = ("api_framework.latency_budget",)')
+
+    def run(*args: str, mode: str = ""):
+        pytester.makepyfile(BROKEN_BUDGET_SUITE.format(mode=mode and f", mode={mode!r}"))
+        return pytester.runpytest("-p", "no:cacheprovider", *args)
+
+    return run
+
+
+def test_broken_budget_fails_the_test(broken_budget_suite):
+    result = broken_budget_suite()
+
+    result.assert_outcomes(failed=1)
+    result.stdout.fnmatch_lines(["*LatencyBudgetExceeded: Latency budget exceeded:*"])
+
+
+@pytest.mark.parametrize(
+    ("args", "mode"), [((), "warn"), (("--latency-budget=warn",), "")], ids=["marker", "option"]
+)
+def test_broken_budget_warns_in_warn_mode(broken_budget_suite, args, mode):
+    result = broken_budget_suite(*args, mode=mode)
+
+    result.assert_outcomes(passed=1, warnings=1)
+    result.stdout.fnmatch_lines(["*LatencyBudgetWarning: GET /products/{id}: max *"])
+
+
+def test_broken_budget_is_ignored_when_off(broken_budget_suite):
+    result = broken_budget_suite("--latency-budget=off")
+
+    result.assert_outcomes(passed=1, warnings=0)
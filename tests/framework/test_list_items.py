@@ -0,0 +1,84 @@
+import json
+
+import pytest
+
+from api_framework.validation import items as list_items
+from api_framework.validation.items import ListValidationError, validate_list_items
+from api_framework.validation.schema import SchemaRegistry
+
+pytestmark = pytest.mark.framework
+
+USERS_LIST_SCHEMA = "tests/users/schemas/users_list.schema.json"
+
+SCHEMA = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "required": ["products", "total"],
+    "properties": {
+        "products": {"type": "array", "items": {"$ref": "#/$defs/product"}},
+        "total": {"type": "integer"},
+    },
+    "$defs": {
+        "product": {
+            "type": "object",
+            "required": ["id", "price"],
+            "properties": {"id": {"type": "integer"}, "price": {"$ref": "#/$defs/money"}},
+        },
+        "money": {"type": "number", "minimum": 0},
+    },
+}
+
+
+@pytest.fixture
+def schema_path(tmp_path):
+    path = tmp_path / "products_list.schema.json"
+    path.write_text(json.dumps(SCHEMA))
+    return path
+
+
+@pytest.mark.parametrize("backend", ["jsonschema", "codegen"])
+@pytest.mark.parametrize("workers", [0, 2])
+def test_item_refs_resolve_against_the_root_schema(schema_path, backend, workers):
+    products = [{"id": i, "price": 1.5} for i in range(60)]
+    products[7]["price"] = -1
+    del products[42]["id"]
+    payload = {"products": products, "total": 60}
+
+    with pytest.raises(ListValidationError) as exc_info:
+        validate_list_items(
+            payload,
+            schema_path,
+            workers=workers,
+            chunk_size=10,
+            registry=SchemaRegistry(backend=backend),
+        )
+
+    errors = sorted((e.pointer, e.keyword) for e in exc_info.value.errors)
+    assert errors == [("/products/42", "required"), ("/products/7/price", "minimum")]
+
+
+def test_process_pool_is_reused_across_calls(schema_path):
+    payload = {"products": [{"id": i, "price": i} for i in range(40)], "total": 40}
+
+    validate_list_items(payload, schema_path, workers=2, chunk_size=10)
+    pool = list_items._pool
+    validate_list_items(payload, schema_path, workers=2, chunk_size=10)
+
+    assert pool is not None and list_items._pool is pool
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_item_validation_reports_every_error_with_pointer(inproc_list, workers):
+    data = inproc_list("users")
+    users = [dict(u) for u in data["users"]]
+    last = len(users) - 1  # in the last chunk, away from the first error
+    users[3]["id"] = "three"
+    del users[last]["username"]
+    broken = {**data, "users": users, "total": str(len(users))}
+
+    with pytest.raises(ListValidationError) as exc_info:
+        validate_list_items(broken, USERS_LIST_SCHEMA, workers=workers, chunk_size=50)
+
+    pointers = sorted(e.pointer for e in exc_info.value.errors)
+    assert pointers == sorted(["/total", f"/users/{last}", "/users/3/id"])
+    assert exc_info.value.report.checked == len(users)
@@ -0,0 +1,31 @@
+import asyncio
+
+import pytest
+
+from api_framework.load.runner import LoadRunner
+from api_framework.load.scenario import parse_scenario
+
+pytestmark = pytest.mark.framework
+
+
+def test_load_runner_drives_weighted_calls(settings):
+    scenario = parse_scenario(
+        {
+            "target_rps": 100,
+            "duration_seconds": 0.3,
+            "seed": 7,
+            "calls": [
+                {"call": "ProductsClient.search_products", "weight": 2, "args": {"q": "phone"}},
+                {"call": "ProductsClient.get_product", "args": {"product_id": {"range": [1, 5]}}},
+            ],
+        }
+    )
+    report = asyncio.run(LoadRunner(scenario, settings).run()).as_dict()
+
+    assert report["scheduled"] == 30
+    assert report["completed"] + report["dropped"] == 30
+    assert report["errors"] == {}
+    assert set(report["calls"]) == {
+        "ProductsClient.search_products",
+        "ProductsClient.get_product",
+    }
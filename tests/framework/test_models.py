@@ -0,0 +1,60 @@
+import json
+import tracemalloc
+
+import pytest
+
+from api_framework.models import Address, ModelValidationError, Product, User, decode, decode_page
+
+pytestmark = pytest.mark.framework
+
+
+def test_keys_without_a_field_are_kept_and_round_trip(inproc_list):
+    data = inproc_list("users")
+    raw = {
+        **data["users"][0],
+        "hair": {"color": "Brown"},
+        "address": {**data["users"][0]["address"], "coordinates": {"lat": 1.5, "lng": 2.5}},
+    }
+
+    user = decode(User, raw, validate=True)
+
+    assert user.extra == {"password": raw["password"], "hair": {"color": "Brown"}}
+    assert user.address.extra == {"coordinates": {"lat": 1.5, "lng": 2.5}}
+    assert user.as_dict() == raw
+    assert Address(city="Phoenix").extra is None
+    assert [u.as_dict() for u in decode_page(User, data, key="users").items] == data["users"]
+
+
+def test_typed_decoding_reports_every_error_with_pointer(inproc_list):
+    data = inproc_list("users")
+    users = [dict(u) for u in data["users"]]
+    last = len(users) - 1
+    users[3]["id"] = "three"
+    del users[last]["username"]
+    broken = {**data, "users": users, "total": str(len(users))}
+
+    with pytest.raises(ModelValidationError) as exc_info:
+        decode_page(User, broken, key="users", validate=True)
+
+    pointers = sorted(e.pointer for e in exc_info.value.errors)
+    assert pointers == sorted(["/total", f"/users/{last}", "/users/3/id"])
+
+
+def test_typed_products_retain_less_memory_than_dicts(inproc_list):
+    data = inproc_list("products")
+    body = json.dumps(data)
+
+    def retained(build) -> int:
+        tracemalloc.start()
+        try:
+            kept = build()  # noqa: F841 - measured while alive
+            return tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+    # What a test retains, strings included: the parsed dicts vs the models built from them
+    # (tools/bench/models.py: about 15-30% less)
+    dict_bytes = retained(lambda: json.loads(body)["products"])
+    model_bytes = retained(lambda: decode_page(Product, json.loads(body), key="products").items)
+
+    assert model_bytes < 0.9 * dict_bytes
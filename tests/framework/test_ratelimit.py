@@ -0,0 +1,121 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from api_framework.client import AsyncApiClient
+from api_framework.clients.posts_client import PostsClient
+from api_framework.ratelimit import RateLimiter, throttle_seconds
+
+pytestmark = pytest.mark.framework
+
+
+def test_rate_limiter_paces_requests(make_api):
+    # 20 rps, burst 1: five calls need at least four refill intervals (4 x 50 ms).
+    api = make_api(rate_limit_rps=20.0, rate_limit_burst=1)
+    client = PostsClient(api)
+    start = time.perf_counter()
+    for post_id in range(1, 6):
+        client.get_post(post_id)
+    elapsed = time.perf_counter() - start
+
+    assert api.rate_limiter.stats.acquired == 5
+    assert api.rate_limiter.stats.delayed == 4
+    assert elapsed >= 0.18
+
+
+def test_route_budgets_apply_instead_of_the_global_one(make_api):
+    # No global budget: only /posts is paced; its 20 rps is not capped by the global rate
+    api = make_api(rate_limit_rps=0.0, rate_limit_route_rps={"/posts": 20.0})
+    limiter = api.rate_limiter
+
+    assert limiter is not None and limiter.global_bucket is None
+    assert [limiter.acquire("/users/1") for _ in range(5)] == [0.0] * 5
+    waits = [limiter.acquire("/posts/1") for _ in range(21)]
+    assert waits[:20] == [0.0] * 20 and 0 < waits[20] <= 0.05
+    assert limiter.stats.acquired == 21
+
+
+def test_rate_limiter_stats_are_exact_across_threads():
+    limiter = RateLimiter(rps=1_000_000.0, burst=1_000_000)
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(lambda _: [limiter.acquire("/users") for _ in range(500)], range(8)))
+
+    assert limiter.stats.acquired == 4000
+
+
+def _response(status: int, headers: dict[str, str]) -> httpx.Response:
+    request = httpx.Request("POST", "https://dummyjson.com/auth/login")
+    return httpx.Response(status, headers=headers, request=request)
+
+
+def test_retry_after_pauses_the_route_bucket():
+    limiter = RateLimiter(rps=100.0, route_rps={"/auth": 100.0})
+
+    limiter.observe("/auth/login", _response(429, {"Retry-After": "2"}))
+
+    assert 1.9 < limiter.acquire("/auth/login") <= 2.0
+    assert limiter.acquire("/users/1") == 0.0  # other routes keep going
+    assert limiter.stats.throttled == 1
+
+
+def test_retry_after_http_date_and_ratelimit_reset_headers():
+    in_30s = format_datetime(datetime.now(UTC) + timedelta(seconds=30), usegmt=True)
+    assert 28 < throttle_seconds(_response(503, {"Retry-After": in_30s})) <= 30
+    assert throttle_seconds(_response(200, {"Retry-After": "5"})) is None
+
+    reset_epoch = str(int(time.time()) + 20)
+    depleted = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset_epoch}
+    assert 18 < throttle_seconds(_response(200, depleted)) <= 20
+    left = {"X-RateLimit-Remaining": "3", "X-RateLimit-Reset": "1.5"}
+    assert throttle_seconds(_response(200, left)) is None
+
+
+def test_ratelimit_remaining_zero_paces_until_reset():
+    limiter = RateLimiter(rps=100.0)
+    depleted = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1.5"}
+
+    limiter.observe("/users", _response(200, depleted))
+
+    assert 1.4 < limiter.acquire("/users/1") <= 1.5
+    assert 1.4 < limiter.acquire("/users/2") <= 1.5  # no refill while paused
+
+
+def test_limiters_on_one_shared_file_share_one_budget(tmp_path):
+    shared = str(tmp_path / "ratelimit.json")
+    first = RateLimiter(rps=10.0, burst=2, shared_path=shared)
+    second = RateLimiter(rps=10.0, burst=2, shared_path=shared)
+
+    assert first.acquire("/users") == 0.0
+    assert second.acquire("/users") == 0.0
+    # The burst of 2 is spent between them: the next token is 100 ms away for both
+    assert 0.05 < first.acquire("/users") <= 0.1
+    assert 0.15 < second.acquire("/users") <= 0.2
+
+
+def test_async_client_acquires_shared_tokens_off_the_event_loop(inproc_settings, tmp_path):
+    settings = inproc_settings.model_copy(
+        update={"rate_limit_rps": 50.0, "rate_limit_shared_path": str(tmp_path / "rl.json")}
+    )
+    acquired_on: list[threading.Thread] = []
+
+    async def main():
+        async with AsyncApiClient(settings) as api:
+            acquire = api.rate_limiter.acquire
+
+            def spy(path):
+                acquired_on.append(threading.current_thread())
+                return acquire(path)
+
+            api.rate_limiter.acquire = spy
+            await asyncio.gather(*(api.get(f"/users/{i}") for i in range(1, 4)))
+
+    asyncio.run(main())
+
+    assert len(acquired_on) == 3
+    assert threading.main_thread() not in acquired_on
@@ -0,0 +1,41 @@
+import pytest
+
+from api_framework.clients.users_client import UsersClient
+from api_framework.redaction import REDACTED, TRUNCATED, Redactor, redact_json
+
+pytestmark = pytest.mark.framework
+
+
+def test_redactor_copies_only_paths_to_sensitive_keys(api):
+    data = UsersClient(api).list_users(limit=0, skip=0)
+
+    redacted = redact_json(data)
+    assert {u["password"] for u in redacted["users"]} == {REDACTED}
+    assert data["users"][0]["password"] != REDACTED  # input untouched
+    assert redacted["users"][0]["address"] is data["users"][0]["address"]  # shared, not copied
+    clean = {"users": [u["address"] for u in data["users"]]}
+    assert redact_json(clean) is clean  # nothing sensitive: nothing copied
+
+
+def test_redactor_rules_are_case_insensitive_globs_and_regexes():
+    rules = Redactor(["*secret*", "re:api[-_]?key", "Password"])
+    assert rules.redact({"ClientSecret": 1, "API-Key": 2, "PASSWORD": 3, "id": 4}) == {
+        "ClientSecret": REDACTED,
+        "API-Key": REDACTED,
+        "PASSWORD": REDACTED,
+        "id": 4,
+    }
+
+
+def test_redactor_limits_depth_and_nodes():
+    deep = node = {}
+    for _ in range(50_000):
+        node["next"] = node = {}
+    node["token"] = "t"
+    assert Redactor(max_depth=100_000).redact(deep) is not deep  # no RecursionError
+    assert Redactor(max_depth=2).redact(deep) == {"next": {"next": TRUNCATED}}
+    assert Redactor(max_nodes=4).redact({"a": 1, "b": {"c": 2, "d": 3}, "e": 4}) == {
+        "a": 1,
+        "b": TRUNCATED,
+        "e": 4,
+    }
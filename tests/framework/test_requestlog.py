@@ -0,0 +1,30 @@
+import pytest
+
+from api_framework.clients.posts_client import PostsClient
+from api_framework.requestlog import iter_request_log
+
+pytestmark = pytest.mark.framework
+
+
+def test_request_log_writes_rotating_jsonl(request, make_api, tmp_path):
+    log_path = tmp_path / "requests.jsonl"
+    api = make_api(
+        request_log_path=str(log_path),
+        request_log_max_bytes=1024,
+        request_log_backups=10,
+        response_cache_enabled=False,
+    )
+    client = PostsClient(api)
+    for post_id in range(1, 11):
+        client.get_post(post_id)
+    client.add_post({"title": "hello", "userId": 1})
+    api.request_log.flush()
+
+    records = list(iter_request_log(log_path))
+    assert len(records) == 11
+    written = api.request_log.path  # requests-gwN.jsonl under xdist
+    assert written.with_name(f"{written.name}.1").exists()
+    assert {r["test"] for r in records} == {request.node.nodeid}
+    assert [r["route"] for r in records[:2]] == ["/posts/{id}", "/posts/{id}"]
+    assert records[-1]["method"] == "POST" and records[-1]["request_bytes"] > 0
+    assert all(r["status"] in (200, 201) and r["attempt"] == 1 for r in records)
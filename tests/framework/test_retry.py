@@ -0,0 +1,23 @@
+import httpx
+import pytest
+
+from api_framework.clients.users_client import UsersClient
+
+pytestmark = pytest.mark.framework
+
+
+@pytest.mark.negative
+def test_retry_budget_stops_retries_on_dead_backend(make_api):
+    api = make_api(
+        base_url="http://127.0.0.1:9",
+        retry_attempts=3,
+        retry_backoff="full_jitter",
+        retry_budget_ratio=0.0,
+        retry_budget_min_retries=0,
+    )
+    with pytest.raises(httpx.ConnectError):
+        UsersClient(api).get_user_raw(1)
+
+    retries = api.stats()["retries"]
+    assert retries["attempts"] == 1
+    assert retries["gave_up_budget"] == 1
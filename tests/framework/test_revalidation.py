@@ -0,0 +1,18 @@
+import pytest
+
+from api_framework.clients.users_client import UsersClient
+
+pytestmark = pytest.mark.framework
+
+
+def test_get_user_revalidated_with_etag(make_api):
+    api = make_api(conditional_requests_enabled=True, response_cache_enabled=False)
+    client = UsersClient(api)
+    first = client.get_user(1)
+    if not api.revalidation.stats.stored:
+        pytest.skip("server sent no ETag / Last-Modified")
+    second = client.get_user(1)
+
+    # The 304 is served as a regular 200 over the stored body.
+    assert second == first
+    assert api.revalidation.stats.not_modified == 1
@@ -0,0 +1,28 @@
+import json
+import os
+
+import pytest
+from jsonschema import ValidationError
+
+from api_framework.validation.schema import SchemaRegistry
+
+pytestmark = pytest.mark.framework
+
+
+def test_schema_registry_compiles_once_per_mtime(tmp_path):
+    schema_path = tmp_path / "user.schema.json"
+    schema_path.write_text(json.dumps({"type": "object", "required": ["id"]}), encoding="utf-8")
+    registry = SchemaRegistry()
+
+    registry.validate({"id": 1}, schema_path)
+    registry.validate({"id": 2}, schema_path)
+    assert (registry.stats.compiled, registry.stats.cache_hits) == (1, 1)
+
+    schema_path.write_text(json.dumps({"type": "object", "required": ["email"]}), encoding="utf-8")
+    st = schema_path.stat()
+    os.utime(schema_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    with pytest.raises(ValidationError):
+        registry.validate({"id": 3}, schema_path)
+
+    assert registry.stats.compiled == 2
+    assert registry.stats.validations == 3
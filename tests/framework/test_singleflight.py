@@ -0,0 +1,81 @@
+import gzip
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from api_framework.client import ApiClient
+
+pytestmark = pytest.mark.framework
+
+WAITERS = 4
+
+
+class SlowTransport(httpx.MockTransport):
+    """Holds every response long enough for the other threads to join the leader."""
+
+    def __init__(self, respond):
+        self.calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.calls += 1
+            time.sleep(0.2)
+            return respond(request)
+
+        super().__init__(handler)
+
+
+def _coalesced_gets(inproc_settings, monkeypatch, transport) -> list:
+    monkeypatch.setattr("api_framework.client.inproc_transport", lambda: transport)
+    settings = inproc_settings.model_copy(
+        update={"single_flight_enabled": True, "retry_attempts": 1}
+    )
+    api = ApiClient(settings)
+    barrier = threading.Barrier(WAITERS)
+
+    def get(_):
+        barrier.wait()
+        try:
+            return api.get("/products/1")
+        except httpx.HTTPError as exc:
+            return exc
+
+    try:
+        with ThreadPoolExecutor(WAITERS) as pool:
+            return list(pool.map(get, range(WAITERS)))
+    finally:
+        api.close()
+
+
+def test_coalesced_waiters_get_a_decoded_copy_of_a_gzip_response(inproc_settings, monkeypatch):
+    body = b'{"id": 1, "title": "Essence Mascara Lash Princess"}'
+    transport = SlowTransport(
+        lambda _: httpx.Response(
+            200,
+            headers={"content-type": "application/json", "content-encoding": "gzip"},
+            content=gzip.compress(body),
+        )
+    )
+
+    responses = _coalesced_gets(inproc_settings, monkeypatch, transport)
+
+    assert transport.calls == 1
+    assert [r.json() for r in responses] == [
+        {"id": 1, "title": "Essence Mascara Lash Princess"}
+    ] * 4
+    for resp in responses:
+        assert resp.headers["content-type"] == "application/json"
+
+
+def test_coalesced_waiters_share_the_leaders_failure(inproc_settings, monkeypatch):
+    def refuse(request):
+        raise httpx.ConnectError("connection refused", request=request)
+
+    transport = SlowTransport(refuse)
+
+    outcomes = _coalesced_gets(inproc_settings, monkeypatch, transport)
+
+    assert transport.calls == 1
+    assert all(isinstance(outcome, httpx.ConnectError) for outcome in outcomes)
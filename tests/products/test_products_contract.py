@@ -1,7 +1,10 @@
 import pytest
+from jsonschema import ValidationError
 
 from api_framework.clients.products_client import ProductsClient
-from api_framework.validation.schema import validate_json_schema
+from api_framework.validation.schema import SchemaRegistry, validate_json_schema
+
+PRODUCTS_LIST_SCHEMA = "tests/products/schemas/products_list.schema.json"
 
 
 @pytest.mark.contract
@@ -9,5 +12,18 @@ def test_products_list_matches_schema(api):
     data = ProductsClient(api).list_products(limit=10, skip=0)
     validate_json_schema(
         data,
-        schema_path="tests/products/schemas/products_list.schema.json",
+        schema_path=PRODUCTS_LIST_SCHEMA,
     )
+
+
+@pytest.mark.contract
+def test_codegen_backend_agrees_with_jsonschema(api):
+    data = ProductsClient(api).list_products(limit=0, skip=0)
+    registry = SchemaRegistry(backend="codegen")
+
+    registry.validate(data, PRODUCTS_LIST_SCHEMA)
+    assert registry.stats.fast_validations == 1
+
+    broken = {**data, "products": [*data["products"], {**data["products"][0], "price": -1}]}
+    with pytest.raises(ValidationError, match="-1 is less than the minimum"):
+        registry.validate(broken, PRODUCTS_LIST_SCHEMA)
@@ -1,6 +1,10 @@
+import asyncio
+
 import pytest
 
-from api_framework.clients.products_client import ProductsClient
+from api_framework.client import AsyncApiClient
+from api_framework.clients.products_client import AsyncProductsClient, ProductsClient
+from api_framework.models import Product
 
 
 # -----------------------
@@ -44,6 +48,51 @@ def test_list_products_pagination(api):
     assert page1["products"][0]["id"] != page2["products"][0]["id"]
 
 
+@pytest.mark.regression
+def test_iter_products_walks_full_catalog(api):
+    client = ProductsClient(api)
+    total = client.list_products(limit=1, skip=0)["total"]
+
+    ids = [p["id"] for p in client.iter_products(page_size=50, prefetch=True)]
+
+    assert len(ids) == total
+    assert len(set(ids)) == total
+
+
+@pytest.mark.regression
+def test_stream_products_matches_buffered_list(api, settings):
+    client = ProductsClient(api)
+    expected = client.list_products(limit=0, skip=0)["products"]
+
+    assert list(client.stream_products(chunk_size=1024)) == expected
+
+    async def stream_async() -> list[dict]:
+        async with AsyncApiClient(settings) as async_api:
+            return [p async for p in AsyncProductsClient(async_api).stream_products()]
+
+    assert asyncio.run(stream_async()) == expected
+
+
+@pytest.mark.regression
+def test_typed_products_match_dicts(api, settings):
+    client = ProductsClient(api)
+    data = client.list_products(limit=0, skip=0)
+    page = client.list_products_typed(limit=0)
+
+    assert (page.total, page.skip, page.limit) == (data["total"], data["skip"], data["limit"])
+    assert isinstance(page.items[0], Product)
+    assert page.items[0].discount_percentage == data["products"][0]["discountPercentage"]
+    for model, raw in zip(page.items, data["products"], strict=True):
+        decoded = model.as_dict()
+        assert decoded == {k: raw[k] for k in decoded}
+
+    async def first_async() -> Product:
+        async with AsyncApiClient(settings) as async_api:
+            return await AsyncProductsClient(async_api).get_product_typed(1, validate=True)
+
+    assert asyncio.run(first_async()) == page.items[0]
+
+
 # -----------------------
 # NEGATIVE (regression)
 # -----------------------
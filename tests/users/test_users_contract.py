@@ -1,13 +1,33 @@
 import pytest
 
 from api_framework.clients.users_client import UsersClient
+from api_framework.validation.items import validate_list_items
 from api_framework.validation.schema import validate_json_schema
 
+USERS_LIST_SCHEMA = "tests/users/schemas/users_list.schema.json"
+
 
 @pytest.mark.contract
 def test_users_list_matches_schema(api):
     data = UsersClient(api).list_users(limit=10, skip=0)
     validate_json_schema(
         data,
-        schema_path="tests/users/schemas/users_list.schema.json",
+        schema_path=USERS_LIST_SCHEMA,
     )
+
+
+@pytest.mark.contract
+def test_full_user_catalog_matches_schema_sampled(api):
+    data = UsersClient(api).list_users(limit=0, skip=0)
+
+    report = validate_list_items(data, USERS_LIST_SCHEMA, sample=25, seed=7)
+
+    assert report.key == "users"
+    assert report.checked == min(27, report.total)
+
+
+@pytest.mark.contract
+def test_typed_users_list_decodes_with_validation(api):
+    page = UsersClient(api).list_users_typed(limit=0, validate=True)
+
+    assert page.total == len(page.items) and page.items[0].username
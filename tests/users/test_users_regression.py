@@ -1,6 +1,9 @@
+import asyncio
+
 import pytest
 
-from api_framework.clients.users_client import UsersClient
+from api_framework.client import AsyncApiClient
+from api_framework.clients.users_client import AsyncUsersClient, UsersClient
 
 # -----------------------
 # POSITIVE (regression)
@@ -46,6 +49,17 @@ def test_user_child_resources(api):
     assert isinstance(todos.get("todos"), list)
 
 
+@pytest.mark.regression
+def test_async_users_client_gathers_lookups(settings):
+    async def fetch_users():
+        async with AsyncApiClient(settings) as api:
+            client = AsyncUsersClient(api)
+            return await asyncio.gather(*(client.get_user(i) for i in (1, 2, 3)))
+
+    users = asyncio.run(fetch_users())
+    assert [u["id"] for u in users] == [1, 2, 3]
+
+
 # -----------------------
 # NEGATIVE (regression)
 # -----------------------
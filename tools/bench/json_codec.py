@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from api_framework.client import ApiClient
+from api_framework.config import settings_for
+from api_framework.jsoncodec import JSON_CODECS, codec_available, get_codec
+
+# CPU per request for each installed JSON codec on the repo's list payloads:
+#   python tools/bench/json_codec.py                 # in-process data, x1 items
+#   python tools/bench/json_codec.py --scale 20      # bigger pages
+#
+# decode = response body -> Python (what _strict / decode() do per response),
+# encode = Python -> request body (what `json=` costs); "saved" is per request vs stdlib.
+
+
+def _cpu_us(fn: Callable[[Any], Any], arg: Any, number: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.process_time()
+        for _ in range(number):
+            fn(arg)
+        best = min(best, time.process_time() - start)
+    return best / number * 1_000_000
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(prog="python tools/bench/json_codec.py")
+    ap.add_argument("--env", default="inproc", help="env/.env.<name> to fetch payloads from")
+    ap.add_argument("--scale", type=int, default=1, help="Repeat each item list N times")
+    ap.add_argument("--number", type=int, default=20, help="Calls per timing run")
+    ap.add_argument("--repeat", type=int, default=5, help="Best of N runs")
+    args = ap.parse_args()
+
+    schemas = sorted(Path("tests").glob("*/schemas/*_list.schema.json"))
+    if not schemas:
+        print("ERROR: run from the repo root (no tests/*/schemas/*_list.schema.json)")
+        return 2
+
+    stdlib = get_codec("stdlib")
+    codecs = [get_codec(n) for n in JSON_CODECS if n != "auto" and codec_available(n)]
+    missing = [n for n in JSON_CODECS if n != "auto" and not codec_available(n)]
+    if missing:
+        print(f"not installed: {', '.join(missing)}")
+
+    print(
+        f"{'payload':<12} {'KB':>7} {'codec':<8} {'decode us':>10} {'encode us':>10} "
+        f"{'saved us/req':>13} {'saved':>6}"
+    )
+    api = ApiClient(settings_for(args.env))
+    try:
+        for path in schemas:
+            resource = path.name.removesuffix("_list.schema.json")
+            payload = stdlib.loads(api.get(f"/{resource}", params={"limit": 0}).content)
+            payload[resource] = payload[resource] * args.scale
+            body = stdlib.dumps(payload)
+
+            baseline = None
+            for codec in codecs:
+                decode_us = _cpu_us(codec.loads, body, args.number, args.repeat)
+                encode_us = _cpu_us(codec.dumps, payload, args.number, args.repeat)
+                total = decode_us + encode_us
+                baseline = baseline if baseline is not None else total
+                print(
+                    f"/{resource:<11} {len(body) / 1024:>7.0f} {codec.name:<8} "
+                    f"{decode_us:>10.0f} {encode_us:>10.0f} {baseline - total:>13.0f} "
+                    f"{(baseline - total) / baseline:>6.0%}"
+                )
+    finally:
+        api.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from jsonschema import Draft202012Validator
+
+from api_framework.client import ApiClient
+from api_framework.config import settings_for
+from api_framework.jsoncodec import get_codec
+from api_framework.models import Cart, Comment, Post, Product, Recipe, User, decode_page
+
+# Typed models vs plain dicts on the repo's list payloads:
+#   python tools/bench/models.py                 # in-process data, x1 items
+#   python tools/bench/models.py --scale 20
+#
+# decode / validate = decode_page() without / with validate=True, jsonschema = the full
+# schema pass for comparison; memory is what the decoded catalog retains (dicts from the
+# JSON parser vs models built from it, parser output dropped). Keys without a model field
+# are kept in the models' `extra` dicts, so both sides hold the same data.
+
+MODELS: dict[str, type] = {
+    "carts": Cart,
+    "comments": Comment,
+    "posts": Post,
+    "products": Product,
+    "recipes": Recipe,
+    "users": User,
+}
+
+
+def _best_ms(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def _retained_kb(build: Callable[[], Any]) -> float:
+    tracemalloc.start()
+    try:
+        kept = build()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del kept
+    return size / 1024
+
+
+def _decoded_items(model: type, body: bytes, key: str) -> list[Any]:
+    # The parser's dicts are garbage once the models are built; only the models stay.
+    return decode_page(model, get_codec("stdlib").loads(body), key=key).items
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(prog="python tools/bench/models.py")
+    ap.add_argument("--env", default="inproc", help="env/.env.<name> to fetch payloads from")
+    ap.add_argument("--scale", type=int, default=1, help="Repeat each item list N times")
+    ap.add_argument("--repeat", type=int, default=5, help="Best of N runs")
+    args = ap.parse_args()
+
+    schemas = sorted(Path("tests").glob("*/schemas/*_list.schema.json"))
+    if not schemas:
+        print("ERROR: run from the repo root (no tests/*/schemas/*_list.schema.json)")
+        return 2
+
+    codec = get_codec("stdlib")
+    print(
+        f"{'payload':<11} {'items':>6} {'decode ms':>10} {'validate ms':>12} "
+        f"{'jsonschema ms':>14} {'dicts KB':>9} {'models KB':>10}"
+    )
+    api = ApiClient(settings_for(args.env))
+    try:
+        for path in schemas:
+            resource = path.name.removesuffix("_list.schema.json")
+            model = MODELS[resource]
+            payload = codec.loads(api.get(f"/{resource}", params={"limit": 0}).content)
+            payload[resource] = payload[resource] * args.scale
+            body = codec.dumps(payload)
+            decode_page(model, payload, key=resource, validate=True)  # warm up + sanity check
+
+            schema = Draft202012Validator(codec.loads(path.read_bytes()))
+            decode = partial(decode_page, model, payload, key=resource)
+            decode_ms = _best_ms(decode, args.repeat)
+            validate_ms = _best_ms(partial(decode, validate=True), args.repeat)
+            schema_ms = _best_ms(partial(schema.validate, payload), args.repeat)
+            dicts_kb = _retained_kb(partial(codec.loads, body))
+            models_kb = _retained_kb(partial(_decoded_items, model, body, resource))
+            print(
+                f"/{resource:<10} {len(payload[resource]):>6} {decode_ms:>10.2f} "
+                f"{validate_ms:>12.2f} {schema_ms:>14.2f} {dicts_kb:>9.0f} {models_kb:>10.0f}"
+            )
+    finally:
+        api.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
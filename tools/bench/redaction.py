@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from api_framework.client import ApiClient
+from api_framework.config import settings_for
+from api_framework.redaction import REDACTED, SENSITIVE_JSON_KEYS, Redactor
+
+# Copy-on-write Redactor vs the previous recursive rebuild on the repo's list payloads:
+#   python tools/bench/redaction.py                 # in-process data, x1 items
+#   python tools/bench/redaction.py --scale 20
+#
+# /users items carry a "password" (a copy along every user path); the other resources
+# have nothing to redact, so the new walk returns them without copying anything.
+
+
+def _recursive(obj: Any) -> Any:
+    """The pre-Redactor redact_json: rebuilds every dict and list."""
+    if isinstance(obj, dict):
+        return {k: REDACTED if k in SENSITIVE_JSON_KEYS else _recursive(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_recursive(x) for x in obj]
+    return obj
+
+
+def _best_ms(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(prog="python tools/bench/redaction.py")
+    ap.add_argument("--env", default="inproc", help="env/.env.<name> to fetch payloads from")
+    ap.add_argument("--scale", type=int, default=1, help="Repeat each item list N times")
+    ap.add_argument("--repeat", type=int, default=5, help="Best of N runs")
+    args = ap.parse_args()
+
+    schemas = sorted(Path("tests").glob("*/schemas/*_list.schema.json"))
+    if not schemas:
+        print("ERROR: run from the repo root (no tests/*/schemas/*_list.schema.json)")
+        return 2
+
+    redactor = Redactor()
+    print(f"{'payload':<11} {'items':>6} {'recursive ms':>13} {'redactor ms':>12} {'speedup':>8}")
+    api = ApiClient(settings_for(args.env))
+    try:
+        for path in schemas:
+            resource = path.name.removesuffix("_list.schema.json")
+            payload = api.get(f"/{resource}", params={"limit": 0}).json()
+            payload[resource] = payload[resource] * args.scale
+            if redactor.redact(payload) != _recursive(payload):
+                print(f"/{resource}: results differ, skipped")
+                continue
+
+            old_ms = _best_ms(partial(_recursive, payload), args.repeat)
+            new_ms = _best_ms(partial(redactor.redact, payload), args.repeat)
+            print(
+                f"/{resource:<10} {len(payload[resource]):>6} {old_ms:>13.2f} "
+                f"{new_ms:>12.2f} {old_ms / new_ms:>7.1f}x"
+            )
+    finally:
+        api.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
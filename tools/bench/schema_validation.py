@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from jsonschema import Draft202012Validator
+
+from api_framework.client import ApiClient
+from api_framework.config import settings_for
+from api_framework.validation.codegen import compile_fast
+
+# jsonschema vs the generated fast path on the repo's list schemas:
+#   python tools/bench/schema_validation.py                 # in-process data, x20 items
+#   python tools/bench/schema_validation.py --env local --scale 1
+#
+# Payloads are the real `/<resource>?limit=0` responses, with the item list repeated
+# `--scale` times to mimic big pages.
+
+
+def _best_ms(fn: Any, payload: Any, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(payload)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(prog="python tools/bench/schema_validation.py")
+    ap.add_argument("--env", default="inproc", help="env/.env.<name> to fetch payloads from")
+    ap.add_argument("--scale", type=int, default=20, help="Repeat each item list N times")
+    ap.add_argument("--repeat", type=int, default=5, help="Best of N runs")
+    args = ap.parse_args()
+
+    schemas = sorted(Path("tests").glob("*/schemas/*_list.schema.json"))
+    if not schemas:
+        print("ERROR: run from the repo root (no tests/*/schemas/*_list.schema.json)")
+        return 2
+
+    print(f"{'schema':<28} {'items':>7} {'jsonschema ms':>14} {'codegen ms':>11} {'speedup':>8}")
+    api = ApiClient(settings_for(args.env))
+    try:
+        for path in schemas:
+            resource = path.name.removesuffix("_list.schema.json")
+            payload = api.get(f"/{resource}", params={"limit": 0}).json()
+            payload[resource] = payload[resource] * args.scale
+            payload["limit"] = len(payload[resource])
+
+            schema = json.loads(path.read_text(encoding="utf-8"))
+            reference = Draft202012Validator(schema)
+            fast = compile_fast(schema)
+            if not fast(payload) or not reference.is_valid(payload):
+                print(f"{path.name}: payload does not match the schema, skipped")
+                continue
+
+            slow_ms = _best_ms(reference.validate, payload, args.repeat)
+            fast_ms = _best_ms(fast, payload, args.repeat)
+            print(
+                f"{path.name:<28} {len(payload[resource]):>7} {slow_ms:>14.2f} "
+                f"{fast_ms:>11.3f} {slow_ms / fast_ms:>7.0f}x"
+            )
+    finally:
+        api.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())